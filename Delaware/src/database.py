@@ -7,7 +7,6 @@ Each state's candidates are independent.
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from uuid import UUID
 import logging
 
 # Add parent directory to path to import shared modules
@@ -30,21 +29,21 @@ class DelawareSupabaseClient(BaseSupabaseClient):
         super().__init__()
         self.source_state = SOURCE_STATE
     
-    def insert_candidate(self, candidate_data: Dict[str, Any]) -> Optional[UUID]:
+    def _insert_candidate_real(self, candidate_data: Dict[str, Any]) -> Optional[str]:
         """
         Insert a new Delaware candidate.
-        
+
         Args:
             candidate_data: Candidate data dictionary
-            
+
         Returns:
-            UUID of created candidate or None
+            ID of created candidate or None
         """
         # Add source_state to candidate data
         candidate_data['candidate']['source_state'] = SOURCE_STATE
-        
+
         # Use parent class insert method
-        return super().insert_candidate(candidate_data)
+        return super()._insert_candidate_real(candidate_data)
     
     def get_delaware_candidates(self) -> List[Dict[str, Any]]:
         """
@@ -107,7 +106,7 @@ class DelawareSupabaseClient(BaseSupabaseClient):
                             'value': id_row['id_value']
                         })
                 
-                candidate = DatabaseCandidate(
+                candidate = DatabaseCandidate.from_trusted_row(
                     id=row['id'],
                     full_name=row['full_name'],
                     first_name=row.get('first_name'),
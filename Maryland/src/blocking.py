@@ -0,0 +1,67 @@
+"""MinHash-LSH blocking index for the deduplication pass."""
+
+from typing import List, Set
+
+# Optional: datasketch provides the MinHash/LSH structures; when it is
+# not installed the matcher stays on its dense vectorized path
+try:
+    from datasketch import MinHash, MinHashLSH
+    HAVE_DATASKETCH = True
+except ImportError:
+    HAVE_DATASKETCH = False
+
+# Permutations per MinHash signature; 64 keeps insert/query cheap while
+# still separating dissimilar names reliably
+_NUM_PERM = 64
+# Approximate Jaccard similarity two keys need to land in the same bucket
+_DEFAULT_THRESHOLD = 0.7
+# Character n-gram width for shingling
+_NGRAM = 3
+
+
+def _shingles(text: str, n: int = _NGRAM) -> Set[str]:
+    """Character n-grams of text (the whole string when shorter than n)."""
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _minhash(text: str) -> "MinHash":
+    """MinHash signature over the text's character n-grams."""
+    mh = MinHash(num_perm=_NUM_PERM)
+    mh.update_batch([s.encode('utf-8') for s in _shingles(text)])
+    return mh
+
+
+class LSHBlocker:
+    """
+    Jaccard-similarity buckets over character 3-grams.
+
+    Index one side of the comparison once, then query() returns the
+    indices whose shingle sets plausibly clear the threshold -- the only
+    pairs the expensive string comparator still has to score.
+    """
+
+    def __init__(self, keys: List[str], threshold: float = _DEFAULT_THRESHOLD):
+        """
+        Build the LSH index over a list of keys.
+
+        Args:
+            keys: Strings to index; query() returns positions in this list
+            threshold: Approximate Jaccard threshold for bucketing
+        """
+        self._lsh = MinHashLSH(threshold=threshold, num_perm=_NUM_PERM)
+        for i, key in enumerate(keys):
+            self._lsh.insert(i, _minhash(key))
+
+    def query(self, key: str) -> List[int]:
+        """
+        Indices of indexed keys bucketed with the query key.
+
+        Args:
+            key: String to look up
+
+        Returns:
+            List of positions into the indexed key list
+        """
+        return self._lsh.query(_minhash(key))
@@ -18,6 +18,10 @@ LOG_DIR.mkdir(exist_ok=True)
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# Optional direct-Postgres DSN for bulk COPY staging.
+# When set, staging streams rows via COPY instead of PostgREST JSON inserts.
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+
 # Debug: Print environment variable status (without values)
 print(f"Environment check: SUPABASE_URL={'set' if SUPABASE_URL else 'NOT SET'}")
 print(f"Environment check: SUPABASE_KEY={'set' if SUPABASE_KEY else 'NOT SET'}")
@@ -1,8 +1,11 @@
 """Database operations for Maryland candidate system."""
 
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from uuid import UUID, uuid4
 import math
 from datetime import date, datetime
@@ -17,7 +20,15 @@ from .models import (
     CandidateSource,
     UpdateStatistics
 )
-from .config import SUPABASE_URL, SUPABASE_KEY, DRY_RUN, SOURCE_NAME, setup_logging, LOG_DIR
+from .config import (
+    SUPABASE_URL,
+    SUPABASE_KEY,
+    SUPABASE_DB_URL,
+    DRY_RUN,
+    SOURCE_NAME,
+    setup_logging,
+    LOG_DIR
+)
 
 logger = setup_logging(__name__)
 
@@ -28,9 +39,30 @@ class SupabaseClient:
     def __init__(self):
         """Initialize Supabase client."""
         self.client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        self.ingest_run_id: Optional[UUID] = None
+        self.pg_dsn: Optional[str] = SUPABASE_DB_URL
+        self.ingest_run_id: Optional[str] = None
+        # In-process cache of district rows keyed by ocd_id, populated on
+        # first get_districts() call and kept current by create_district().
+        self._districts_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # DRY_RUN is fixed for the lifetime of the process, so bind the real
+        # or dry variant of each method once here instead of branching on
+        # every call.
+        suffix = '_dry' if DRY_RUN else '_real'
+        for method in ('create_ingest_run', 'stage_candidates',
+                       'get_existing_candidates', 'insert_candidate',
+                       'insert_candidates_bulk', 'update_candidate',
+                       'update_candidates_bulk', 'record_match',
+                       'record_matches_bulk', 'finalize_ingest_run',
+                       'get_districts', 'create_district'):
+            setattr(self, method, getattr(self, f'_{method}{suffix}'))
     
-    def create_ingest_run(self, total_raw: int) -> UUID:
+    def _create_ingest_run_dry(self, total_raw: int) -> str:
+        self.ingest_run_id = str(uuid4())
+        logger.info(f"DRY RUN: Would create ingest run with ID {self.ingest_run_id}")
+        return self.ingest_run_id
+
+    def _create_ingest_run_real(self, total_raw: int) -> str:
         """
         Create a new ingest run record.
         
@@ -38,15 +70,10 @@ class SupabaseClient:
             total_raw: Total number of raw records to process
             
         Returns:
-            UUID of the created ingest run
+            ID of the created ingest run
         """
         logger.info("Creating ingest run")
         
-        if DRY_RUN:
-            self.ingest_run_id = uuid4()
-            logger.info(f"DRY RUN: Would create ingest run with ID {self.ingest_run_id}")
-            return self.ingest_run_id
-        
         ingest_run = IngestRun(
             source=SOURCE_NAME,
             run_key=f"maryland_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -69,12 +96,16 @@ class SupabaseClient:
         
         result = self.client.table('ingest_runs').insert(ingest_data).execute()
         
-        self.ingest_run_id = UUID(result.data[0]['id'])
+        self.ingest_run_id = result.data[0]['id']
         logger.info(f"Created ingest run: {self.ingest_run_id}")
         
         return self.ingest_run_id
     
-    def stage_candidates(self, candidates: List[Dict[str, Any]]) -> int:
+    def _stage_candidates_dry(self, candidates: List[Dict[str, Any]]) -> int:
+        logger.info(f"DRY RUN: Would stage {len(candidates)} candidates")
+        return len(candidates)
+
+    def _stage_candidates_real(self, candidates: List[Dict[str, Any]]) -> int:
         """
         Stage normalized candidates for processing.
         
@@ -86,10 +117,6 @@ class SupabaseClient:
         """
         logger.info(f"Staging {len(candidates)} candidates")
         
-        if DRY_RUN:
-            logger.info(f"DRY RUN: Would stage {len(candidates)} candidates")
-            return len(candidates)
-        
         # Helper: sanitize values to JSON-serializable primitives for PostgREST
         def _sanitize_value(v):
             # None stays None
@@ -139,38 +166,32 @@ class SupabaseClient:
             except Exception:
                 return None
 
-        # Prepare data for staging table
-        staged_data = []
-        for idx, candidate_data in enumerate(candidates):
-            candidate = candidate_data['candidate']
-            
-            staged = {
-                'ingest_run_id': str(self.ingest_run_id),
-                'source': SOURCE_NAME,
-                'source_row_id': str(idx),
-                'full_name': candidate['full_name'],
-                'first_name': candidate.get('first_name'),
-                'last_name': candidate.get('last_name'),
-                'party': candidate.get('party'),
-                'office_level': candidate['office_level'],
-                'office_name': candidate['office_name'],
-                'state': candidate['state'],
-                'district_number': candidate.get('district_number'),
-                'ocd_division_id': candidate.get('ocd_division_id'),
-                'election_year': candidate['election_year'],
-                'external_id_type': 'maryland_row_id',
-                'external_id_value': str(idx),
-                'raw_ref': candidate.get('raw_ref', {}),
-                'source_state': 'MD'  # Mark as Maryland in staging
-            }
-            staged_data.append(staged)
-        
-        # Insert in batches
+        # Prefer direct-Postgres COPY when a DSN is configured: COPY bypasses
+        # PostgREST's JSON parsing and per-row parameter binding server-side,
+        # which is 5-20x faster for bulk staging. Staging rows are generated
+        # lazily either way, so the full staged set (raw_ref included) is
+        # never held in memory alongside the transformed candidates.
+        if self.pg_dsn:
+            try:
+                total_staged = self._stage_via_copy(self._iter_staged(candidates))
+                logger.info(f"Total candidates staged via COPY: {total_staged}")
+                return total_staged
+            except ImportError:
+                logger.warning("psycopg not installed - falling back to PostgREST staging")
+            except Exception as e:
+                logger.error(f"COPY staging failed ({e}) - falling back to PostgREST staging")
+
+        # Insert in batches pulled off the row generator
         batch_size = 100
         total_staged = 0
-        
-        for i in range(0, len(staged_data), batch_size):
-            batch = staged_data[i:i+batch_size]
+        batch_num = 0
+        staged_rows = self._iter_staged(candidates)
+
+        while True:
+            batch = list(islice(staged_rows, batch_size))
+            if not batch:
+                break
+            batch_num += 1
             # Sanitize batch to ensure all values are JSON-serializable
             sanitized_batch = []
             for record in batch:
@@ -183,7 +204,7 @@ class SupabaseClient:
                     # ensure_ascii False to catch unicode issues as well
                     json.dumps(srec, ensure_ascii=False)
                 except Exception as ve:
-                    logger.error(f"Record {ridx} in batch {i//batch_size + 1} is not JSON-serializable: {ve}")
+                    logger.error(f"Record {ridx} in batch {batch_num} is not JSON-serializable: {ve}")
                     try:
                         debug_file = LOG_DIR / f"staging_record_error_{uuid4().hex}.json"
                         debug_file.parent.mkdir(parents=True, exist_ok=True)
@@ -199,10 +220,10 @@ class SupabaseClient:
             try:
                 result = self.client.table('normalized_candidates_stage').insert(sanitized_batch).execute()
                 total_staged += len(result.data)
-                logger.info(f"Staged batch {i//batch_size + 1}: {len(batch)} candidates")
+                logger.info(f"Staged batch {batch_num}: {len(batch)} candidates")
             except Exception as e:
                 # Log error and write sanitized batch to a debug file for inspection
-                logger.error(f"Error staging batch {i//batch_size + 1}: {e}")
+                logger.error(f"Error staging batch {batch_num}: {e}")
                 try:
                     debug_file = LOG_DIR / f"staging_debug_{uuid4().hex}.json"
                     debug_file.parent.mkdir(parents=True, exist_ok=True)
@@ -212,11 +233,98 @@ class SupabaseClient:
                 except Exception as ex2:
                     logger.error(f"Failed to write staging debug file: {ex2}")
                 raise
-        
+
         logger.info(f"Total candidates staged: {total_staged}")
         return total_staged
-    
-    def get_existing_candidates(self, election_year: int) -> List[DatabaseCandidate]:
+
+    def _iter_staged(self, candidates: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield staging rows one at a time.
+
+        A fresh generator can be created per attempt (COPY, then the
+        PostgREST fallback) since the source list stays untouched.
+
+        Args:
+            candidates: List of normalized candidate dictionaries
+
+        Yields:
+            Staging-table rows
+        """
+        for idx, candidate_data in enumerate(candidates):
+            candidate = candidate_data['candidate']
+
+            yield {
+                'ingest_run_id': self.ingest_run_id,
+                'source': SOURCE_NAME,
+                'source_row_id': str(idx),
+                'full_name': candidate['full_name'],
+                'first_name': candidate.get('first_name'),
+                'last_name': candidate.get('last_name'),
+                'party': candidate.get('party'),
+                'office_level': candidate['office_level'],
+                'office_name': candidate['office_name'],
+                'state': candidate['state'],
+                'district_number': candidate.get('district_number'),
+                'ocd_division_id': candidate.get('ocd_division_id'),
+                'election_year': candidate['election_year'],
+                'external_id_type': 'maryland_row_id',
+                'external_id_value': str(idx),
+                'raw_ref': candidate.get('raw_ref', {}),
+                'source_state': 'MD'  # Mark as Maryland in staging
+            }
+
+    # Column order for the COPY fast path; must match the keys built in
+    # stage_candidates().
+    _STAGE_COPY_COLUMNS = (
+        'ingest_run_id', 'source', 'source_row_id', 'full_name', 'first_name',
+        'last_name', 'party', 'office_level', 'office_name', 'state',
+        'district_number', 'ocd_division_id', 'election_year',
+        'external_id_type', 'external_id_value', 'raw_ref', 'source_state'
+    )
+
+    def _stage_via_copy(self, staged_rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Stream staged rows to normalized_candidates_stage with COPY FROM STDIN.
+
+        Opens a single direct psycopg connection (self.pg_dsn) instead of
+        going through the PostgREST JSON insert path. Consumes the row
+        iterable lazily, so rows flow straight from the generator into the
+        COPY stream.
+
+        Args:
+            staged_rows: Iterable of staging records from _iter_staged()
+
+        Returns:
+            Number of candidates staged
+        """
+        import psycopg
+        from psycopg.types.json import Json
+
+        staged = 0
+        columns = ', '.join(self._STAGE_COPY_COLUMNS)
+        with psycopg.connect(self.pg_dsn) as conn:
+            with conn.cursor() as cur:
+                with cur.copy(
+                    f"COPY normalized_candidates_stage ({columns}) FROM STDIN"
+                ) as copy:
+                    for record in staged_rows:
+                        row = []
+                        for col in self._STAGE_COPY_COLUMNS:
+                            value = record.get(col)
+                            if col == 'raw_ref':
+                                value = Json(value if value is not None else {})
+                            row.append(value)
+                        copy.write_row(tuple(row))
+                        staged += 1
+            conn.commit()
+
+        return staged
+
+    def _get_existing_candidates_dry(self, election_year: int) -> List[DatabaseCandidate]:
+        logger.info("DRY RUN: Would fetch existing candidates")
+        return []
+
+    def _get_existing_candidates_real(self, election_year: int) -> List[DatabaseCandidate]:
         """
         Get existing candidates from database for matching.
         
@@ -228,10 +336,6 @@ class SupabaseClient:
         """
         logger.info(f"Fetching existing candidates for year {election_year}")
         
-        if DRY_RUN:
-            logger.info("DRY RUN: Would fetch existing candidates")
-            return []
-        
         # Get candidates. Different versions of the Supabase/PostgREST client expose
         # an `or_` helper; if it's not available, pass the `or` param to execute().
         # Build a fresh select query base (don't reuse builders since many
@@ -256,7 +360,7 @@ class SupabaseClient:
                         'value': id_row['id_value']
                     })
             
-            candidate = DatabaseCandidate(
+            candidate = DatabaseCandidate.from_trusted_row(
                 id=row['id'],
                 full_name=row['full_name'],
                 first_name=row.get('first_name'),
@@ -276,7 +380,11 @@ class SupabaseClient:
         logger.info(f"Found {len(candidates)} existing candidates")
         return candidates
     
-    def insert_candidate(self, candidate_data: Dict[str, Any]) -> Optional[UUID]:
+    def _insert_candidate_dry(self, candidate_data: Dict[str, Any]) -> Optional[str]:
+        logger.info(f"DRY RUN: Would insert candidate {candidate_data['candidate']['full_name']}")
+        return None
+
+    def _insert_candidate_real(self, candidate_data: Dict[str, Any]) -> Optional[str]:
         """
         Insert a new candidate with related data.
         
@@ -284,16 +392,28 @@ class SupabaseClient:
             candidate_data: Dictionary with candidate and related data
             
         Returns:
-            UUID of created candidate or None if dry run
+            ID of created candidate or None if dry run
         """
-        if DRY_RUN:
-            logger.info(f"DRY RUN: Would insert candidate {candidate_data['candidate']['full_name']}")
-            return None
-        
         candidate = candidate_data['candidate']
         
         # Insert main candidate record
-        candidate_record = {
+        result = self.client.table('candidates').insert(
+            self._build_candidate_record(candidate)
+        ).execute()
+        candidate_id = result.data[0]['id']
+        
+        # Insert related contact/social/filing/source rows
+        for table, rows in self._build_related_records(candidate_data, candidate_id).items():
+            for row in rows:
+                self.client.table(table).insert(row).execute()
+        
+        logger.info(f"Inserted candidate: {candidate['full_name']} ({candidate_id})")
+        return candidate_id
+    
+    @staticmethod
+    def _build_candidate_record(candidate: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a normalized candidate dict onto a candidates table row."""
+        return {
             'full_name': candidate['full_name'],
             'first_name': candidate.get('first_name'),
             'last_name': candidate.get('last_name'),
@@ -312,33 +432,45 @@ class SupabaseClient:
             'is_withdrawn': candidate.get('is_withdrawn', False),
             'source_state': candidate.get('source_state', 'MD')  # Use provided source_state or default to MD
         }
+    
+    @staticmethod
+    def _build_related_records(candidate_data: Dict[str, Any],
+                               candidate_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Build contact/social/filing/source rows for one inserted candidate.
         
-        result = self.client.table('candidates').insert(candidate_record).execute()
-        candidate_id = UUID(result.data[0]['id'])
+        Args:
+            candidate_data: Dictionary with candidate and related data
+            candidate_id: ID of the inserted candidate row
+            
+        Returns:
+            Dict mapping table name to rows to insert
+        """
+        related: Dict[str, List[Dict[str, Any]]] = {
+            'candidate_contact_info': [],
+            'candidate_social_media': [],
+            'candidate_filing_info': [],
+            'candidate_sources': []
+        }
         
-        # Insert contact info
         contact_info = candidate_data.get('contact_info', {})
         if any(contact_info.values()):
-            contact_record = {
-                'candidate_id': str(candidate_id),
+            related['candidate_contact_info'].append({
+                'candidate_id': candidate_id,
                 **{k: v for k, v in contact_info.items() if v is not None}
-            }
-            self.client.table('candidate_contact_info').insert(contact_record).execute()
+            })
         
-        # Insert social media
         for social in candidate_data.get('social_media', []):
-            social_record = {
-                'candidate_id': str(candidate_id),
+            related['candidate_social_media'].append({
+                'candidate_id': candidate_id,
                 'platform': social['platform'],
                 'handle_or_url': social['handle_or_url']
-            }
-            self.client.table('candidate_social_media').insert(social_record).execute()
+            })
         
-        # Insert filing info
         filing_info = candidate_data.get('filing_info', {})
         if any(filing_info.values()):
             filing_record = {
-                'candidate_id': str(candidate_id)
+                'candidate_id': candidate_id
             }
             for k, v in filing_info.items():
                 if v is not None:
@@ -347,21 +479,117 @@ class SupabaseClient:
                         filing_record[k] = v.isoformat()
                     else:
                         filing_record[k] = v
-            self.client.table('candidate_filing_info').insert(filing_record).execute()
+            related['candidate_filing_info'].append(filing_record)
         
-        # Track source
-        source_record = {
-            'candidate_id': str(candidate_id),
+        related['candidate_sources'].append({
+            'candidate_id': candidate_id,
             'source': SOURCE_NAME,
             'external_id_type': 'maryland_import',
             'external_id_value': f"{datetime.now().date()}"
-        }
-        self.client.table('candidate_sources').insert(source_record).execute()
+        })
         
-        logger.info(f"Inserted candidate: {candidate['full_name']} ({candidate_id})")
-        return candidate_id
+        return related
+    
+    def _insert_rows_grouped(self, table: str, rows: List[Dict[str, Any]],
+                             upsert_on: Optional[str] = None) -> None:
+        """
+        Insert/upsert rows in as few requests as key shapes allow.
+        
+        PostgREST array payloads must share identical keys, so rows are
+        grouped by key set before sending.
+        """
+        by_shape: Dict[frozenset, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            by_shape[frozenset(row)].append(row)
+        
+        for shape_rows in by_shape.values():
+            query = self.client.table(table)
+            if upsert_on:
+                query.upsert(shape_rows, on_conflict=upsert_on).execute()
+            else:
+                query.insert(shape_rows).execute()
+    
+    # Worker cap for the per-row fallback pool; each worker just waits on
+    # a PostgREST round-trip, so this bounds concurrent requests, not CPU
+    _FALLBACK_MAX_WORKERS = 16
+
+    def _insert_candidate_safe(self, candidate_data: Dict[str, Any]) -> int:
+        """Insert one candidate, returning 1 on success and 0 on error."""
+        try:
+            return 1 if self.insert_candidate(candidate_data) else 0
+        except Exception as e:
+            logger.error(
+                f"Error inserting candidate {candidate_data['candidate']['full_name']}: {e}"
+            )
+            return 0
+
+    def _update_candidate_safe(self, candidate_data: Dict[str, Any]) -> int:
+        """Update one matched candidate, returning 1 on success and 0 on error."""
+        try:
+            candidate_id = candidate_data['match_info']['candidate_id']
+            return 1 if self.update_candidate(candidate_id, candidate_data) else 0
+        except Exception as e:
+            logger.error(f"Error updating candidate: {e}")
+            return 0
+
+    def _insert_candidates_bulk_dry(self, candidates_data: List[Dict[str, Any]],
+                                    chunk_size: int = 500) -> int:
+        logger.info(f"DRY RUN: Would bulk-insert {len(candidates_data)} candidates")
+        return len(candidates_data)
+    
+    def _insert_candidates_bulk_real(self, candidates_data: List[Dict[str, Any]],
+                                     chunk_size: int = 500) -> int:
+        """
+        Insert new candidates in bulk.
+        
+        Sends one PostgREST array insert per chunk for the main candidate
+        rows, then batches the related contact/social/filing/source rows
+        keyed by the returned ids. Falls back to per-row insert_candidate()
+        for any chunk that fails so errors stay per-candidate.
+        
+        Args:
+            candidates_data: List of candidate data dictionaries
+            chunk_size: Candidates per request
+            
+        Returns:
+            Number of candidates inserted
+        """
+        inserted = 0
+        
+        for start in range(0, len(candidates_data), chunk_size):
+            chunk = candidates_data[start:start + chunk_size]
+            try:
+                records = [self._build_candidate_record(cd['candidate']) for cd in chunk]
+                result = self.client.table('candidates').insert(records).execute()
+                
+                # Batch related rows keyed by the returned ids (PostgREST
+                # returns inserted rows in order)
+                related: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+                for cd, row in zip(chunk, result.data):
+                    for table, rows in self._build_related_records(cd, row['id']).items():
+                        related[table].extend(rows)
+                
+                for table, rows in related.items():
+                    if rows:
+                        self._insert_rows_grouped(table, rows)
+                
+                inserted += len(result.data)
+                logger.info(f"Bulk-inserted {len(result.data)} candidates")
+            except Exception as e:
+                logger.error(f"Bulk insert failed ({e}); falling back to per-row inserts")
+                # The per-row requests are HTTP-bound, so run them through a
+                # bounded thread pool instead of serially
+                workers = min(self._FALLBACK_MAX_WORKERS, len(chunk))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    inserted += sum(pool.map(self._insert_candidate_safe, chunk))
+        
+        return inserted
     
-    def update_candidate(self, candidate_id: UUID, updates: Dict[str, Any]) -> bool:
+    def _update_candidate_dry(self, candidate_id: UUID, updates: Dict[str, Any]) -> bool:
+        logger.info(f"DRY RUN: Would update candidate {candidate_id}")
+        return True
+
+    def _update_candidate_real(self, candidate_id: UUID, updates: Dict[str, Any]) -> bool:
         """
         Update existing candidate.
         
@@ -372,26 +600,14 @@ class SupabaseClient:
         Returns:
             True if successful
         """
-        if DRY_RUN:
-            logger.info(f"DRY RUN: Would update candidate {candidate_id}")
-            return True
-        
         # Track if any part of the update succeeded
         any_success = False
         
         # Update main candidate record - only include fields that exist in the database
         # EXCLUDING any that might cause numeric overflow issues
-        valid_candidate_fields = {
-            'full_name', 'first_name', 'last_name', 'party', 'office_level',
-            'office_name', 'ocd_division_id', 'district_number',
-            'gender', 'jurisdiction', 'committee_name', 'website', 'contact_email',
-            'status', 'is_withdrawn'
-            # Removed: 'election_year' and 'district_id' to avoid potential numeric issues
-        }
-        
         candidate_updates = {
             k: v for k, v in updates['candidate'].items()
-            if k in valid_candidate_fields and v is not None
+            if k in self._VALID_UPDATE_FIELDS and v is not None
         }
         
         # Additional safety check - remove any numeric fields that might overflow
@@ -433,7 +649,7 @@ class SupabaseClient:
             ).execute()
             
             contact_record = {
-                'candidate_id': str(candidate_id),
+                'candidate_id': candidate_id,
                 **{k: v for k, v in contact_info.items() if v is not None}
             }
             logger.debug(f"Contact record to save: {contact_record}")
@@ -477,7 +693,111 @@ class SupabaseClient:
         
         return any_success
     
-    def record_match(self, stage_id: int, candidate_id: UUID, confidence: float, note: str) -> None:
+    # Candidate fields safe to write on update - excludes 'election_year'
+    # and 'district_id' to avoid potential numeric issues
+    _VALID_UPDATE_FIELDS = frozenset({
+        'full_name', 'first_name', 'last_name', 'party', 'office_level',
+        'office_name', 'ocd_division_id', 'district_number',
+        'gender', 'jurisdiction', 'committee_name', 'website', 'contact_email',
+        'status', 'is_withdrawn'
+    })
+    
+    def _update_candidates_bulk_dry(self, candidates_data: List[Dict[str, Any]],
+                                    chunk_size: int = 500) -> int:
+        logger.info(f"DRY RUN: Would bulk-update {len(candidates_data)} candidates")
+        return len(candidates_data)
+    
+    def _update_candidates_bulk_real(self, candidates_data: List[Dict[str, Any]],
+                                     chunk_size: int = 500) -> int:
+        """
+        Update matched candidates in bulk.
+        
+        Upserts the filtered candidate fields keyed by id, and contact info
+        keyed by candidate_id, in chunks instead of one round-trip per
+        candidate. Falls back to per-row update_candidate() for chunks that
+        fail.
+        
+        Args:
+            candidates_data: Candidate data dictionaries carrying match_info
+            chunk_size: Candidates per request
+            
+        Returns:
+            Number of candidates updated
+        """
+        updated = 0
+        
+        for start in range(0, len(candidates_data), chunk_size):
+            chunk = candidates_data[start:start + chunk_size]
+            rows = []
+            contact_rows = []
+            for cd in chunk:
+                candidate_id = str(cd['match_info']['candidate_id'])
+                row = {
+                    k: v for k, v in cd['candidate'].items()
+                    if k in self._VALID_UPDATE_FIELDS and v is not None
+                }
+                row['id'] = candidate_id
+                rows.append(row)
+                
+                contact_info = cd.get('contact_info', {})
+                if any(contact_info.values()):
+                    contact_rows.append({
+                        'candidate_id': candidate_id,
+                        **{k: v for k, v in contact_info.items() if v is not None}
+                    })
+            
+            try:
+                self._insert_rows_grouped('candidates', rows, upsert_on='id')
+                if contact_rows:
+                    self._insert_rows_grouped(
+                        'candidate_contact_info', contact_rows,
+                        upsert_on='candidate_id'
+                    )
+                updated += len(rows)
+                logger.info(f"Bulk-updated {len(rows)} candidates")
+            except Exception as e:
+                logger.error(f"Bulk update failed ({e}); falling back to per-row updates")
+                # Same bounded pool as the insert fallback: the per-row
+                # updates are independent HTTP round-trips
+                workers = min(self._FALLBACK_MAX_WORKERS, len(chunk))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    updated += sum(pool.map(self._update_candidate_safe, chunk))
+        
+        return updated
+    
+    def _record_matches_bulk_dry(
+        self, matches: List[Tuple[int, Any, float, str]]
+    ) -> None:
+        logger.info(f"DRY RUN: Would record {len(matches)} matches")
+    
+    def _record_matches_bulk_real(
+        self, matches: List[Tuple[int, Any, float, str]]
+    ) -> None:
+        """
+        Record candidate matches in a single request.
+        
+        Args:
+            matches: List of (stage_id, candidate_id, confidence, note)
+                tuples, with confidence as percentage 0-100
+        """
+        if not matches:
+            return
+        
+        records = [{
+            'stage_id': stage_id,
+            'candidate_id': str(candidate_id),
+            'authority': 'name_office',
+            'confidence': confidence / 100.0,
+            'decided_by': 'auto' if confidence >= 95 else 'manual',
+            'note': note
+        } for stage_id, candidate_id, confidence, note in matches]
+        
+        self._insert_rows_grouped('candidate_matches', records)
+    
+    def _record_match_dry(self, stage_id: int, candidate_id: UUID, confidence: float, note: str) -> None:
+        logger.info(f"DRY RUN: Would record match {stage_id} -> {candidate_id} ({confidence:.1f}%)")
+
+    def _record_match_real(self, stage_id: int, candidate_id: UUID, confidence: float, note: str) -> None:
         """
         Record a candidate match.
         
@@ -487,16 +807,12 @@ class SupabaseClient:
             confidence: Match confidence score (as percentage 0-100)
             note: Match note
         """
-        if DRY_RUN:
-            logger.info(f"DRY RUN: Would record match {stage_id} -> {candidate_id} ({confidence:.1f}%)")
-            return
-        
         # Convert confidence from percentage (0-100) to decimal (0-1) for database
         confidence_decimal = confidence / 100.0
         
         match_record = {
             'stage_id': stage_id,
-            'candidate_id': str(candidate_id),
+            'candidate_id': candidate_id,
             'authority': 'name_office',
             'confidence': confidence_decimal,  # Now in decimal format (0-1)
             'decided_by': 'auto' if confidence >= 95 else 'manual',
@@ -505,17 +821,16 @@ class SupabaseClient:
         
         self.client.table('candidate_matches').insert(match_record).execute()
     
-    def finalize_ingest_run(self, stats: UpdateStatistics) -> None:
+    def _finalize_ingest_run_dry(self, stats: UpdateStatistics) -> None:
+        logger.info(f"DRY RUN: Would finalize ingest run with stats: {stats.dict()}")
+
+    def _finalize_ingest_run_real(self, stats: UpdateStatistics) -> None:
         """
         Finalize the ingest run with statistics.
         
         Args:
             stats: Update statistics
         """
-        if DRY_RUN:
-            logger.info(f"DRY RUN: Would finalize ingest run with stats: {stats.dict()}")
-            return
-        
         updates = {
             'finished_at': datetime.now().isoformat(),
             'row_count_stage': stats.total_staged,
@@ -525,27 +840,52 @@ class SupabaseClient:
         }
         
         self.client.table('ingest_runs').update(updates).eq(
-            'id', str(self.ingest_run_id)
+            'id', self.ingest_run_id
         ).execute()
         
         logger.info(f"Finalized ingest run {self.ingest_run_id}")
     
-    def get_districts(self) -> List[Dict[str, Any]]:
+    def _get_districts_dry(self) -> List[Dict[str, Any]]:
+        return []
+
+    def _get_districts_real(self) -> List[Dict[str, Any]]:
         """
         Get all districts from database.
         
+        Cached after the first call, so repeated callers pay one HTTP
+        round-trip per run instead of one per call.
+        
         Returns:
             List of district records
         """
-        if DRY_RUN:
-            return []
+        if self._districts_cache is None:
+            result = self.client.table('districts').select('*').execute()
+            self._districts_cache = {row['ocd_id']: row for row in result.data}
+        return list(self._districts_cache.values())
+    
+    def get_district_by_ocd(self, ocd_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a single district by OCD division ID.
         
-        result = self.client.table('districts').select('*').execute()
-        return result.data
+        Args:
+            ocd_id: OCD division ID
+            
+        Returns:
+            District record or None if not found
+        """
+        self.get_districts()
+        if self._districts_cache is None:
+            return None
+        return self._districts_cache.get(ocd_id)
     
-    def create_district(self, ocd_id: str, district_type: str, 
+    def _create_district_dry(self, ocd_id: str, district_type: str,
+                             district_number: Optional[str] = None,
+                             name: Optional[str] = None) -> str:
+        return str(uuid4())
+
+    def _create_district_real(self, ocd_id: str, district_type: str, 
                        district_number: Optional[str] = None,
-                       name: Optional[str] = None) -> UUID:
+                       name: Optional[str] = None) -> str:
         """
         Create a new district.
         
@@ -556,11 +896,8 @@ class SupabaseClient:
             name: District name
             
         Returns:
-            UUID of created district
+            ID of created district
         """
-        if DRY_RUN:
-            return uuid4()
-        
         district_record = {
             'ocd_id': ocd_id,
             'district_type': district_type,
@@ -570,4 +907,11 @@ class SupabaseClient:
         }
         
         result = self.client.table('districts').insert(district_record).execute()
-        return UUID(result.data[0]['id'])
\ No newline at end of file
+        district = result.data[0]
+        
+        # Keep the district cache current so get_districts() callers see the
+        # new row without another fetch
+        if self._districts_cache is not None:
+            self._districts_cache[district['ocd_id']] = district
+        
+        return district['id']
\ No newline at end of file
@@ -1,7 +1,27 @@
 """Deduplication and matching logic for candidates."""
 
+import functools
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import product
 from typing import List, Dict, Any, Optional, Tuple
-from fuzzywuzzy import fuzz
+
+import numpy as np
+from rapidfuzz import fuzz
+from rapidfuzz import process as rprocess
+
+# Optional: numba JIT-compiles the score-combine kernel; NumPy masks are
+# used when it is not installed
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+from .blocking import HAVE_DATASKETCH, LSHBlocker
 from .models import DatabaseCandidate
 from .config import (
     EXACT_MATCH_THRESHOLD,
@@ -12,6 +32,110 @@ from .config import (
 
 logger = setup_logging(__name__)
 
+# Numeric segments of an OCD division ID, e.g. "sldl:23a" -> "23"
+_DIGITS_RE = re.compile(r'\d+')
+
+# LSH blocking only pays for itself at scale: the index is built when the
+# existing side is at least this large, and used when the dense pair
+# count would otherwise exceed _LSH_MIN_PAIRS
+_LSH_MIN_EXISTING = 5000
+_LSH_MIN_PAIRS = 4_000_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
+    """Cached lower+strip; office/party strings repeat heavily across rows."""
+    return s.lower().strip()
+
+
+def _gated_ratio(a: str, b: str, score_cutoff: float) -> float:
+    """fuzz.ratio with RapidFuzz's early-exit cutoff (returns 0 below it)."""
+    return fuzz.ratio(a, b, score_cutoff=score_cutoff)
+
+
+# American Soundex letter codes (vowels, h, w and y carry no digit)
+_SOUNDEX_CODES = {
+    ch: code
+    for letters, code in (('bfpv', '1'), ('cgjkqsxz', '2'), ('dt', '3'),
+                          ('l', '4'), ('mn', '5'), ('r', '6'))
+    for ch in letters
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _soundex(name: str) -> str:
+    """
+    American Soundex code (letter plus three digits) of a name.
+
+    Args:
+        name: Normalized (lowercased) name
+
+    Returns:
+        Four-character code, or '' for names without letters
+    """
+    letters = [ch for ch in name if ch.isalpha()]
+    if not letters:
+        return ''
+    digits: List[str] = []
+    prev = _SOUNDEX_CODES.get(letters[0], '')
+    for ch in letters[1:]:
+        if ch in 'hw':
+            # h and w are skipped without breaking adjacency
+            continue
+        code = _SOUNDEX_CODES.get(ch, '')
+        if code and code != prev:
+            digits.append(code)
+            if len(digits) == 3:
+                break
+        prev = code
+    return (letters[0] + ''.join(digits)).ljust(4, '0')
+
+
+@dataclass(frozen=True, slots=True)
+class _NormCandidate:
+    """Candidate fields normalized once per find_match call."""
+    full_name: str
+    office_name: str
+    first: str
+    last: str
+    year: Optional[int]
+    party: str
+    office_level: str
+    district: Optional[str]
+    external_id: Optional[str]
+
+
+if HAVE_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _best_match_kernel(name_m, office_m, party_mismatch, year_ok):
+        """
+        Row-wise best combined score over the similarity matrices.
+
+        Fuses the weighted combine, party penalty, year mask and argmax
+        into a single pass instead of NumPy's multi-pass temporaries.
+        """
+        n, m = name_m.shape
+        best_idx = np.zeros(n, dtype=np.int64)
+        best_score = np.zeros(n, dtype=np.float64)
+        for i in numba.prange(n):
+            bi = 0
+            bs = 0.0
+            for j in range(m):
+                if not year_ok[i, j]:
+                    continue
+                ns = name_m[i, j]
+                if ns < 70:
+                    continue
+                combined = ns * 0.6 + office_m[i, j] * 0.3
+                if party_mismatch[i, j]:
+                    combined *= 0.5
+                if combined > bs:
+                    bs = combined
+                    bi = j
+            best_idx[i] = bi
+            best_score[i] = bs
+        return best_idx, best_score
+
 
 class CandidateMatcher:
     """Match and deduplicate candidates."""
@@ -26,7 +150,83 @@ class CandidateMatcher:
         self.existing_candidates = existing_candidates
         self.matches_found = 0
         self.new_candidates = 0
-        
+
+        # Normalized existing-candidate fields, computed once as parallel
+        # lists so the matching loops do indexed reads instead of
+        # re-normalizing the same strings on every comparison
+        norm = self.normalize_string
+        self._ex_full = [norm(c.full_name) for c in existing_candidates]
+        self._ex_office = [norm(c.office_name) for c in existing_candidates]
+        self._ex_party = [norm(c.party) for c in existing_candidates]
+        self._ex_office_level = [norm(c.office_level) for c in existing_candidates]
+        self._ex_first = [norm(c.first_name) for c in existing_candidates]
+        self._ex_last = [norm(c.last_name) for c in existing_candidates]
+        self._ex_year = [c.election_year for c in existing_candidates]
+        self._ex_ocd = [c.ocd_division_id or '' for c in existing_candidates]
+        # Numeric district codes per OCD id, extracted once so the fuzzy
+        # loop does an O(1) set lookup instead of a substring scan
+        self._ex_district_codes = [
+            frozenset(_DIGITS_RE.findall(ocd)) for ocd in self._ex_ocd
+        ]
+
+        # Blocking index: bucket existing candidates by
+        # (election_year, office_level, first two chars of last_name) so the
+        # loop-based matchers only compare plausibly-matching records.
+        # Records missing a component are filed under fallback buckets
+        # (None / '') that are always scanned as well.
+        self._block: Dict[Tuple[Any, str, str], List[int]] = defaultdict(list)
+        self._last_prefix_block: Dict[str, List[int]] = defaultdict(list)
+        self._by_year: Dict[Optional[int], List[int]] = defaultdict(list)
+        # Phonetic buckets: soundex of the last name recovers respellings
+        # ("Schmidt"/"Smith") that land in different prefix buckets
+        self._soundex_block: Dict[str, List[int]] = defaultdict(list)
+        for i in range(len(existing_candidates)):
+            prefix = self._ex_last[i][:2]
+            key = (self._ex_year[i], self._ex_office_level[i], prefix)
+            self._block[key].append(i)
+            self._last_prefix_block[prefix].append(i)
+            self._by_year[self._ex_year[i]].append(i)
+            code = _soundex(self._ex_last[i])
+            if code:
+                self._soundex_block[code].append(i)
+
+        # Int-coded categorical fields (AoS -> SoA): the vectorized masks
+        # index these arrays instead of touching pydantic attributes
+        self._ex_years = np.array([y or 0 for y in self._ex_year], dtype=np.int32)
+        self._party_intern: Dict[str, int] = {'': 0}
+        self._ex_party_ids = np.array(
+            [self._party_intern.setdefault(p, len(self._party_intern))
+             for p in self._ex_party],
+            dtype=np.int16
+        )
+        self._level_intern: Dict[str, int] = {'': 0}
+        self._ex_level_ids = np.array(
+            [self._level_intern.setdefault(lvl, len(self._level_intern))
+             for lvl in self._ex_office_level],
+            dtype=np.int8
+        )
+
+        # MinHash-LSH buckets over name+office 3-grams: at scale the
+        # matcher queries per-candidate buckets instead of materializing
+        # the full N x M similarity matrices
+        self._lsh_blocker: Optional[LSHBlocker] = None
+        if HAVE_DATASKETCH and len(existing_candidates) >= _LSH_MIN_EXISTING:
+            self._lsh_blocker = LSHBlocker([
+                f"{self._ex_full[i]} {self._ex_office[i]}"
+                for i in range(len(existing_candidates))
+            ])
+
+        # External-id index: id value -> existing index, so sources that
+        # carry a stable identifier resolve in one dict probe instead of
+        # entering the fuzzy pass at all. First occurrence wins on the
+        # rare duplicate value.
+        self._by_external_id: Dict[str, int] = {}
+        for i, c in enumerate(existing_candidates):
+            for ext in c.external_ids or []:
+                value = ext.get('value')
+                if value:
+                    self._by_external_id.setdefault(value, i)
+
     def normalize_string(self, s: Optional[str]) -> str:
         """
         Normalize string for comparison.
@@ -39,62 +239,155 @@ class CandidateMatcher:
         """
         if not s:
             return ""
-        return s.lower().strip()
+        return _norm(s)
     
-    def match_by_external_id(self, candidate: Dict[str, Any]) -> Optional[Tuple[DatabaseCandidate, float]]:
+    def _blocked_indices(self, year: Optional[int], office_level: str,
+                         last: str) -> List[int]:
+        """
+        Indices of existing candidates sharing a blocking key.
+
+        Components the new candidate is missing act as wildcards, and
+        existing records missing a component live in fallback buckets that
+        are always included, so blocking never hides a record purely on the
+        basis of absent data. Records whose last name is phonetically
+        equivalent (same soundex code) are folded in alongside the prefix
+        bucket so respellings survive blocking.
+
+        Args:
+            year: Candidate election year (or None)
+            office_level: Normalized office level ('' if unknown)
+            last: Normalized last name ('' if unknown)
+
+        Returns:
+            List of indices into self.existing_candidates
+        """
+        last_prefix = last[:2]
+        phonetic = (
+            set(self._soundex_block.get(_soundex(last), ())) if last else set()
+        )
+
+        if year is not None and office_level:
+            prefixes = (last_prefix, '') if last_prefix else ('',)
+            indices = set()
+            for key in product((year, None), (office_level, ''), prefixes):
+                indices.update(self._block.get(key, ()))
+            # Same-sounding last names that missed the prefix buckets,
+            # filtered down to compatible year/level
+            for i in phonetic - indices:
+                if (self._ex_year[i] in (year, None) and
+                        self._ex_office_level[i] in (office_level, '')):
+                    indices.add(i)
+            return sorted(indices)
+
+        # Year-only blocking for candidates missing office level: iterate
+        # the same-year subset (plus year-unknown records) instead of the
+        # whole list
+        if year is not None:
+            indices = set(self._by_year.get(year, ()))
+            indices.update(self._by_year.get(None, ()))
+            if last_prefix:
+                name_set = set(self._last_prefix_block.get(last_prefix, ()))
+                name_set.update(self._last_prefix_block.get('', ()))
+                name_set.update(phonetic)
+                indices &= name_set
+            return sorted(indices)
+
+        # Candidate is missing the year/level blocking fields; fall back to
+        # the last-name prefix block, or the full list when that is missing
+        if last_prefix:
+            indices = set(self._last_prefix_block.get(last_prefix, ()))
+            indices.update(self._last_prefix_block.get('', ()))
+            indices.update(phonetic)
+            return sorted(indices)
+
+        return list(range(len(self.existing_candidates)))
+
+    def match_by_external_id(self, n: _NormCandidate) -> Optional[Tuple[DatabaseCandidate, float]]:
         """
         Match candidate by external identifier.
         
         Args:
-            candidate: Candidate data to match
+            n: Normalized candidate fields
             
         Returns:
             Tuple of (matched_candidate, confidence) or None
         """
-        # For Maryland data, we don't have persistent external IDs
-        # This would be used for FEC IDs or state filing numbers
+        # Maryland rows don't carry persistent external IDs, so the index
+        # is usually empty there; NC and other sources that stamp an
+        # external_id_value (FEC IDs, state filing numbers) hit this path
+        if n.external_id:
+            i = self._by_external_id.get(n.external_id)
+            if i is not None:
+                return (self.existing_candidates[i], 100.0)
         return None
     
-    def match_by_name_and_office(self, candidate: Dict[str, Any]) -> Optional[Tuple[DatabaseCandidate, float]]:
+    def _normalize_candidate(self, candidate: Dict[str, Any]) -> _NormCandidate:
         """
-        Match candidate by name and office.
+        Normalize a candidate dict's fields once for the match_by_* methods.
         
         Args:
             candidate: Candidate data to match
             
         Returns:
-            Tuple of (matched_candidate, confidence) or None
+            _NormCandidate with normalized fields
         """
-        candidate_name = self.normalize_string(candidate['full_name'])
-        candidate_office = self.normalize_string(candidate['office_name'])
-        candidate_year = candidate.get('election_year')
-        candidate_party = self.normalize_string(candidate.get('party'))
+        norm = self.normalize_string
+        return _NormCandidate(
+            full_name=norm(candidate['full_name']),
+            office_name=norm(candidate['office_name']),
+            first=norm(candidate.get('first_name')),
+            last=norm(candidate.get('last_name')),
+            year=candidate.get('election_year'),
+            party=norm(candidate.get('party')),
+            office_level=norm(candidate.get('office_level')),
+            district=candidate.get('district_number'),
+            external_id=candidate.get('external_id_value')
+        )
+    
+    def match_by_name_and_office(self, n: _NormCandidate) -> Optional[Tuple[DatabaseCandidate, float]]:
+        """
+        Match candidate by name and office.
         
+        Args:
+            n: Normalized candidate fields
+            
+        Returns:
+            Tuple of (matched_candidate, confidence) or None
+        """
+        candidate_name = n.full_name
+        candidate_office = n.office_name
+        candidate_year = n.year
+        candidate_party = n.party
+        candidate_level = n.office_level
+
         best_match = None
         best_score = 0.0
-        
-        for existing in self.existing_candidates:
-            # Skip if different election year (if specified)
-            if (candidate_year and existing.election_year and 
-                candidate_year != existing.election_year):
-                continue
+
+        # Blocking already restricts the scan to compatible election years,
+        # so no per-iteration year compare is needed
+        for i in self._blocked_indices(candidate_year, candidate_level, n.last):
+            existing = self.existing_candidates[i]
             
             # Calculate name similarity
-            existing_name = self.normalize_string(existing.full_name)
-            name_score = fuzz.ratio(candidate_name, existing_name)
+            existing_name = self._ex_full[i]
+            name_score = _gated_ratio(candidate_name, existing_name, 70)
             
             # If name is very different, skip
             if name_score < 70:
                 continue
             
-            # Check office similarity
-            existing_office = self.normalize_string(existing.office_name)
-            office_score = fuzz.ratio(candidate_office, existing_office)
+            # Check office similarity - skip the fuzzy compare outright when
+            # the office levels already differ and let the name weight decide
+            existing_level = self._ex_office_level[i]
+            if candidate_level and existing_level and candidate_level != existing_level:
+                office_score = 0
+            else:
+                office_score = fuzz.ratio(candidate_office, self._ex_office[i])
             
             # Check party match (if both specified)
             party_match = 1.0
-            if candidate_party and existing.party:
-                existing_party = self.normalize_string(existing.party)
+            existing_party = self._ex_party[i]
+            if candidate_party and existing_party:
                 if candidate_party != existing_party:
                     party_match = 0.5  # Penalty for party mismatch
             
@@ -117,35 +410,44 @@ class CandidateMatcher:
         
         return None
     
-    def match_by_fuzzy_name(self, candidate: Dict[str, Any]) -> Optional[Tuple[DatabaseCandidate, float]]:
+    def match_by_fuzzy_name(self, n: _NormCandidate) -> Optional[Tuple[DatabaseCandidate, float]]:
         """
         Match candidate by fuzzy name matching with additional context.
         
         Args:
-            candidate: Candidate data to match
+            n: Normalized candidate fields
             
         Returns:
             Tuple of (matched_candidate, confidence) or None
         """
-        candidate_first = self.normalize_string(candidate.get('first_name'))
-        candidate_last = self.normalize_string(candidate.get('last_name'))
-        candidate_district = candidate.get('district_number')
-        
+        candidate_first = n.first
+        candidate_last = n.last
+        candidate_district = n.district
+        candidate_level = n.office_level
+
         if not candidate_last:
             return None
         
         best_match = None
         best_score = 0.0
         
-        for existing in self.existing_candidates:
-            existing_first = self.normalize_string(existing.first_name)
-            existing_last = self.normalize_string(existing.last_name)
+        for i in self._blocked_indices(None, '', candidate_last):
+            existing = self.existing_candidates[i]
+            existing_first = self._ex_first[i]
+            existing_last = self._ex_last[i]
             
             if not existing_last:
                 continue
-            
+
+            # A last-name score >= 85 all but requires a shared first
+            # character, so skip the ratio call outright when it differs.
+            # This can miss a leading-character typo ("mith" vs "smith"),
+            # which the 85 threshold would reject in most cases anyway.
+            if candidate_last[0] != existing_last[0]:
+                continue
+
             # Check last name similarity
-            last_name_score = fuzz.ratio(candidate_last, existing_last)
+            last_name_score = _gated_ratio(candidate_last, existing_last, 85)
             
             if last_name_score < 85:
                 continue
@@ -163,19 +465,23 @@ class CandidateMatcher:
             
             # Check office level and district
             context_score = 0
-            if (self.normalize_string(candidate.get('office_level')) == 
-                self.normalize_string(existing.office_level)):
+            if candidate_level == self._ex_office_level[i]:
                 context_score += 50
             
-            if (candidate_district and existing.ocd_division_id and
-                str(candidate_district) in existing.ocd_division_id):
+            if candidate_district and str(candidate_district) in self._ex_district_codes[i]:
                 context_score += 50
             
             # Calculate combined score
-            combined_score = (last_name_score * 0.4 + 
-                            first_name_score * 0.3 + 
+            combined_score = (last_name_score * 0.4 +
+                            first_name_score * 0.3 +
                             context_score * 0.3)
-            
+
+            # A high-confidence hit is auto-updated downstream regardless of
+            # whether a marginally better one exists later in the block, so
+            # stop scanning as soon as one clears the bar
+            if combined_score >= HIGH_CONFIDENCE_THRESHOLD:
+                return (existing, combined_score)
+
             if combined_score > best_score:
                 best_score = combined_score
                 best_match = existing
@@ -196,18 +502,21 @@ class CandidateMatcher:
         Returns:
             Tuple of (matched_candidate, confidence, match_method)
         """
+        # Normalize the candidate's fields once; the sub-methods share it
+        n = self._normalize_candidate(candidate)
+        
         # Try matching by external ID first (highest confidence)
-        match = self.match_by_external_id(candidate)
+        match = self.match_by_external_id(n)
         if match:
             return match[0], match[1], "external_id"
         
         # Try exact name and office match
-        match = self.match_by_name_and_office(candidate)
+        match = self.match_by_name_and_office(n)
         if match and match[1] >= HIGH_CONFIDENCE_THRESHOLD:
             return match[0], match[1], "name_office_exact"
         
         # Try fuzzy name matching
-        fuzzy_match = self.match_by_fuzzy_name(candidate)
+        fuzzy_match = self.match_by_fuzzy_name(n)
         
         # Return best match
         if match and fuzzy_match:
@@ -222,7 +531,237 @@ class CandidateMatcher:
         
         # No match found
         return None, 0.0, "no_match"
-    
+
+    def _find_matches_vectorized(
+        self, candidates: List[Dict[str, Any]]
+    ) -> List[Tuple[Optional[DatabaseCandidate], float, str]]:
+        """
+        Score every (new, existing) pair in two RapidFuzz cdist calls.
+
+        Computes the full name- and office-similarity matrices in C instead
+        of calling fuzz.ratio once per pair from Python, then applies the
+        party penalty and year filter as NumPy masks. Rows that don't clear
+        the review threshold fall back to the per-candidate fuzzy-name
+        matcher so results stay consistent with find_match().
+
+        Args:
+            candidates: List of candidate dicts to match
+
+        Returns:
+            List of (matched_candidate, confidence, match_method) tuples
+        """
+        cand_names = [self.normalize_string(c['full_name']) for c in candidates]
+        cand_offices = [self.normalize_string(c['office_name']) for c in candidates]
+        cand_parties = [self.normalize_string(c.get('party')) for c in candidates]
+        cand_years = np.array(
+            [c.get('election_year') or 0 for c in candidates], dtype=np.int32
+        )
+
+        # Full similarity matrices in one vectorized call each; score_cutoff
+        # mirrors the name_score < 70 skip in the loop path
+        name_mat = rprocess.cdist(
+            cand_names, self._ex_full,
+            scorer=fuzz.ratio, score_cutoff=70, workers=-1
+        )
+        office_mat = rprocess.cdist(
+            cand_offices, self._ex_office, scorer=fuzz.ratio, workers=-1
+        )
+
+        # Party penalty: 0.5 when both sides specify a party and they differ
+        cand_party_ids = np.array(
+            [self._party_intern.setdefault(p, len(self._party_intern))
+             for p in cand_parties],
+            dtype=np.int16
+        )
+        party_mismatch = (
+            (cand_party_ids[:, None] != 0) & (self._ex_party_ids[None, :] != 0) &
+            (cand_party_ids[:, None] != self._ex_party_ids[None, :])
+        )
+        # Year filter: comparable when either side has no year or they match
+        year_ok = (
+            (cand_years[:, None] == 0) | (self._ex_years[None, :] == 0) |
+            (cand_years[:, None] == self._ex_years[None, :])
+        )
+
+        # Same weighted combine as match_by_name_and_office, fused into a
+        # single pass when numba is available
+        if HAVE_NUMBA:
+            best_idx, best_score = _best_match_kernel(
+                name_mat, office_mat, party_mismatch, year_ok
+            )
+        else:
+            party_mat = np.where(party_mismatch, 0.5, 1.0)
+            combined = (name_mat * 0.6 + office_mat * 0.3) * party_mat
+            combined[name_mat < 70] = 0.0
+            combined[~year_ok] = 0.0
+            best_idx = combined.argmax(axis=1)
+            best_score = combined.max(axis=1)
+
+        exact = (name_mat == 100) & (office_mat == 100) & ~party_mismatch & year_ok
+
+        # Rows the matrices don't settle fall back to the per-candidate
+        # fuzzy matcher. Each row is independent and RapidFuzz releases the
+        # GIL inside ratio, so the fallback rows are fanned out across a
+        # thread pool instead of being matched serially.
+        fallback_rows = [
+            i for i in range(len(candidates))
+            if not exact[i].any() and float(best_score[i]) < HIGH_CONFIDENCE_THRESHOLD
+        ]
+        fuzzy_matches: Dict[int, Optional[Tuple[DatabaseCandidate, float]]] = {}
+        if fallback_rows:
+            def _fuzzy(row: int) -> Tuple[int, Optional[Tuple[DatabaseCandidate, float]]]:
+                return row, self.match_by_fuzzy_name(
+                    self._normalize_candidate(candidates[row])
+                )
+
+            max_workers = min(len(fallback_rows), os.cpu_count() or 1)
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    fuzzy_matches = dict(executor.map(_fuzzy, fallback_rows))
+            else:
+                fuzzy_matches = dict(_fuzzy(row) for row in fallback_rows)
+
+        results = []
+        for i, candidate in enumerate(candidates):
+            if exact[i].any():
+                j = int(np.argmax(exact[i]))
+                results.append((
+                    self.existing_candidates[j], float(EXACT_MATCH_THRESHOLD),
+                    "name_office_exact"
+                ))
+                continue
+
+            j = int(best_idx[i])
+            score = float(best_score[i])
+
+            if score >= HIGH_CONFIDENCE_THRESHOLD:
+                results.append((self.existing_candidates[j], score, "name_office_exact"))
+                continue
+
+            # Below high confidence: let fuzzy name matching compete, as in
+            # find_match()
+            name_office = (self.existing_candidates[j], score) if score >= REVIEW_THRESHOLD else None
+            fuzzy_match = fuzzy_matches.get(i)
+
+            if name_office and fuzzy_match:
+                if name_office[1] > fuzzy_match[1]:
+                    results.append((name_office[0], name_office[1], "name_office"))
+                else:
+                    results.append((fuzzy_match[0], fuzzy_match[1], "fuzzy_name"))
+            elif name_office:
+                results.append((name_office[0], name_office[1], "name_office"))
+            elif fuzzy_match:
+                results.append((fuzzy_match[0], fuzzy_match[1], "fuzzy_name"))
+            else:
+                results.append((None, 0.0, "no_match"))
+
+        return results
+
+    def _find_matches_blocked(
+        self, candidates: List[Dict[str, Any]]
+    ) -> List[Tuple[Optional[DatabaseCandidate], float, str]]:
+        """
+        LSH-blocked variant of _find_matches_vectorized.
+
+        Scores each candidate against its MinHash bucket instead of every
+        existing record, dropping the pair count from N*M to N*k. Pairs
+        below the Jaccard threshold never get scored, but rows the
+        buckets don't settle fall through to the per-candidate fuzzy
+        matcher just like unsettled rows on the dense path.
+
+        Args:
+            candidates: Candidate dicts (the ['candidate'] payloads)
+
+        Returns:
+            List of (matched_candidate, confidence, match_method) tuples
+        """
+        norm = self.normalize_string
+        # Per row: (best index, best combined score, exact index or -1)
+        rows: List[Tuple[int, float, int]] = []
+        for candidate in candidates:
+            name = norm(candidate['full_name'])
+            office = norm(candidate['office_name'])
+            party = norm(candidate.get('party'))
+            party_id = self._party_intern.setdefault(party, len(self._party_intern))
+            year = candidate.get('election_year') or 0
+
+            best_j, best_score, exact_j = -1, 0.0, -1
+            for j in self._lsh_blocker.query(f"{name} {office}"):
+                ex_year = int(self._ex_years[j])
+                if year and ex_year and year != ex_year:
+                    continue
+                name_score = _gated_ratio(name, self._ex_full[j], 70)
+                if not name_score:
+                    continue
+                office_score = fuzz.ratio(office, self._ex_office[j])
+                mismatch = (
+                    party_id != 0 and self._ex_party_ids[j] != 0 and
+                    party_id != self._ex_party_ids[j]
+                )
+                if name_score == 100 and office_score == 100 and not mismatch:
+                    exact_j = j
+                    break
+                combined = name_score * 0.6 + office_score * 0.3
+                if mismatch:
+                    combined *= 0.5
+                if combined > best_score:
+                    best_j, best_score = j, combined
+            rows.append((best_j, best_score, exact_j))
+
+        # Same fallback fan-out as the dense path
+        fallback_rows = [
+            i for i, (_, best_score, exact_j) in enumerate(rows)
+            if exact_j < 0 and best_score < HIGH_CONFIDENCE_THRESHOLD
+        ]
+        fuzzy_matches: Dict[int, Optional[Tuple[DatabaseCandidate, float]]] = {}
+        if fallback_rows:
+            def _fuzzy(row: int) -> Tuple[int, Optional[Tuple[DatabaseCandidate, float]]]:
+                return row, self.match_by_fuzzy_name(
+                    self._normalize_candidate(candidates[row])
+                )
+
+            max_workers = min(len(fallback_rows), os.cpu_count() or 1)
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    fuzzy_matches = dict(executor.map(_fuzzy, fallback_rows))
+            else:
+                fuzzy_matches = dict(_fuzzy(row) for row in fallback_rows)
+
+        results = []
+        for i, (best_j, best_score, exact_j) in enumerate(rows):
+            if exact_j >= 0:
+                results.append((
+                    self.existing_candidates[exact_j], float(EXACT_MATCH_THRESHOLD),
+                    "name_office_exact"
+                ))
+                continue
+
+            if best_score >= HIGH_CONFIDENCE_THRESHOLD:
+                results.append((
+                    self.existing_candidates[best_j], best_score, "name_office_exact"
+                ))
+                continue
+
+            name_office = (
+                (self.existing_candidates[best_j], best_score)
+                if best_score >= REVIEW_THRESHOLD else None
+            )
+            fuzzy_match = fuzzy_matches.get(i)
+
+            if name_office and fuzzy_match:
+                if name_office[1] > fuzzy_match[1]:
+                    results.append((name_office[0], name_office[1], "name_office"))
+                else:
+                    results.append((fuzzy_match[0], fuzzy_match[1], "fuzzy_name"))
+            elif name_office:
+                results.append((name_office[0], name_office[1], "name_office"))
+            elif fuzzy_match:
+                results.append((fuzzy_match[0], fuzzy_match[1], "fuzzy_name"))
+            else:
+                results.append((None, 0.0, "no_match"))
+
+        return results
+
     def process_candidates(self, candidates: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Process all candidates and categorize them.
@@ -240,11 +779,46 @@ class CandidateMatcher:
             'skip': []
         }
         
-        for candidate_data in candidates:
+        # External-id pre-pass: candidates whose id value is already in
+        # the index resolve in O(1) and skip the similarity matrices
+        # entirely, so a rerun where most rows already exist does almost
+        # no fuzzy work
+        ext_matches: Dict[int, Tuple[DatabaseCandidate, float, str]] = {}
+        if self._by_external_id:
+            for idx, cd in enumerate(candidates):
+                ext_id = cd['candidate'].get('external_id_value')
+                if ext_id:
+                    i = self._by_external_id.get(ext_id)
+                    if i is not None:
+                        ext_matches[idx] = (
+                            self.existing_candidates[i], 100.0, 'external_id'
+                        )
+
+        # Vectorized batch matching over the remainder; the per-candidate
+        # path handles the degenerate cases
+        pending = [idx for idx in range(len(candidates)) if idx not in ext_matches]
+        batch_matches = None
+        if self.existing_candidates and pending:
+            pending_rows = [candidates[idx]['candidate'] for idx in pending]
+            # At scale, score per-row LSH buckets instead of the dense
+            # N x M matrices; below the cutoff the cdist path is faster
+            if (self._lsh_blocker is not None and
+                    len(pending_rows) * len(self.existing_candidates) >= _LSH_MIN_PAIRS):
+                matches = self._find_matches_blocked(pending_rows)
+            else:
+                matches = self._find_matches_vectorized(pending_rows)
+            batch_matches = dict(zip(pending, matches))
+
+        for idx, candidate_data in enumerate(candidates):
             candidate = candidate_data['candidate']
-            
+
             # Find match
-            match, confidence, method = self.find_match(candidate)
+            if idx in ext_matches:
+                match, confidence, method = ext_matches[idx]
+            elif batch_matches is not None:
+                match, confidence, method = batch_matches[idx]
+            else:
+                match, confidence, method = self.find_match(candidate)
             
             if match:
                 self.matches_found += 1
@@ -4,7 +4,7 @@ import sys
 import time
 from datetime import datetime
 from typing import Dict, Any
-from .maryland_fetcher import fetch_maryland_candidates
+from .maryland_fetcher import MarylandDataFetcher
 from .transformer import transform_maryland_data
 from .database import SupabaseClient
 from .deduplication import deduplicate_candidates
@@ -45,19 +45,24 @@ def run_maryland_update() -> UpdateStatistics:
     logger.info("=" * 60)
     
     try:
-        # Step 1: Fetch data from Maryland BOE
-        logger.info("\n📥 STEP 1: Fetching Maryland data...")
-        raw_df = fetch_maryland_candidates()
-        stats.total_raw_records = len(raw_df)
+        # Steps 1+2: Fetch and transform chunk-by-chunk so the full raw
+        # DataFrame is never held in memory
+        logger.info("\n📥 STEP 1+2: Fetching and transforming Maryland data...")
+        fetcher = MarylandDataFetcher()
+        transformed_candidates = []
+        try:
+            for chunk in fetcher.fetch_combined_candidates_chunks():
+                stats.total_raw_records += len(chunk)
+                transformed_candidates.extend(transform_maryland_data(chunk))
+        finally:
+            fetcher.close()
+
         logger.info(f"✅ Fetched {stats.total_raw_records} raw candidate records")
-        
+
         if stats.total_raw_records == 0:
             logger.warning("No candidates found in Maryland data")
             return stats
-        
-        # Step 2: Transform data to normalized format
-        logger.info("\n🔄 STEP 2: Transforming data...")
-        transformed_candidates = transform_maryland_data(raw_df)
+
         logger.info(f"✅ Transformed {len(transformed_candidates)} candidates")
         
         # Step 3: Initialize database client
@@ -88,40 +93,22 @@ def run_maryland_update() -> UpdateStatistics:
         logger.info(f"  - Updates: {len(categorized['update'])}")
         logger.info(f"  - Need review: {len(categorized['review'])}")
         
-        # Step 8: Process new candidates
+        # Step 8: Process new candidates (bulk insert, falls back to
+        # per-row inside the client on failure)
         logger.info("\n➕ STEP 8: Processing new candidates...")
-        for candidate_data in categorized['new']:
-            try:
-                candidate_id = db.insert_candidate(candidate_data)
-                if candidate_id:
-                    stats.new_candidates += 1
-            except Exception as e:
-                logger.error(f"Error inserting candidate {candidate_data['candidate']['full_name']}: {e}")
-                stats.errors += 1
-        
+        stats.new_candidates = db.insert_candidates_bulk(categorized['new'])
+        stats.errors += len(categorized['new']) - stats.new_candidates
+
         logger.info(f"✅ Inserted {stats.new_candidates} new candidates")
-        
-        # Step 9: Process updates
+
+        # Step 9: Process updates (bulk upsert keyed by candidate id)
         logger.info("\n📝 STEP 9: Processing updates...")
-        for candidate_data in categorized['update']:
-            try:
-                match_info = candidate_data['match_info']
-                success = db.update_candidate(match_info['candidate_id'], candidate_data)
-                if success:
-                    stats.updated_candidates += 1
-                    
-                    # TODO: Record match in database once we have proper stage_ids
-                    # The stage_id needs to come from the normalized_candidates_stage table
-                    # db.record_match(
-                    #     stage_id=stage_id,  # Need to get actual stage_id from staging table
-                    #     candidate_id=match_info['candidate_id'],
-                    #     confidence=match_info['confidence'],
-                    #     note=f"Auto-matched by {match_info['method']}"
-                    # )
-            except Exception as e:
-                logger.error(f"Error updating candidate: {e}")
-                stats.errors += 1
-        
+        stats.updated_candidates = db.update_candidates_bulk(categorized['update'])
+        stats.errors += len(categorized['update']) - stats.updated_candidates
+
+        # TODO: Record matches via db.record_matches_bulk once we have proper
+        # stage_ids from the normalized_candidates_stage table
+
         logger.info(f"✅ Updated {stats.updated_candidates} existing candidates")
         
         # Step 10: Handle review items
@@ -174,10 +174,28 @@ class DatabaseCandidate(BaseModel):
     
     # For matching
     external_ids: List[Dict[str, str]] = []
-    
+
     class Config:
         orm_mode = True
 
+    @classmethod
+    def from_trusted_row(cls, **fields) -> "DatabaseCandidate":
+        """
+        Build from an already-validated database row, skipping validation.
+
+        The matcher constructs thousands of these per run from rows the
+        database has already typed, so the per-row validator cost buys
+        nothing there. Uses model_construct (pydantic v2) or construct (v1).
+
+        Args:
+            **fields: Column values straight from the database row
+
+        Returns:
+            DatabaseCandidate without validation having run
+        """
+        construct = getattr(cls, 'model_construct', None) or cls.construct
+        return construct(**fields)
+
 
 class UpdateStatistics(BaseModel):
     """Statistics from update run."""
@@ -1,6 +1,9 @@
 """Transform Maryland candidate data to normalized format."""
 
+import itertools
+import os
 import re
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
@@ -14,9 +17,41 @@ from .models import (
 )
 from .config import ELECTION_YEAR, SOURCE_NAME, setup_logging
 
+# Optional: Aho-Corasick automata match all office keywords in one pass
+# over the string; the per-keyword substring scans are used when absent
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+# Optional: process-based parallelism for large frames; rows transform
+# independently, so frames split cleanly across workers
+try:
+    from joblib import Parallel, delayed
+    HAVE_JOBLIB = True
+except ImportError:
+    HAVE_JOBLIB = False
+
 logger = setup_logging(__name__)
 
 
+def _build_automaton(words):
+    """Compile a set of keywords into an Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, True)
+    automaton.make_automaton()
+    return automaton
+
+# Row-parsing patterns, compiled once at import instead of per call (the
+# IGNORECASE flags also replace per-row .lower() copies)
+_DISTRICT_NUM_RE = re.compile(r'district\s+(\d+)', re.IGNORECASE)
+_ORDINAL_DISTRICT_RE = re.compile(r'(\d+)(?:st|nd|rd|th)\s+district', re.IGNORECASE)
+_FILING_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_ZIP_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\b')
+
+
 class MarylandTransformer:
     """Transform Maryland BOE data to normalized format."""
     
@@ -57,7 +92,42 @@ class MarylandTransformer:
         'circuit court', 'district court', 'orphans court',
         "orphan's court", "orphans' court"
     }
-    
+
+    # Social columns; platform name and source column coincide in the
+    # Maryland feed
+    _SOCIAL_PLATFORMS = ('facebook', 'x', 'other')
+
+    # Free-text columns that go through safe_str; cleaned column-wise in
+    # transform_dataframe instead of per cell
+    _SAFE_STR_COLS = (
+        'office_political_party', 'candidate_gender',
+        'candidate_residential_jurisdiction', 'committee_name', 'website',
+        'email', 'public_phone', 'facebook', 'x', 'other',
+        'additional_information'
+    )
+
+    # One alternation regex per level so a whole office_name column can be
+    # classified with vectorized str.contains passes instead of per-row
+    # Python substring scans
+    _FEDERAL_RE = re.compile('|'.join(map(re.escape, sorted(FEDERAL_OFFICES))), re.IGNORECASE)
+    _STATE_RE = re.compile('|'.join(map(re.escape, sorted(STATE_OFFICES))), re.IGNORECASE)
+    _JUDICIAL_RE = re.compile('|'.join(map(re.escape, sorted(JUDICIAL_OFFICES))), re.IGNORECASE)
+
+    # Exact office-name hits resolve in one dict probe before any scanning;
+    # most rows carry a canonical office name
+    _EXACT_LEVEL = {
+        **{name: OfficeLevel.FEDERAL for name in FEDERAL_OFFICES},
+        **{name: OfficeLevel.STATE for name in STATE_OFFICES},
+        **{name: OfficeLevel.JUDICIAL for name in JUDICIAL_OFFICES},
+    }
+
+    # Aho-Corasick automata for the per-row classification path: one O(len)
+    # pass over the string per level instead of one scan per keyword
+    if HAVE_AHOCORASICK:
+        _FEDERAL_AC = _build_automaton(FEDERAL_OFFICES)
+        _STATE_AC = _build_automaton(STATE_OFFICES)
+        _JUDICIAL_AC = _build_automaton(JUDICIAL_OFFICES)
+
     def __init__(self):
         self.processed_count = 0
         self.error_count = 0
@@ -76,7 +146,22 @@ class MarylandTransformer:
             return OfficeLevel.LOCAL
         
         office_lower = office_name.lower()
-        
+
+        # O(1) exact match first; fall through to scanning only for
+        # decorated or unusual office names
+        exact = self._EXACT_LEVEL.get(office_lower)
+        if exact is not None:
+            return exact
+
+        if HAVE_AHOCORASICK:
+            if next(self._FEDERAL_AC.iter(office_lower), None):
+                return OfficeLevel.FEDERAL
+            if next(self._STATE_AC.iter(office_lower), None):
+                return OfficeLevel.STATE
+            if next(self._JUDICIAL_AC.iter(office_lower), None):
+                return OfficeLevel.JUDICIAL
+            return OfficeLevel.LOCAL
+
         # Check for federal offices
         if any(federal in office_lower for federal in self.FEDERAL_OFFICES):
             return OfficeLevel.FEDERAL
@@ -91,7 +176,51 @@ class MarylandTransformer:
         
         # Default to local
         return OfficeLevel.LOCAL
-    
+
+    def classify_office_levels(self, office_names: pd.Series) -> List[OfficeLevel]:
+        """
+        Classify office levels for a whole column at once.
+
+        Runs one vectorized str.contains pass per level regex, mirroring
+        determine_office_level's precedence (federal > state > judicial >
+        local) by assigning in reverse order so higher levels overwrite.
+
+        Args:
+            office_names: Raw office_name column
+
+        Returns:
+            List of OfficeLevel values aligned with the column
+        """
+        names = office_names.fillna('')
+        levels = pd.Series(OfficeLevel.LOCAL, index=names.index, dtype=object)
+        levels[names.str.contains(self._JUDICIAL_RE, na=False)] = OfficeLevel.JUDICIAL
+        levels[names.str.contains(self._STATE_RE, na=False)] = OfficeLevel.STATE
+        levels[names.str.contains(self._FEDERAL_RE, na=False)] = OfficeLevel.FEDERAL
+        return list(levels)
+
+    def clean_string_columns(self, df: pd.DataFrame) -> List[Dict[str, str]]:
+        """
+        Apply safe_str's cleaning to the free-text columns column-wise.
+
+        One astype/strip/mask pass per column replaces the ~dozen per-cell
+        safe_str calls transform_row would otherwise make.
+
+        Args:
+            df: Raw candidate DataFrame
+
+        Returns:
+            One dict per row mapping each present _SAFE_STR_COLS column to
+            its cleaned value
+        """
+        cols = [c for c in self._SAFE_STR_COLS if c in df.columns]
+        if not cols:
+            return [{} for _ in range(len(df))]
+        # fillna before astype so missing cells never become a 'nan'/'<NA>'
+        # literal, whichever string dtype backs the frame
+        clean = df[cols].fillna('').astype(str).apply(lambda s: s.str.strip())
+        clean = clean.mask(clean.isin(('nan', 'None', 'NaN', 'NaT')), '')
+        return clean.to_dict('records')
+
     def parse_name(self, last_name: Optional[str], first_middle: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
         """
         Parse candidate name components.
@@ -120,7 +249,36 @@ class MarylandTransformer:
             full_name = "Unknown Candidate"
         
         return full_name, first_name, last
-    
+
+    def parse_names(self, df: pd.DataFrame) -> List[Tuple[str, Optional[str], str]]:
+        """
+        Vectorized parse_name over the two name columns.
+
+        Strips, splits and joins the columns with pandas string ops in a
+        few C-level passes instead of per-row Python splitting.
+
+        Args:
+            df: Raw candidate DataFrame
+
+        Returns:
+            List of (full_name, first_name, last_name) tuples per row
+        """
+        def col(name: str) -> pd.Series:
+            if name in df.columns:
+                s = df[name].fillna('').astype(str).str.strip()
+                return s.mask(s == 'nan', '')
+            return pd.Series([''] * len(df), index=df.index)
+
+        last = col('candidate_ballot_last_name_and_suffix')
+        first_middle = col('candidate_first_name_and_middle_name')
+        first = first_middle.str.split(n=1).str[0]
+        full = (first_middle + ' ' + last).str.strip()
+        full = full.mask(full == '', 'Unknown Candidate')
+        return [
+            (fu, fi if isinstance(fi, str) and fi else None, la)
+            for fu, fi, la in zip(full, first, last)
+        ]
+
     def parse_district(self, contest_district: Optional[str]) -> Optional[str]:
         """
         Extract district number from contest district string.
@@ -135,50 +293,119 @@ class MarylandTransformer:
             return None
         
         # Look for patterns like "District 1", "District 01", etc.
-        match = re.search(r'district\s+(\d+)', contest_district.lower())
+        match = _DISTRICT_NUM_RE.search(contest_district)
         if match:
             return match.group(1)
-        
+
         # Look for patterns like "1st District", "2nd District", etc.
-        match = re.search(r'(\d+)(?:st|nd|rd|th)\s+district', contest_district.lower())
+        match = _ORDINAL_DISTRICT_RE.search(contest_district)
         if match:
             return match.group(1)
         
         return None
     
-    def generate_ocd_id(self, office_level: OfficeLevel, office_name: str, district: Optional[str]) -> Optional[str]:
+    def generate_ocd_id(self, office_level: OfficeLevel, office_lower: str, district: Optional[str]) -> Optional[str]:
         """
         Generate Open Civic Data division ID.
-        
+
         Args:
             office_level: Level of office
-            office_name: Name of office
+            office_lower: Lowercased office name (lower once in the caller;
+                the branches here test it up to five times)
             district: District number
-            
+
         Returns:
             OCD division ID or None
         """
         base = "ocd-division/country:us/state:md"
-        
+
         if office_level == OfficeLevel.FEDERAL:
-            if "senat" in office_name.lower():
+            if "senat" in office_lower:
                 return base
-            elif "congress" in office_name.lower() or "representative" in office_name.lower():
+            elif "congress" in office_lower or "representative" in office_lower:
                 if district:
                     return f"{base}/cd:{district}"
-        
+
         elif office_level == OfficeLevel.STATE:
-            if "governor" in office_name.lower() or "comptroller" in office_name.lower() or "attorney" in office_name.lower():
+            if "governor" in office_lower or "comptroller" in office_lower or "attorney" in office_lower:
                 return base
-            elif "state senator" in office_name.lower():
+            elif "state senator" in office_lower:
                 if district:
                     return f"{base}/sldl:{district}"
-            elif "delegate" in office_name.lower():
+            elif "delegate" in office_lower:
                 if district:
                     return f"{base}/sldl:{district}"
-        
+
         return None
-    
+
+    def parse_districts(self, contest_col: pd.Series) -> List[Optional[str]]:
+        """
+        Vectorized parse_district over a whole column.
+
+        Runs both district patterns as str.extract passes (primary first,
+        ordinal filling the gaps) instead of regexing per row.
+
+        Args:
+            contest_col: Raw contest district column
+
+        Returns:
+            List of district numbers (or None), aligned with the column
+        """
+        s = contest_col.fillna('').astype(str)
+        primary = s.str.extract(_DISTRICT_NUM_RE, expand=False)
+        ordinal = s.str.extract(_ORDINAL_DISTRICT_RE, expand=False)
+        merged = primary.fillna(ordinal)
+        return list(merged.to_numpy(dtype=object, na_value=None))
+
+    def generate_ocd_ids(self, office_names: pd.Series,
+                         levels: List[OfficeLevel],
+                         districts: List[Optional[str]]) -> List[Optional[str]]:
+        """
+        Generate OCD division IDs for the whole frame in one pass.
+
+        Replays generate_ocd_id's branch cascade as np.select over boolean
+        masks of the lowercased office column; np.select takes the first
+        true condition, so the masks carry the elif guards explicitly.
+
+        Args:
+            office_names: Raw office_name column
+            levels: Precomputed levels from classify_office_levels
+            districts: Precomputed district numbers, aligned with the column
+
+        Returns:
+            List of OCD division IDs (or None), aligned with the column
+        """
+        base = "ocd-division/country:us/state:md"
+        lower = office_names.fillna('').astype(str).str.lower()
+
+        n = len(levels)
+        is_federal = np.fromiter((lv is OfficeLevel.FEDERAL for lv in levels), bool, n)
+        is_state = np.fromiter((lv is OfficeLevel.STATE for lv in levels), bool, n)
+        has_district = np.fromiter((bool(d) for d in districts), bool, n)
+
+        senate = lower.str.contains('senat', regex=False).to_numpy()
+        congress = lower.str.contains('congress|representative', regex=True).to_numpy()
+        governor = lower.str.contains('governor|comptroller|attorney', regex=True).to_numpy()
+        state_senator = lower.str.contains('state senator', regex=False).to_numpy()
+        delegate = lower.str.contains('delegate', regex=False).to_numpy()
+
+        dist = pd.Series(districts, dtype=object).fillna('')
+        cd_ids = (base + "/cd:" + dist).to_numpy(dtype=object)
+        sldl_ids = (base + "/sldl:" + dist).to_numpy(dtype=object)
+
+        ocd = np.select(
+            [
+                is_federal & senate,
+                is_federal & congress & has_district,
+                is_state & governor,
+                is_state & ~governor & state_senator & has_district,
+                is_state & ~governor & ~state_senator & delegate & has_district,
+            ],
+            [base, cd_ids, base, sldl_ids, sldl_ids],
+            default=None
+        )
+        return list(ocd)
+
     def parse_filing_date(self, filing_type_date: Optional[str]) -> Tuple[Optional[str], Optional[datetime]]:
         """
         Parse filing type and date from combined field.
@@ -204,7 +431,7 @@ class MarylandTransformer:
             filing_type = "appointment"
         
         # Try to extract date (MM/DD/YYYY or similar)
-        date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', filing_type_date)
+        date_match = _FILING_DATE_RE.search(filing_type_date)
         if date_match:
             try:
                 month, day, year = date_match.groups()
@@ -213,7 +440,39 @@ class MarylandTransformer:
                 logger.warning(f"Could not parse date from: {filing_type_date}")
         
         return filing_type, filing_date
-    
+
+    def parse_filing_dates(self, filing_col: pd.Series) -> List[Tuple[Optional[str], Optional[datetime]]]:
+        """
+        Vectorized parse_filing_date over a whole column.
+
+        Extracts the date substring and parses it with pd.to_datetime in
+        one C-level pass, and classifies the filing type with three
+        str.contains passes, instead of regexing and constructing a
+        datetime per row.
+
+        Args:
+            filing_col: Raw filing_type_and_date column
+
+        Returns:
+            List of (filing_type, filing_date) tuples aligned with the column
+        """
+        s = filing_col.fillna('').astype(str)
+        dates = pd.to_datetime(
+            s.str.extract(r'(\d{1,2}/\d{1,2}/\d{4})', expand=False),
+            format='%m/%d/%Y', errors='coerce'
+        )
+        types = np.select(
+            [s.str.contains('petition', case=False, na=False),
+             s.str.contains('fee', case=False, na=False),
+             s.str.contains('appointment', case=False, na=False)],
+            ['petition', 'fee', 'appointment'],
+            default=None
+        )
+        return [
+            (ftype, None if pd.isna(fdate) else fdate)
+            for ftype, fdate in zip(types, dates.dt.to_pydatetime())
+        ]
+
     def parse_address(self, address: Optional[str], city_state_zip: Optional[str]) -> Dict[str, Optional[str]]:
         """
         Parse address components.
@@ -246,42 +505,69 @@ class MarylandTransformer:
                 result['city'] = parts[0].strip()
             
             # Look for ZIP code
-            zip_match = re.search(r'\b(\d{5})(?:-\d{4})?\b', city_state_zip_str)
+            zip_match = _ZIP_RE.search(city_state_zip_str)
             if zip_match:
                 result['zip'] = zip_match.group(1)
         
         return result
     
-    def transform_row(self, row: pd.Series) -> Optional[Dict[str, Any]]:
+    def transform_row(self, row: Dict[str, Any],
+                      office_level: Optional[OfficeLevel] = None,
+                      filing: Optional[Tuple[Optional[str], Optional[datetime]]] = None,
+                      clean: Optional[Dict[str, str]] = None,
+                      district_ocd: Optional[Tuple[Optional[str], Optional[str]]] = None,
+                      name: Optional[Tuple[str, Optional[str], str]] = None
+                      ) -> Optional[Dict[str, Any]]:
         """
         Transform a single row from Maryland CSV to normalized format.
-        
+
         Args:
-            row: Pandas Series representing one candidate
-            
+            row: Dict of one candidate's CSV fields (column -> value)
+            office_level: Precomputed level from classify_office_levels;
+                determined from the row when not given
+            filing: Precomputed (filing_type, filing_date) from
+                parse_filing_dates; parsed from the row when not given
+            clean: Precomputed free-text values from clean_string_columns;
+                cleaned per cell with safe_str when not given
+            district_ocd: Precomputed (district, ocd_division_id) pair;
+                derived from the row when not given
+            name: Precomputed (full_name, first_name, last_name) from
+                parse_names; parsed from the row when not given
+
         Returns:
             Dictionary with transformed data or None if error
         """
+        if clean is not None:
+            get_str = lambda col: clean.get(col, '')
+        else:
+            get_str = lambda col: self.safe_str(row.get(col))
         try:
             # Parse name
-            full_name, first_name, last_name = self.parse_name(
-                row.get('candidate_ballot_last_name_and_suffix'),
-                row.get('candidate_first_name_and_middle_name')
-            )
+            if name is None:
+                name = self.parse_name(
+                    row.get('candidate_ballot_last_name_and_suffix'),
+                    row.get('candidate_first_name_and_middle_name')
+                )
+            full_name, first_name, last_name = name
             
             # Get office information - handle non-string values
             office_name_raw = row.get('office_name', '')
             office_name = str(office_name_raw).strip() if office_name_raw is not None and str(office_name_raw) != 'nan' else ''
-            office_level = self.determine_office_level(office_name)
+            if office_level is None:
+                office_level = self.determine_office_level(office_name)
             
-            # Parse district
-            district = self.parse_district(row.get('contest_run_by_district_name_and_number'))
-            
-            # Generate OCD ID
-            ocd_id = self.generate_ocd_id(office_level, office_name, district)
+            # Parse district and generate OCD ID (lowercase once for all the
+            # OCD branch tests) unless both came precomputed
+            if district_ocd is None:
+                district = self.parse_district(row.get('contest_run_by_district_name_and_number'))
+                ocd_id = self.generate_ocd_id(office_level, office_name.lower(), district)
+            else:
+                district, ocd_id = district_ocd
             
             # Parse filing information
-            filing_type, filing_date = self.parse_filing_date(row.get('filing_type_and_date'))
+            if filing is None:
+                filing = self.parse_filing_date(row.get('filing_type_and_date'))
+            filing_type, filing_date = filing
             
             # Parse address
             address_parts = self.parse_address(
@@ -299,61 +585,51 @@ class MarylandTransformer:
                 'full_name': full_name,
                 'first_name': first_name,
                 'last_name': last_name,
-                'party': self.safe_str(row.get('office_political_party')),
+                'party': get_str('office_political_party'),
                 'office_level': office_level.value,
                 'office_name': office_name,
                 'state': 'MD',
                 'district_number': district,
                 'ocd_division_id': ocd_id,
                 'election_year': ELECTION_YEAR,
-                'gender': self.safe_str(row.get('candidate_gender')),
-                'jurisdiction': self.safe_str(row.get('candidate_residential_jurisdiction')),
-                'committee_name': self.safe_str(row.get('committee_name')),
-                'website': self.safe_str(row.get('website')),
-                'email': self.safe_str(row.get('email')),
+                'gender': get_str('candidate_gender'),
+                'jurisdiction': get_str('candidate_residential_jurisdiction'),
+                'committee_name': get_str('committee_name'),
+                'website': get_str('website'),
+                'email': get_str('email'),
                 'status': status,
                 'is_withdrawn': is_withdrawn,
                 'source': SOURCE_NAME,
-                'raw_ref': row.to_dict()
+                'raw_ref': row
             }
             
             # Create contact info
             contact_info = {
-                'phone_primary': self.safe_str(row.get('public_phone')),
+                'phone_primary': get_str('public_phone'),
                 'mailing_address_street': address_parts['street'],
                 'mailing_address_city': address_parts['city'],
                 'mailing_address_state': address_parts['state'],
                 'mailing_address_zip': address_parts['zip'],
-                'residential_jurisdiction': self.safe_str(row.get('candidate_residential_jurisdiction'))
+                'residential_jurisdiction': get_str('candidate_residential_jurisdiction')
             }
             
-            # Create social media info
-            social_media = []
-            facebook = self.safe_str(row.get('facebook'))
-            if facebook:
-                social_media.append({
-                    'platform': 'facebook',
-                    'handle_or_url': facebook
-                })
-            x_twitter = self.safe_str(row.get('x'))
-            if x_twitter:
-                social_media.append({
-                    'platform': 'x',
-                    'handle_or_url': x_twitter
-                })
-            other_social = self.safe_str(row.get('other'))
-            if other_social:
-                social_media.append({
-                    'platform': 'other',
-                    'handle_or_url': other_social
-                })
-            
+            # Create social media info; dicts are only allocated for
+            # platforms the row actually has. The nested-dict shape itself
+            # stays: deduplication and the Supabase clients index these by
+            # key, and PostgREST wants dicts at the wire anyway, so slotted
+            # records would just pay the conversion back at the boundary.
+            social_media = [
+                {'platform': platform, 'handle_or_url': handle}
+                for platform in self._SOCIAL_PLATFORMS
+                if (handle := get_str(platform))
+            ]
+
             # Create filing info
             filing_info = {
                 'filing_type': filing_type,
                 'filing_date': filing_date,
                 'filing_status': status,
-                'additional_info': self.safe_str(row.get('additional_information')),
+                'additional_info': get_str('additional_information'),
                 'source': SOURCE_NAME
             }
             
@@ -365,9 +641,10 @@ class MarylandTransformer:
             }
             
         except Exception as e:
-            logger.error(f"Error transforming row: {e}")
-            logger.debug(f"Row data: {row.to_dict()}")
-            self.error_count += 1
+            # %-style args defer formatting (and the row repr) until the
+            # level check has passed
+            logger.error("Error transforming row: %s", e)
+            logger.debug("Row data: %s", row)
             return None
     
     def transform_dataframe(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -381,31 +658,107 @@ class MarylandTransformer:
             List of transformed candidate dictionaries
         """
         logger.info(f"Starting transformation of {len(df)} candidates")
-        
+
+        # Classify the whole office_name column up front in vectorized
+        # passes; transform_row falls back to per-row classification when
+        # the column is absent
+        levels: List[Optional[OfficeLevel]]
+        if 'office_name' in df.columns:
+            levels = self.classify_office_levels(df['office_name'])
+        else:
+            levels = [None] * len(df)
+
+        # Likewise parse the filing column once, vectorized
+        filings: List[Optional[Tuple[Optional[str], Optional[datetime]]]]
+        if 'filing_type_and_date' in df.columns:
+            filings = self.parse_filing_dates(df['filing_type_and_date'])
+        else:
+            filings = [None] * len(df)
+
+        # And clean the free-text columns column-wise
+        cleaned = self.clean_string_columns(df)
+
+        # District numbers extract vectorized, then the OCD ids derived
+        # from them are built for the whole frame in one np.select pass
+        contest_col = 'contest_run_by_district_name_and_number'
+        if contest_col in df.columns:
+            districts = self.parse_districts(df[contest_col])
+        else:
+            districts = [None] * len(df)
+        if 'office_name' in df.columns:
+            ocd_ids = self.generate_ocd_ids(df['office_name'], levels, districts)
+        else:
+            ocd_ids = [None] * len(df)
+        district_ocds = list(zip(districts, ocd_ids))
+
+        # Name columns stripped, split and joined vectorized
+        names = self.parse_names(df)
+
+        # Column-major extraction: one to_numpy per column, then plain dicts
+        # built from the object arrays. Beyond skipping pandas' per-cell
+        # access, na_value=None maps NaN to None so raw_ref serializes
+        # cleanly and the .get() checks in transform_row see real Nones.
+        # Each row dict is aliased as its own raw_ref rather than copied or
+        # lazily rebuilt - staging serializes raw_ref for every row anyway
+        # (stage_candidates runs before deduplication, so even rows that
+        # dedup later drops have already written theirs), which also rules
+        # out thunk-style deferral keyed on dedup survival
+        arrs = [(col, df[col].to_numpy(dtype=object, na_value=None))
+                for col in df.columns]
+        records = [{col: arr[i] for col, arr in arrs} for i in range(len(df))]
+
+        # Counters are settled once per batch from the list lengths rather
+        # than incremented per row; this keeps the loop increment-free and
+        # stays correct under the parallel chunk path
         transformed = []
-        for idx, row in df.iterrows():
-            result = self.transform_row(row)
+        for row, level, filing, clean, district_ocd, name in zip(
+                records, levels, filings, cleaned, district_ocds, names):
+            result = self.transform_row(row, office_level=level, filing=filing,
+                                        clean=clean, district_ocd=district_ocd,
+                                        name=name)
             if result:
                 transformed.append(result)
-                self.processed_count += 1
-            
-            if (idx + 1) % 100 == 0:
-                logger.info(f"Processed {idx + 1}/{len(df)} candidates")
-        
+
+        self.processed_count += len(transformed)
+        self.error_count += len(df) - len(transformed)
+
         logger.info(f"Transformation complete: {self.processed_count} successful, {self.error_count} errors")
-        
+
         return transformed
 
 
+# Below this many rows, worker startup and frame pickling cost more than
+# the parallel transform saves
+_PARALLEL_MIN_ROWS = 5000
+
+
+def _transform_chunk(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Worker for the parallel path; module-level so it pickles."""
+    return MarylandTransformer().transform_dataframe(df)
+
+
 def transform_maryland_data(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """
     Main function to transform Maryland data.
-    
+
+    Large frames are split across a joblib process pool when joblib is
+    installed - row transformation has no cross-row state, so chunks
+    merge by simple concatenation. Small frames (and installs without
+    joblib) run the single-process path.
+
     Args:
         df: DataFrame from Maryland BOE
-        
+
     Returns:
         List of transformed candidate dictionaries
     """
+    n_jobs = os.cpu_count() or 1
+    if HAVE_JOBLIB and n_jobs > 1 and len(df) >= _PARALLEL_MIN_ROWS:
+        chunks = [c for c in np.array_split(df, n_jobs) if len(c)]
+        results = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_transform_chunk)(chunk) for chunk in chunks
+        )
+        return list(itertools.chain.from_iterable(results))
+
     transformer = MarylandTransformer()
     return transformer.transform_dataframe(df)
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Configuration management for North Carolina candidate update system."""
 
+import functools
 import os
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -58,8 +60,17 @@ REQUEST_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
 
 # Logging Configuration
+@functools.lru_cache(maxsize=None)
 def setup_logging(name: Optional[str] = None) -> logging.Logger:
-    """Set up logging configuration."""
+    """
+    Set up logging configuration.
+
+    Cached per name, so each importing module pays for handler setup
+    exactly once. The file handler opens its file lazily on the first
+    record instead of at import, and sits behind a MemoryHandler so disk
+    writes happen in batches of up to 1000 records rather than one
+    syscall each (ERROR and above flush immediately).
+    """
     logger = logging.getLogger(name or __name__)
 
     if not logger.handlers:
@@ -67,9 +78,9 @@ def setup_logging(name: Optional[str] = None) -> logging.Logger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(getattr(logging, LOG_LEVEL))
 
-        # File handler
+        # File handler (delay=True defers the open until the first write)
         log_file = LOG_DIR / f"nc_update_{Path(__file__).stem}.log"
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
 
         # Formatter
@@ -79,8 +90,12 @@ def setup_logging(name: Optional[str] = None) -> logging.Logger:
         console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
 
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.ERROR, target=file_handler
+        )
+
         logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        logger.addHandler(buffered_handler)
         logger.setLevel(logging.DEBUG)
 
     return logger
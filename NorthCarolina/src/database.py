@@ -1,5 +1,6 @@
 """Database operations for North Carolina candidates."""
 
+import operator
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -17,6 +18,13 @@ from .config import SOURCE_STATE, SOURCE_NAME, DRY_RUN
 
 logger = logging.getLogger(__name__)
 
+# One C-level itemgetter pulls the candidate columns per row instead of a
+# dozen separate .get() hash probes; select('*') guarantees the keys exist
+_CANDIDATE_FIELDS = operator.itemgetter(
+    'id', 'full_name', 'first_name', 'last_name', 'party', 'office_level',
+    'office_name', 'district_id', 'ocd_division_id', 'election_year', 'status'
+)
+
 
 class NorthCarolinaSupabaseClient(BaseSupabaseClient):
     """North Carolina-specific database operations."""
@@ -26,7 +34,10 @@ class NorthCarolinaSupabaseClient(BaseSupabaseClient):
         super().__init__()
         self.source_state = SOURCE_STATE
 
-    def insert_candidate(self, candidate_data: Dict[str, Any]) -> Optional[UUID]:
+    # The base __init__ binds the public method names to the _real/_dry
+    # variants on the instance, so the NC-specific behavior has to live on
+    # the underscore variants for the swap to pick it up.
+    def _insert_candidate_real(self, candidate_data: Dict[str, Any]) -> Optional[UUID]:
         """
         Insert a new North Carolina candidate.
 
@@ -40,7 +51,25 @@ class NorthCarolinaSupabaseClient(BaseSupabaseClient):
         candidate_data['candidate']['source_state'] = SOURCE_STATE
 
         # Use parent class insert method
-        return super().insert_candidate(candidate_data)
+        return super()._insert_candidate_real(candidate_data)
+
+    def _insert_candidates_bulk_real(self, candidates_data: List[Dict[str, Any]],
+                                     chunk_size: int = 500) -> int:
+        """
+        Insert new North Carolina candidates in bulk.
+
+        Args:
+            candidates_data: List of candidate data dictionaries
+            chunk_size: Candidates per request
+
+        Returns:
+            Number of candidates inserted
+        """
+        # Stamp source_state so the bulk records land as NC rows
+        for candidate_data in candidates_data:
+            candidate_data['candidate']['source_state'] = SOURCE_STATE
+
+        return super()._insert_candidates_bulk_real(candidates_data, chunk_size)
 
     def get_nc_candidates(self) -> List[Dict[str, Any]]:
         """
@@ -83,42 +112,52 @@ class NorthCarolinaSupabaseClient(BaseSupabaseClient):
             logger.info("DRY RUN: Would fetch existing North Carolina candidates")
             return []
 
+        # Reusing Maryland's model
+        from Maryland.src.models import DatabaseCandidate
+
+        def build(row: Dict[str, Any]) -> DatabaseCandidate:
+            (candidate_id, full_name, first_name, last_name, party,
+             office_level, office_name, district_id, ocd_division_id,
+             election_year, status) = _CANDIDATE_FIELDS(row)
+            return DatabaseCandidate.from_trusted_row(
+                id=candidate_id,
+                full_name=full_name,
+                first_name=first_name,
+                last_name=last_name,
+                party=party,
+                office_level=office_level,
+                office_name=office_name,
+                district_id=district_id,
+                ocd_division_id=ocd_division_id,
+                election_year=election_year,
+                status=status,
+                is_withdrawn=row.get('is_withdrawn', False),
+                external_ids=[
+                    {'authority': id_row['authority'], 'value': id_row['id_value']}
+                    for id_row in row.get('candidate_identifiers') or []
+                ]
+            )
+
         try:
-            # Only get North Carolina candidates for deduplication
-            result = self.client.table('candidates').select(
-                "*, candidate_identifiers(authority, id_value)"
-            ).eq('election_year', election_year).eq('source_state', SOURCE_STATE).execute()
-
-            # Convert to DatabaseCandidate objects (reusing Maryland's model)
-            from Maryland.src.models import DatabaseCandidate
-
-            candidates = []
-            for row in result.data:
-                # Extract external IDs
-                external_ids = []
-                if 'candidate_identifiers' in row:
-                    for id_row in row['candidate_identifiers']:
-                        external_ids.append({
-                            'authority': id_row['authority'],
-                            'value': id_row['id_value']
-                        })
-
-                candidate = DatabaseCandidate(
-                    id=row['id'],
-                    full_name=row['full_name'],
-                    first_name=row.get('first_name'),
-                    last_name=row.get('last_name'),
-                    party=row.get('party'),
-                    office_level=row.get('office_level'),
-                    office_name=row.get('office_name'),
-                    district_id=row.get('district_id'),
-                    ocd_division_id=row.get('ocd_division_id'),
-                    election_year=row.get('election_year'),
-                    status=row.get('status'),
-                    is_withdrawn=row.get('is_withdrawn', False),
-                    external_ids=external_ids
-                )
-                candidates.append(candidate)
+            # Page through the NC candidates instead of pulling the whole
+            # table in one response; peak memory is one page of rows
+            candidates: List[Any] = []
+            page_size = 1000
+            start = 0
+            while True:
+                result = self.client.table('candidates').select(
+                    "*, candidate_identifiers(authority, id_value)"
+                ).eq('election_year', election_year).eq(
+                    'source_state', SOURCE_STATE
+                ).range(start, start + page_size - 1).execute()
+
+                batch = result.data
+                if not batch:
+                    break
+                candidates.extend(build(row) for row in batch)
+                if len(batch) < page_size:
+                    break
+                start += page_size
 
             logger.info(f"Found {len(candidates)} existing North Carolina candidates")
             return candidates
@@ -3,6 +3,7 @@
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
@@ -65,16 +66,25 @@ def run_nc_update() -> UpdateStatistics:
             logger.warning("No candidates found in North Carolina data")
             return stats
 
+        # Step 3 runs first: the database client is needed to kick off
+        # the STEP 6 fetch in the background
+        logger.info("\n🗄️ STEP 3: Initializing database connection...")
+        db = NorthCarolinaSupabaseClient()
+
+        # The existing-candidates fetch (STEP 6) doesn't depend on the
+        # transform output, so the HTTP round-trips overlap the CPU-bound
+        # transform instead of running after it
+        executor = ThreadPoolExecutor(max_workers=1)
+        existing_future = executor.submit(
+            db.get_existing_nc_candidates, ELECTION_YEAR
+        )
+
         # Step 2: Transform data to normalized format
         logger.info("\n🔄 STEP 2: Transforming data...")
         transformer = NorthCarolinaTransformer()
         transformed_candidates = transformer.transform_batch(raw_df)
         logger.info(f"✅ Transformed {len(transformed_candidates)} candidates")
 
-        # Step 3: Initialize database client
-        logger.info("\n🗄️ STEP 3: Initializing database connection...")
-        db = NorthCarolinaSupabaseClient()
-
         # Step 4: Create ingest run
         logger.info("\n📝 STEP 4: Creating ingest run...")
         ingest_run_id = db.create_ingest_run(stats.total_raw_records)
@@ -85,10 +95,11 @@ def run_nc_update() -> UpdateStatistics:
         stats.total_staged = db.stage_candidates(transformed_candidates)
         logger.info(f"✅ Staged {stats.total_staged} candidates")
 
-        # Step 6: Get existing NC candidates for deduplication
+        # Step 6: Collect the existing NC candidates fetched in the
+        # background (NC-only - no cross-state deduplication)
         logger.info("\n🔍 STEP 6: Fetching existing North Carolina candidates...")
-        # Only get NC candidates - no cross-state deduplication
-        existing_candidates = db.get_existing_nc_candidates(ELECTION_YEAR)
+        existing_candidates = existing_future.result()
+        executor.shutdown()
         logger.info(f"✅ Found {len(existing_candidates)} existing North Carolina candidates")
 
         # Step 7: Deduplicate candidates
@@ -100,51 +111,33 @@ def run_nc_update() -> UpdateStatistics:
         logger.info(f"  - Updates: {len(categorized['update'])}")
         logger.info(f"  - Need review: {len(categorized['review'])}")
 
-        # Step 8: Process new candidates
+        # Step 8: Process new candidates (bulk insert, falls back to
+        # per-row inside the client on failure)
         logger.info("\n➕ STEP 8: Processing new candidates...")
-        for candidate_data in categorized['new']:
-            try:
-                candidate_id = db.insert_candidate(candidate_data)
-                if candidate_id:
-                    stats.new_candidates += 1
-
-                    # Log the new candidate
-                    logger.debug(f"  - New: {candidate_data['candidate']['full_name']} for {candidate_data['candidate']['office_name']}")
-
-            except Exception as e:
-                logger.error(f"Error inserting candidate {candidate_data['candidate']['full_name']}: {e}")
-                stats.errors += 1
+        stats.new_candidates = db.insert_candidates_bulk(categorized['new'])
+        stats.errors += len(categorized['new']) - stats.new_candidates
 
         logger.info(f"✅ Inserted {stats.new_candidates} new candidates")
 
-        # Step 9: Process updates
+        # Step 9: Process updates (bulk upsert keyed by candidate id)
         logger.info("\n📝 STEP 9: Processing updates...")
-        for candidate_data in categorized['update']:
-            try:
-                match_info = candidate_data['match_info']
-                success = db.update_candidate(match_info['candidate_id'], candidate_data)
-                if success:
-                    stats.updated_candidates += 1
-
-                    # Log the update
-                    logger.debug(f"  - Updated: {candidate_data['candidate']['full_name']}")
-
-            except Exception as e:
-                logger.error(f"Error updating candidate: {e}")
-                stats.errors += 1
+        stats.updated_candidates = db.update_candidates_bulk(categorized['update'])
+        stats.errors += len(categorized['update']) - stats.updated_candidates
 
         logger.info(f"✅ Updated {stats.updated_candidates} existing candidates")
 
-        # Step 10: Handle review items
+        # Step 10: Handle review items (one log record for the whole
+        # block instead of a formatter/handler pass per candidate)
         if categorized['review']:
             logger.info(f"\n⚠️ STEP 10: {len(categorized['review'])} candidates need manual review")
-            logger.info("Review candidates:")
+            lines = []
             for candidate_data in categorized['review'][:10]:  # Show first 10
                 match_info = candidate_data.get('match_info', {})
-                logger.info(f"  - {candidate_data['candidate']['full_name']} "
-                          f"({candidate_data['candidate']['office_name']}) "
-                          f"~= {match_info.get('existing_name')} "
-                          f"({match_info.get('confidence', 0):.1f}%)")
+                lines.append(f"  - {candidate_data['candidate']['full_name']} "
+                             f"({candidate_data['candidate']['office_name']}) "
+                             f"~= {match_info.get('existing_name')} "
+                             f"({match_info.get('confidence', 0):.1f}%)")
+            logger.info("Review candidates:\n" + "\n".join(lines))
 
         # Calculate processing time
         stats.processing_time_seconds = time.time() - start_time
@@ -153,17 +146,19 @@ def run_nc_update() -> UpdateStatistics:
         logger.info("\n✅ STEP 11: Finalizing ingest run...")
         db.finalize_ingest_run(stats)
 
-        # Final summary
-        logger.info("\n" + "=" * 60)
-        logger.info("NORTH CAROLINA UPDATE COMPLETE")
-        logger.info(f"Source State: {SOURCE_STATE}")
-        logger.info(f"Election Year: {ELECTION_YEAR}")
-        logger.info(f"Total raw records: {stats.total_raw_records}")
-        logger.info(f"Total staged: {stats.total_staged}")
-        logger.info(f"New candidates: {stats.new_candidates}")
-        logger.info(f"Updated candidates: {stats.updated_candidates}")
-        logger.info(f"Errors: {stats.errors}")
-        logger.info(f"Processing time: {stats.processing_time_seconds:.2f} seconds")
+        # Final summary as a single record
+        logger.info(
+            "\n" + "=" * 60 + "\n"
+            "NORTH CAROLINA UPDATE COMPLETE\n"
+            f"Source State: {SOURCE_STATE}\n"
+            f"Election Year: {ELECTION_YEAR}\n"
+            f"Total raw records: {stats.total_raw_records}\n"
+            f"Total staged: {stats.total_staged}\n"
+            f"New candidates: {stats.new_candidates}\n"
+            f"Updated candidates: {stats.updated_candidates}\n"
+            f"Errors: {stats.errors}\n"
+            f"Processing time: {stats.processing_time_seconds:.2f} seconds"
+        )
 
         if DRY_RUN:
             logger.info("\n⚠️ DRY RUN - No actual database changes were made")
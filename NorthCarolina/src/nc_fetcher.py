@@ -1,11 +1,20 @@
 """Fetch candidate data from North Carolina State Board of Elections."""
 
+import json
 import pandas as pd
 import requests
-from typing import Optional
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
 from pathlib import Path
-from tenacity import retry, stop_after_attempt, wait_exponential
+from urllib3.util.retry import Retry
+
+# Optional: Arrow CSV reader parses the response stream in C threads
+# without first buffering the whole file as a Python string
+try:
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
 from .config import (
     NC_CSV_URL,
     REQUEST_TIMEOUT,
@@ -27,15 +36,51 @@ class NorthCarolinaDataFetcher:
         self.session.headers.update({
             'User-Agent': 'NorthCarolina-Candidate-Database-Updater/1.0'
         })
+        # Retry at the transport layer: failed connects and 5xx responses
+        # are retried with backoff before any bytes reach the parser,
+        # instead of re-downloading the whole CSV from scratch
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD']
+        ))
+        self.session.mount('https://', adapter)
         self.cache_file = DATA_DIR / f"nc_candidates_{ELECTION_YEAR}.csv"
+        # Sidecar recording the ETag/Last-Modified of the cached CSV so
+        # reruns can issue a conditional GET
+        self.meta_file = self.cache_file.with_suffix('.meta.json')
+
+    def _load_cache_meta(self) -> Dict[str, str]:
+        """Load the validators recorded for the cached CSV, if any."""
+        if self.meta_file.exists() and self.cache_file.exists():
+            try:
+                with open(self.meta_file) as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache metadata: {e}")
+        return {}
+
+    def _save_cache_meta(self, response: requests.Response) -> None:
+        """Record the response validators alongside the cached CSV."""
+        meta = {}
+        if response.headers.get('ETag'):
+            meta['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            meta['last_modified'] = response.headers['Last-Modified']
+        try:
+            with open(self.meta_file, 'w') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            logger.warning(f"Could not write cache metadata: {e}")
 
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     def _fetch_csv(self, url: str) -> pd.DataFrame:
         """
-        Fetch CSV from URL with retry logic.
+        Fetch CSV from URL with transport-level retries.
+
+        Sends a conditional GET when validators from a previous fetch are
+        on disk; a 304 Not Modified reuses the cached CSV instead of
+        re-downloading the unchanged S3 object.
 
         Args:
             url: URL to fetch
@@ -46,17 +91,45 @@ class NorthCarolinaDataFetcher:
         logger.info(f"Fetching North Carolina candidates from {url}")
 
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            headers = {}
+            meta = self._load_cache_meta()
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+            # Stream the body straight into the parser instead of holding
+            # the full file in memory twice (response.text + StringIO)
+            response = self.session.get(
+                url, timeout=REQUEST_TIMEOUT, stream=True, headers=headers
+            )
+            if response.status_code == 304:
+                logger.info("S3 object unchanged (304 Not Modified); using cached CSV")
+                df = pd.read_csv(self.cache_file)
+                logger.info(f"Loaded {len(df)} candidates from cache")
+                return df
             response.raise_for_status()
-
-            # Parse CSV
-            csv_content = StringIO(response.text)
-            df = pd.read_csv(csv_content, encoding='utf-8', on_bad_lines='skip')
+            # urllib3 yields the raw (possibly gzipped) stream unless told
+            # to decode it for us
+            response.raw.decode_content = True
+
+            if HAVE_PYARROW:
+                table = pacsv.read_csv(
+                    response.raw,
+                    parse_options=pacsv.ParseOptions(
+                        invalid_row_handler=lambda row: 'skip'
+                    )
+                )
+                df = table.to_pandas()
+            else:
+                df = pd.read_csv(response.raw, encoding='utf-8', on_bad_lines='skip')
 
             logger.info(f"Successfully fetched NC data: {len(df)} records")
 
-            # Cache the CSV locally
+            # Cache the CSV locally, plus the validators for the next
+            # conditional GET
             df.to_csv(self.cache_file, index=False)
+            self._save_cache_meta(response)
             logger.info(f"Cached data to {self.cache_file}")
 
             return df
@@ -110,6 +183,15 @@ class NorthCarolinaDataFetcher:
             col.strip().lower().replace(' ', '_').replace('/', '_')
             for col in df.columns
         ]
+
+        # Dictionary-encode the low-cardinality columns (~20 parties,
+        # 100 counties, a few hundred contests across 20k rows): each
+        # distinct value is stored once and the transformer's batch
+        # helpers classify per category instead of per row
+        for col in ('party_candidate', 'county_name', 'contest_name', 'election_dt'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
         return df
 
     def close(self):
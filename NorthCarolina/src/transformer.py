@@ -1,18 +1,100 @@
 """Transform North Carolina candidate data to normalized schema."""
 
+import functools
 import re
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from .models import NormalizedCandidate, OfficeLevel
-from .config import SOURCE_STATE, SOURCE_NAME, ELECTION_YEAR, setup_logging
+from .config import DEBUG, SOURCE_STATE, SOURCE_NAME, ELECTION_YEAR, setup_logging
 
 logger = setup_logging(__name__)
 
+# All three district patterns as one compiled alternation; IGNORECASE
+# replaces the per-call .upper() copy
+_DISTRICT_RE = re.compile(
+    r'DISTRICT\s+(\d+)|(\d+)(?:ST|ND|RD|TH)\s+DISTRICT|DIST\s+(\d+)',
+    re.IGNORECASE
+)
+
+
+# Scalar-path caches: contest and party strings repeat heavily (a 20k-row
+# file has a few hundred unique contest names), so the regex and
+# title-case work runs once per distinct value instead of once per row.
+# The class attributes these reference resolve at call time.
+
+@functools.lru_cache(maxsize=4096)
+def _office_level_of(contest_name: str) -> 'OfficeLevel':
+    """Cached office-level classification of one contest name."""
+    cls = NorthCarolinaTransformer
+    if cls._FED_RE.search(contest_name):
+        return OfficeLevel.FEDERAL
+    if cls._STATE_RE.search(contest_name):
+        return OfficeLevel.STATE
+    if cls._JUD_RE.search(contest_name):
+        return OfficeLevel.JUDICIAL
+    return OfficeLevel.LOCAL
+
+
+@functools.lru_cache(maxsize=4096)
+def _district_of(contest_name: str) -> Optional[str]:
+    """Cached district extraction from one contest name."""
+    match = _DISTRICT_RE.search(contest_name)
+    if match:
+        number = next(group for group in match.groups() if group)
+        return number.lstrip('0') or '0'  # Remove leading zeros
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _party_of(party: str) -> str:
+    """Cached party normalization of one raw (non-empty) party string."""
+    key = party.strip().upper()
+    return NorthCarolinaTransformer.PARTY_MAP.get(key, key.title())
+
 
 class NorthCarolinaTransformer:
     """Transforms NC BOE data to normalized candidate schema."""
 
+    # Contest keywords per office level; shared by the scalar checks and
+    # the vectorized column classification
+    FEDERAL_KEYWORDS = (
+        'US SENATE', 'US HOUSE', 'PRESIDENT', 'U.S. SENATE', 'U.S. HOUSE'
+    )
+    STATE_KEYWORDS = (
+        'NC SENATE', 'NC HOUSE', 'GOVERNOR', 'LIEUTENANT GOVERNOR',
+        'ATTORNEY GENERAL', 'STATE SENATE', 'STATE HOUSE',
+        'SECRETARY OF STATE', 'STATE TREASURER', 'STATE AUDITOR',
+        'COMMISSIONER OF AGRICULTURE', 'COMMISSIONER OF INSURANCE',
+        'COMMISSIONER OF LABOR', 'SUPERINTENDENT OF PUBLIC INSTRUCTION'
+    )
+    JUDICIAL_KEYWORDS = ('JUDGE', 'JUSTICE', 'COURT', 'DISTRICT ATTORNEY')
+
+    _FED_PAT = '|'.join(map(re.escape, FEDERAL_KEYWORDS))
+    _STATE_PAT = '|'.join(map(re.escape, STATE_KEYWORDS))
+    _JUD_PAT = '|'.join(map(re.escape, JUDICIAL_KEYWORDS))
+
+    # Compiled per-level alternations for the scalar path; one search each
+    # instead of a substring scan per keyword, IGNORECASE in place of the
+    # per-call .upper()
+    _FED_RE = re.compile(_FED_PAT, re.IGNORECASE)
+    _STATE_RE = re.compile(_STATE_PAT, re.IGNORECASE)
+    _JUD_RE = re.compile(_JUD_PAT, re.IGNORECASE)
+
+    # Common party mappings
+    PARTY_MAP = {
+        'DEM': 'Democratic',
+        'REP': 'Republican',
+        'LIB': 'Libertarian',
+        'GRE': 'Green',
+        'UNA': 'Unaffiliated',
+        'UNAFFILIATED': 'Unaffiliated',
+        'DEMOCRATIC': 'Democratic',
+        'REPUBLICAN': 'Republican',
+        'LIBERTARIAN': 'Libertarian',
+        'GREEN': 'Green',
+    }
+
     def __init__(self):
         self.state = SOURCE_STATE
         self.source = SOURCE_NAME
@@ -32,28 +114,40 @@ class NorthCarolinaTransformer:
         if not contest_name:
             return OfficeLevel.LOCAL
 
-        contest_upper = contest_name.upper()
+        return _office_level_of(contest_name)
 
-        # Federal offices
-        if any(x in contest_upper for x in ['US SENATE', 'US HOUSE', 'PRESIDENT', 'U.S. SENATE', 'U.S. HOUSE']):
-            return OfficeLevel.FEDERAL
+    def classify_office_levels(self, contest_col: pd.Series) -> List[OfficeLevel]:
+        """
+        Determine office levels for a whole contest column at once.
 
-        # State offices
-        if any(x in contest_upper for x in [
-            'NC SENATE', 'NC HOUSE', 'GOVERNOR', 'LIEUTENANT GOVERNOR',
-            'ATTORNEY GENERAL', 'STATE SENATE', 'STATE HOUSE',
-            'SECRETARY OF STATE', 'STATE TREASURER', 'STATE AUDITOR',
-            'COMMISSIONER OF AGRICULTURE', 'COMMISSIONER OF INSURANCE',
-            'COMMISSIONER OF LABOR', 'SUPERINTENDENT OF PUBLIC INSTRUCTION'
-        ]):
-            return OfficeLevel.STATE
+        One vectorized str.contains pass per level keyword alternation,
+        assigned in reverse precedence so federal overwrites state
+        overwrites judicial, matching determine_office_level.
 
-        # Judicial offices
-        if any(x in contest_upper for x in ['JUDGE', 'JUSTICE', 'COURT', 'DISTRICT ATTORNEY']):
-            return OfficeLevel.JUDICIAL
+        Args:
+            contest_col: Raw contest_name column
 
-        # Everything else is local
-        return OfficeLevel.LOCAL
+        Returns:
+            List of OfficeLevel values aligned with the column
+        """
+        if isinstance(contest_col.dtype, pd.CategoricalDtype):
+            # Classify each distinct contest once, then fan out via the
+            # category codes (-1 marks missing values)
+            per_cat = [
+                self.determine_office_level(str(cat), '')
+                for cat in contest_col.cat.categories
+            ]
+            return [
+                per_cat[code] if code >= 0 else OfficeLevel.LOCAL
+                for code in contest_col.cat.codes.to_numpy()
+            ]
+
+        upper = contest_col.fillna('').astype(str).str.upper()
+        levels = pd.Series(OfficeLevel.LOCAL, index=upper.index, dtype=object)
+        levels[upper.str.contains(self._JUD_PAT, regex=True, na=False)] = OfficeLevel.JUDICIAL
+        levels[upper.str.contains(self._STATE_PAT, regex=True, na=False)] = OfficeLevel.STATE
+        levels[upper.str.contains(self._FED_PAT, regex=True, na=False)] = OfficeLevel.FEDERAL
+        return list(levels)
 
     def extract_district_number(self, contest_name: str) -> Optional[str]:
         """
@@ -68,19 +162,43 @@ class NorthCarolinaTransformer:
         if not contest_name:
             return None
 
-        # Look for patterns like "DISTRICT 5", "DISTRICT 05", "5TH DISTRICT"
-        patterns = [
-            r'DISTRICT\s+(\d+)',
-            r'(\d+)(?:ST|ND|RD|TH)\s+DISTRICT',
-            r'DIST\s+(\d+)',
-        ]
+        # Patterns like "DISTRICT 5", "DISTRICT 05", "5TH DISTRICT" run as
+        # one alternation; the first non-empty group is the match
+        return _district_of(contest_name)
+
+    def extract_district_numbers(self, contest_col: pd.Series) -> List[Optional[str]]:
+        """
+        Extract district numbers for a whole contest column at once.
 
-        for pattern in patterns:
-            match = re.search(pattern, contest_name.upper())
-            if match:
-                return match.group(1).lstrip('0') or '0'  # Remove leading zeros
+        The three patterns run as one str.extract alternation; the first
+        non-empty group wins, matching extract_district_number's order.
 
-        return None
+        Args:
+            contest_col: Raw contest_name column
+
+        Returns:
+            List of district numbers (or None), aligned with the column
+        """
+        if isinstance(contest_col.dtype, pd.CategoricalDtype):
+            # One regex search per distinct contest, fanned out via codes
+            per_cat = [
+                self.extract_district_number(str(cat))
+                for cat in contest_col.cat.categories
+            ]
+            return [
+                per_cat[code] if code >= 0 else None
+                for code in contest_col.cat.codes.to_numpy()
+            ]
+
+        upper = contest_col.fillna('').astype(str).str.upper()
+        groups = upper.str.extract(
+            r'DISTRICT\s+(\d+)|(\d+)(?:ST|ND|RD|TH)\s+DISTRICT|DIST\s+(\d+)'
+        )
+        merged = groups[0].fillna(groups[1]).fillna(groups[2])
+        return [
+            (value.lstrip('0') or '0') if isinstance(value, str) else None
+            for value in merged.to_numpy(dtype=object, na_value=None)
+        ]
 
     def parse_name(self, row: Dict[str, Any]) -> tuple[str, Optional[str], Optional[str]]:
         """
@@ -106,6 +224,55 @@ class NorthCarolinaTransformer:
 
         return full_name, first, last
 
+    def parse_names_batch(self, df: pd.DataFrame) -> List[Tuple[str, str, str]]:
+        """
+        Build (full_name, first_name, last_name) for every row at once.
+
+        Joins the four name columns with vectorized concatenation; the
+        split/join pass collapses the doubled spaces empty parts leave
+        behind, like the filter(None) in parse_name.
+
+        Args:
+            df: Raw candidate DataFrame
+
+        Returns:
+            List of (full_name, first_name, last_name) tuples per row
+        """
+        def col(name: str) -> pd.Series:
+            if name in df.columns:
+                return df[name].fillna('').astype(str).str.strip()
+            return pd.Series([''] * len(df), index=df.index)
+
+        first = col('first_name')
+        middle = col('middle_name')
+        last = col('last_name')
+        suffix = col('name_suffix_lbl')
+        full = (first + ' ' + middle + ' ' + last + ' ' + suffix)
+        full = full.str.split().str.join(' ')
+        return list(zip(full, first, last))
+
+    def normalize_parties(self, party_col: pd.Series) -> List[Optional[str]]:
+        """
+        Normalize a whole party column at once.
+
+        Args:
+            party_col: Raw party_candidate column
+
+        Returns:
+            List of normalized party names (or None), aligned with the column
+        """
+        if isinstance(party_col.dtype, pd.CategoricalDtype):
+            # ~20 distinct parties: normalize each once, fan out via codes
+            per_cat = [self.normalize_party(str(cat)) for cat in party_col.cat.categories]
+            return [
+                per_cat[code] if code >= 0 else None
+                for code in party_col.cat.codes.to_numpy()
+            ]
+
+        s = party_col.fillna('').astype(str).str.strip().str.upper()
+        normalized = s.map(self.PARTY_MAP).fillna(s.str.title())
+        return [value or None for value in normalized]
+
     def normalize_party(self, party: str) -> Optional[str]:
         """
         Normalize party affiliation.
@@ -119,98 +286,118 @@ class NorthCarolinaTransformer:
         if not party or pd.isna(party):
             return None
 
-        party = str(party).strip().upper()
-
-        # Common party mappings
-        party_map = {
-            'DEM': 'Democratic',
-            'REP': 'Republican',
-            'LIB': 'Libertarian',
-            'GRE': 'Green',
-            'UNA': 'Unaffiliated',
-            'UNAFFILIATED': 'Unaffiliated',
-            'DEMOCRATIC': 'Democratic',
-            'REPUBLICAN': 'Republican',
-            'LIBERTARIAN': 'Libertarian',
-            'GREEN': 'Green',
-        }
-
-        return party_map.get(party, party.title())
-
-    def transform_candidate(self, row: Dict[str, Any], row_idx: int) -> Optional[Dict[str, Any]]:
+        return _party_of(str(party))
+
+    # String columns the row loop reads after cleaning; the batch path
+    # strips them once per column instead of once per field access
+    _CLEAN_COLS = (
+        'contest_name', 'county_name', 'election_dt', 'email', 'phone',
+        'office_phone', 'business_phone', 'street_address', 'city',
+        'state', 'zip_code'
+    )
+
+    def transform_candidate(self, row: Dict[str, Any], row_idx: int,
+                            prep: Optional[Tuple[Tuple[str, str, str], OfficeLevel,
+                                                 Optional[str], Optional[str]]] = None,
+                            clean: Optional[Dict[str, str]] = None
+                            ) -> Optional[Dict[str, Any]]:
         """
         Transform a single NC candidate row to normalized format.
 
         Args:
             row: Raw candidate data from CSV
             row_idx: Row index for tracking
+            prep: Precomputed (name_tuple, office_level, district_number,
+                party) from the vectorized batch helpers; derived from the
+                row when not given
+            clean: Pre-stripped values for _CLEAN_COLS from the batch
+                path; cleaned from the row when not given
 
         Returns:
             Dictionary with candidate and contact info, or None if invalid
         """
+        if clean is not None:
+            get_str = lambda col: clean.get(col, '')
+        else:
+            get_str = lambda col: str(row.get(col, '') or '').strip()
+
         try:
             # Parse name
-            full_name, first_name, last_name = self.parse_name(row)
+            if prep is not None:
+                (full_name, first_name, last_name), office_level, district_number, party = prep
+            else:
+                full_name, first_name, last_name = self.parse_name(row)
 
             if not full_name:
                 logger.warning(f"Row {row_idx}: Missing name, skipping")
                 return None
 
             # Get office info
-            contest_name = str(row.get('contest_name', '') or '').strip()
-            county = str(row.get('county_name', '') or '').strip()
+            contest_name = get_str('contest_name')
+            county = get_str('county_name')
 
             if not contest_name:
                 logger.warning(f"Row {row_idx}: Missing contest name for {full_name}, skipping")
                 return None
 
-            # Determine office level and district
-            office_level = self.determine_office_level(contest_name, county)
-            district_number = self.extract_district_number(contest_name)
+            if prep is None:
+                # Determine office level and district
+                office_level = self.determine_office_level(contest_name, county)
+                district_number = self.extract_district_number(contest_name)
 
-            # Parse party
-            party_candidate = str(row.get('party_candidate', '') or '').strip()
-            party = self.normalize_party(party_candidate)
+                # Parse party
+                party_candidate = str(row.get('party_candidate', '') or '').strip()
+                party = self.normalize_party(party_candidate)
 
             # External ID: use combination of name + contest + election_dt for uniqueness
-            election_dt = str(row.get('election_dt', '') or '').strip()
+            election_dt = get_str('election_dt')
             external_id = f"{full_name}_{contest_name}_{election_dt}".replace(' ', '_')
 
-            # Create normalized candidate
-            candidate = NormalizedCandidate(
-                full_name=full_name,
-                first_name=first_name if first_name else None,
-                last_name=last_name if last_name else None,
-                party=party,
-                office_level=office_level,
-                office_name=contest_name,
-                state=self.state,
-                district_number=district_number,
-                ocd_division_id=None,  # TODO: Map NC districts to OCD IDs
-                election_year=self.election_year,
-                gender=None,  # NC doesn't provide gender
-                jurisdiction=county if county else None,
-                committee_name=None,  # NC doesn't provide committee info in this file
-                website=None,  # NC doesn't provide website in this file
-                email=str(row.get('email', '') or '').strip() or None,
-                status='active',  # NC doesn't provide explicit status
-                is_withdrawn=False,
-                external_id_type='nc_candidate_id',
-                external_id_value=external_id,
-                source=self.source,
-                source_row_id=str(row_idx),
-                raw_ref=dict(row)  # Store raw data for reference
-            )
+            # Create normalized candidate as a plain dict whose keys mirror
+            # NormalizedCandidate; the inputs are already cleaned above, so
+            # running the pydantic validator per row (and then re-copying
+            # every field in model_dump) bought nothing
+            candidate = {
+                'full_name': full_name,
+                'first_name': first_name if first_name else None,
+                'last_name': last_name if last_name else None,
+                'party': party,
+                'office_level': office_level,
+                'office_name': contest_name,
+                'state': self.state,
+                'district_number': district_number,
+                'ocd_division_id': None,  # TODO: Map NC districts to OCD IDs
+                'election_year': self.election_year,
+                'gender': None,  # NC doesn't provide gender
+                'jurisdiction': county if county else None,
+                'committee_name': None,  # NC doesn't provide committee info in this file
+                'website': None,  # NC doesn't provide website in this file
+                'email': get_str('email') or None,
+                'status': 'active',  # NC doesn't provide explicit status
+                'is_withdrawn': False,
+                'external_id_type': 'nc_candidate_id',
+                'external_id_value': external_id,
+                'source': self.source,
+                'source_row_id': str(row_idx),
+                # The batch path builds a fresh dict per row from the column
+                # arrays and nothing else mutates it, so raw_ref can alias
+                # the row instead of copying every field again
+                'raw_ref': row if isinstance(row, dict) else dict(row)
+            }
+
+            if DEBUG:
+                # Debug runs still get the schema check, once per row
+                NormalizedCandidate.model_validate(candidate)
 
             # Build contact info
             contact_info = {
-                'phone_primary': str(row.get('phone', '') or '').strip() or None,
-                'phone_secondary': str(row.get('office_phone', '') or '').strip() or None,
-                'phone_business': str(row.get('business_phone', '') or '').strip() or None,
-                'mailing_address_street': str(row.get('street_address', '') or '').strip() or None,
-                'mailing_address_city': str(row.get('city', '') or '').strip() or None,
-                'mailing_address_state': str(row.get('state', '') or '').strip() or None,
-                'mailing_address_zip': str(row.get('zip_code', '') or '').strip() or None,
+                'phone_primary': get_str('phone') or None,
+                'phone_secondary': get_str('office_phone') or None,
+                'phone_business': get_str('business_phone') or None,
+                'mailing_address_street': get_str('street_address') or None,
+                'mailing_address_city': get_str('city') or None,
+                'mailing_address_state': get_str('state') or None,
+                'mailing_address_zip': get_str('zip_code') or None,
             }
 
             # Build filing info
@@ -224,7 +411,7 @@ class NorthCarolinaTransformer:
             }
 
             return {
-                'candidate': candidate.model_dump(),
+                'candidate': candidate,
                 'contact_info': contact_info,
                 'filing_info': filing_info
             }
@@ -245,9 +432,47 @@ class NorthCarolinaTransformer:
         """
         logger.info(f"Transforming {len(df)} NC candidates...")
 
+        # Vectorized column passes first: names, office levels, districts
+        # and parties are all computed frame-wide, leaving the loop only
+        # per-row assembly
+        names = self.parse_names_batch(df)
+        if 'contest_name' in df.columns:
+            levels = self.classify_office_levels(df['contest_name'])
+            districts = self.extract_district_numbers(df['contest_name'])
+        else:
+            levels = [OfficeLevel.LOCAL] * len(df)
+            districts = [None] * len(df)
+        if 'party_candidate' in df.columns:
+            parties = self.normalize_parties(df['party_candidate'])
+        else:
+            parties = [None] * len(df)
+
+        # Plain dicts from one to_numpy per column instead of iterrows();
+        # na_value=None keeps the '' or-defaults in transform_candidate
+        # working on missing cells
+        arrs = [(col, df[col].to_numpy(dtype=object, na_value=None))
+                for col in df.columns]
+        records = [{col: arr[i] for col, arr in arrs} for i in range(len(df))]
+
+        # Strip the string columns once per column; the loop reads these
+        # pre-cleaned values instead of str(x or '').strip() per field
+        clean_arrs = []
+        for col in self._CLEAN_COLS:
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # fillna('') needs object dtype; '' is rarely a category
+                series = series.astype(object)
+            clean_arrs.append(
+                (col, series.fillna('').astype(str).str.strip().to_numpy())
+            )
+        cleans = [{col: arr[i] for col, arr in clean_arrs} for i in range(len(df))]
+
         transformed = []
-        for idx, row in df.iterrows():
-            result = self.transform_candidate(row.to_dict(), idx)
+        for idx, (row, clean, prep) in enumerate(
+                zip(records, cleans, zip(names, levels, districts, parties))):
+            result = self.transform_candidate(row, idx, prep=prep, clean=clean)
             if result:
                 transformed.append(result)
 
@@ -1,46 +1,86 @@
 #!/usr/bin/env python3
 """
 Check if North Carolina 2026 candidate data is available.
-Sends SMS notification via Twilio with results every time it runs.
+Sends SMS notification via Twilio only when the result changes between runs.
 """
 
+import json
 import os
 import sys
 import requests
 from datetime import datetime
+from pathlib import Path
 from twilio.rest import Client
 
+# Sidecar recording the last observed (status, etag, size, available)
+# so unchanged cron ticks skip the Twilio call
+STATE_FILE = Path(__file__).parent / '.nc2026_state.json'
+
 
 def check_nc_2026_availability():
     """
     Check if NC 2026 candidate data is available.
 
     Returns:
-        tuple: (is_available: bool, file_size: int or None, message: str)
+        tuple: (is_available: bool, file_size: int or None, message: str,
+            state: dict with status_code/etag/size for change detection)
     """
     url = "https://s3.amazonaws.com/dl.ncsbe.gov/Elections/2026/Candidate%20Filing/Candidate_Listing_2026.csv"
 
     try:
         # Send HEAD request to check without downloading
         response = requests.head(url, timeout=10)
+        state = {
+            'status_code': response.status_code,
+            'etag': response.headers.get('ETag'),
+            'size': response.headers.get('Content-Length'),
+        }
 
         if response.status_code == 200:
             file_size = int(response.headers.get('Content-Length', 0))
 
             # Check if file has meaningful content (at least 1KB)
             if file_size > 1000:
-                return True, file_size, f"✅ NC 2026 data AVAILABLE! File size: {file_size:,} bytes"
+                return True, file_size, f"✅ NC 2026 data AVAILABLE! File size: {file_size:,} bytes", state
             else:
-                return False, file_size, f"⚠️ NC 2026 file exists but appears empty ({file_size} bytes)"
+                return False, file_size, f"⚠️ NC 2026 file exists but appears empty ({file_size} bytes)", state
 
         elif response.status_code == 404:
-            return False, None, "⏳ NC 2026 data not yet available (404)"
+            return False, None, "⏳ NC 2026 data not yet available (404)", state
 
         else:
-            return False, None, f"⚠️ Unexpected status code: {response.status_code}"
+            return False, None, f"⚠️ Unexpected status code: {response.status_code}", state
 
     except requests.exceptions.RequestException as e:
-        return False, None, f"❌ Error checking URL: {e}"
+        return False, None, f"❌ Error checking URL: {e}", {'error': str(e)}
+
+
+def load_state():
+    """
+    Load the state recorded by the previous run.
+
+    Returns:
+        dict: Previous state, or None when missing/unreadable
+    """
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(state):
+    """
+    Record the current state for the next run's comparison.
+
+    Args:
+        state: State dict to persist
+    """
+    try:
+        with open(STATE_FILE, 'w') as f:
+            json.dump(state, f)
+    except OSError as e:
+        print(f"⚠️  Could not write state file: {e}")
 
 
 def send_sms_notification(message):
@@ -162,10 +202,18 @@ def main():
     print("=" * 60)
 
     # Check if data is available
-    is_available, file_size, message = check_nc_2026_availability()
+    is_available, file_size, message, state = check_nc_2026_availability()
+    state['available'] = is_available
 
     print(f"\n{message}")
 
+    # Nothing changed since the last tick: skip the SMS entirely. The
+    # transition to "available" always differs from the stored state, so
+    # the alert (and the GitHub issue) still fires exactly once.
+    if state == load_state():
+        print("\n✅ No change since last check; skipping SMS")
+        sys.exit(0)
+
     # Prepare SMS message with status
     if is_available:
         sms_message = f"🚨 NC 2026 DATA AVAILABLE! Size: {file_size:,} bytes. Action required - check GitHub issue."
@@ -175,8 +223,11 @@ def main():
         sms_message = f"NC 2026 Check ({date_str}): Not yet available. Will check again in 2 days."
         print("\n⏳ NC 2026 data not yet available.")
 
-    # Always send SMS with results
+    # Send SMS only on state changes; persist the state on success so a
+    # failed send retries on the next tick
     sms_sent = send_sms_notification(sms_message)
+    if sms_sent:
+        save_state(state)
 
     # If data is available, also create GitHub issue (one-time)
     if is_available:
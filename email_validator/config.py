@@ -1,17 +1,41 @@
 """Configuration for email validation system."""
 
+import functools
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
 
-# API Keys
-HUNTER_API_KEY = os.getenv('HUNTER_API_KEY')
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once per process, importing dotenv only when needed.
+
+    Deferring this keeps entrypoints that never touch credentials
+    (e.g. FreeValidators-only runs) from paying the dotenv import and
+    file parse at module import time.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(env_path)
+
+
+# API key accessors (lazy so importing config stays cheap)
+def hunter_api_key():
+    """Return the Hunter.io API key, loading .env on first use."""
+    _load_env()
+    return os.getenv('HUNTER_API_KEY')
+
+
+def supabase_url():
+    """Return the Supabase project URL, loading .env on first use."""
+    _load_env()
+    return os.getenv('SUPABASE_URL')
+
+
+def supabase_key():
+    """Return the Supabase API key, loading .env on first use."""
+    _load_env()
+    return os.getenv('SUPABASE_KEY')
 
 # Hunter.io settings
 HUNTER_API_BASE = 'https://api.hunter.io/v2'
@@ -22,7 +46,9 @@ VALIDATION_SETTINGS = {
     'revalidation_days': 60,
     'min_confidence_to_mark_valid': 0.7,  # 70% confidence minimum
     'batch_size': 100,
+    'max_workers': 16,  # Concurrent validation threads per batch
     'use_hunter_for_all': True,  # Set to False to only use for emails that pass free checks
+    'skip_hunter_when_confident': True,  # Known-good domains with valid MX skip the paid check
 }
 
 # Free validation checks
@@ -1,11 +1,9 @@
 """Database operations for email validation."""
 
-import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from uuid import UUID
-from supabase import create_client, Client
-from config import SUPABASE_URL, SUPABASE_KEY, get_logger
+from config import supabase_url, supabase_key, get_logger
 
 logger = get_logger(__name__)
 
@@ -15,83 +13,205 @@ class EmailDatabase:
     
     def __init__(self):
         """Initialize database connection."""
-        if not SUPABASE_URL or not SUPABASE_KEY:
+        # Imported here so modules that never open a connection don't
+        # pay for the supabase import
+        from supabase import create_client
+
+        url, key = supabase_url(), supabase_key()
+        if not url or not key:
             raise ValueError("Supabase credentials not found in environment")
-        
-        self.client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+        self.client = create_client(url, key)
+        self._configure_transport()
         logger.info("Connected to Supabase")
+
+    def _configure_transport(self) -> None:
+        """Swap the PostgREST session for a pooled, HTTP/2 client.
+
+        Keep-alive connections amortize TCP+TLS setup across the many
+        small queries a validation run makes; HTTP/2 multiplexes them
+        on one connection when the h2 extra is installed. Left as the
+        default session if anything here fails.
+        """
+        import httpx
+
+        old_session = self.client.postgrest.session
+        for http2 in (True, False):
+            try:
+                self.client.postgrest.session = httpx.Client(
+                    base_url=old_session.base_url,
+                    headers=old_session.headers,
+                    timeout=old_session.timeout,
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=20,
+                                        max_connections=50),
+                )
+                old_session.close()
+                return
+            except ImportError:
+                # h2 not installed; retry plain HTTP/1.1 keep-alive
+                continue
+            except Exception as e:
+                logger.warning(f"Could not configure pooled transport: {e}")
+                self.client.postgrest.session = old_session
+                return
+
+    def close(self) -> None:
+        """Release the pooled connections."""
+        try:
+            self.client.postgrest.session.close()
+        except Exception as e:
+            logger.warning(f"Error closing database session: {e}")
     
+    def iter_candidate_emails(self, batch_size: int = 10000) -> Iterator[Tuple[str, str, str]]:
+        """Stream candidate emails with keyset pagination.
+
+        Pages by ordered id (gt last seen id) so only one batch of rows
+        is in memory at a time, regardless of table size. Reads the
+        stored contact_email_lower column so no per-row lowercasing
+        happens client-side; falls back to contact_email until the
+        generated column is deployed.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Tuples of (candidate_id, email, full_name)
+        """
+        email_col = 'contact_email_lower'
+        last_id = None
+        try:
+            while True:
+                query = self.client.table('candidates')\
+                    .select(f'id, {email_col}, full_name')\
+                    .not_.is_(email_col, 'null')\
+                    .order('id')\
+                    .limit(batch_size)
+                if last_id is not None:
+                    query = query.gt('id', last_id)
+
+                try:
+                    rows = query.execute().data
+                except Exception as e:
+                    if email_col == 'contact_email_lower' and last_id is None:
+                        logger.warning(f"contact_email_lower unavailable ({e}); "
+                                       f"falling back to contact_email")
+                        email_col = 'contact_email'
+                        continue
+                    raise
+
+                if not rows:
+                    return
+
+                legacy = email_col == 'contact_email'
+                for row in rows:
+                    email = row[email_col]
+                    if email:  # Double-check not null/empty
+                        if legacy:
+                            email = email.lower()
+                        yield (row['id'], email.strip(), row['full_name'])
+
+                last_id = rows[-1]['id']
+                if len(rows) < batch_size:
+                    return
+
+        except Exception as e:
+            logger.error(f"Error fetching candidate emails: {e}")
+            return
+
     def get_all_candidate_emails(self) -> List[Tuple[str, str, str]]:
         """Get all unique emails from candidates table.
-        
+
         Returns:
             List of tuples (candidate_id, email, full_name)
         """
-        try:
-            result = self.client.table('candidates')\
-                .select('id, contact_email, full_name')\
-                .not_.is_('contact_email', 'null')\
-                .execute()
-            
-            emails = []
-            for row in result.data:
-                if row['contact_email']:  # Double-check not null/empty
-                    emails.append((
-                        row['id'],
-                        row['contact_email'].strip().lower(),
-                        row['full_name']
-                    ))
-            
-            logger.info(f"Found {len(emails)} candidate emails")
-            return emails
-            
-        except Exception as e:
-            logger.error(f"Error fetching candidate emails: {e}")
-            return []
+        emails = list(self.iter_candidate_emails())
+        logger.info(f"Found {len(emails)} candidate emails")
+        return emails
     
     def get_unvalidated_emails(self) -> List[Tuple[str, str, str]]:
         """Get candidate emails that have never been validated.
-        
+
+        The anti-join runs server-side (get_unvalidated_candidate_emails,
+        see sql/email_validation_rpc.sql), so only the unvalidated rows
+        cross the wire instead of both full tables.
+
+        Returns:
+            List of tuples (candidate_id, email, full_name)
+        """
+        try:
+            result = self.client.rpc('get_unvalidated_candidate_emails')\
+                .execute()
+
+            # The RPC returns contact_email_lower, so no re-lowercasing
+            unvalidated = [
+                (row['candidate_id'],
+                 row['contact_email'].strip(),
+                 row['full_name'])
+                for row in result.data
+            ]
+
+            logger.info(f"Found {len(unvalidated)} unvalidated emails")
+            return unvalidated
+
+        except Exception as e:
+            logger.warning(f"RPC get_unvalidated_candidate_emails failed ({e}); "
+                           f"falling back to client-side diff")
+            return self._get_unvalidated_emails_fallback()
+
+    def _get_unvalidated_emails_fallback(self) -> List[Tuple[str, str, str]]:
+        """Client-side diff used when the RPC is not deployed yet.
+
         Returns:
             List of tuples (candidate_id, email, full_name)
         """
         try:
             # Get all candidate emails
             all_emails = self.get_all_candidate_emails()
-            
+
             # Get already validated emails
             validated_result = self.client.table('email_validations')\
                 .select('email_address')\
                 .execute()
-            
-            validated_emails = {row['email_address'].lower() 
+
+            # email_address is written pre-lowercased, and
+            # get_all_candidate_emails yields lowercased addresses, so
+            # the set diff needs no further normalization
+            validated_emails = {row['email_address']
                               for row in validated_result.data}
-            
+
             # Find unvalidated emails
             unvalidated = [
-                (cid, email, name) 
+                (cid, email, name)
                 for cid, email, name in all_emails
-                if email.lower() not in validated_emails
+                if email not in validated_emails
             ]
-            
+
             logger.info(f"Found {len(unvalidated)} unvalidated emails")
             return unvalidated
-            
+
         except Exception as e:
             logger.error(f"Error fetching unvalidated emails: {e}")
             return []
     
     def get_emails_due_for_revalidation(self) -> List[Dict]:
         """Get emails due for 60-day revalidation.
-        
+
+        Only the columns the revalidation loop reads come back; the
+        wide hunter_result/error payloads stay server-side. The prior
+        verdict columns let the validator re-affirm unchanged domains
+        without a fresh API call.
+
         Returns:
-            List of validation records due for recheck
+            List of validation records (id, email_address, candidate_id,
+            is_valid, validation_error, confidence_score) due for recheck
         """
         try:
             now = datetime.now().isoformat()
-            
+
             result = self.client.table('email_validations')\
-                .select('*')\
+                .select('id, email_address, candidate_id, '
+                        'is_valid, validation_error, confidence_score')\
                 .lte('next_validation_due', now)\
                 .execute()
             
@@ -103,74 +223,96 @@ class EmailDatabase:
             logger.error(f"Error fetching emails due for revalidation: {e}")
             return []
     
+    def _build_validation_row(self, validation_data: Dict) -> Dict:
+        """Build an upsert row from a validation result.
+
+        validation_count and first_validated_at are maintained
+        server-side (bump_validation_count trigger, see
+        sql/email_validation_rpc.sql) so no pre-read is needed.
+
+        Args:
+            validation_data: Dictionary with validation results
+
+        Returns:
+            Row dict ready for upsert
+        """
+        now = datetime.now()
+        now_iso = now.isoformat()
+        return {
+            'email_address': validation_data['email_address'].lower(),
+            'candidate_id': validation_data.get('candidate_id'),
+            'is_valid': validation_data.get('is_valid'),
+            'validation_method': validation_data.get('validation_method'),
+            'confidence_score': validation_data.get('confidence_score'),
+            'syntax_valid': validation_data.get('syntax_valid'),
+            'dns_valid': validation_data.get('dns_valid'),
+            'mx_records_found': validation_data.get('mx_records_found'),
+            'is_disposable': validation_data.get('is_disposable', False),
+            'is_role_account': validation_data.get('is_role_account', False),
+            'hunter_status': validation_data.get('hunter_status'),
+            'hunter_score': validation_data.get('hunter_score'),
+            # hunter_result is JSONB; the dict goes straight into the
+            # request payload instead of being double-encoded here
+            'hunter_result': validation_data.get('hunter_result') or None,
+            'hunter_regexp': validation_data.get('hunter_regexp'),
+            'hunter_gibberish': validation_data.get('hunter_gibberish'),
+            'validation_error': validation_data.get('validation_error'),
+            'last_validated_at': now_iso,
+            'next_validation_due': (now + timedelta(days=60)).isoformat(),
+            'updated_at': now_iso
+        }
+
+    def save_validations_bulk(self, validations: List[Dict],
+                              chunk_size: int = 500) -> int:
+        """Upsert a batch of validation results keyed by email_address.
+
+        One round trip per chunk replaces the select-then-insert/update
+        pair per email. On a chunk failure, falls back to per-row
+        upserts so one bad record doesn't lose the whole chunk.
+
+        Args:
+            validations: List of validation result dictionaries
+            chunk_size: Rows per upsert request
+
+        Returns:
+            Number of validations saved
+        """
+        saved = 0
+        for start in range(0, len(validations), chunk_size):
+            rows = [self._build_validation_row(v)
+                    for v in validations[start:start + chunk_size]]
+            try:
+                self.client.table('email_validations')\
+                    .upsert(rows, on_conflict='email_address',
+                            returning='minimal')\
+                    .execute()
+                saved += len(rows)
+                logger.info(f"Upserted {len(rows)} validations")
+            except Exception as e:
+                logger.error(f"Bulk validation upsert failed: {e}, "
+                             f"falling back to per-row upserts")
+                for row in rows:
+                    try:
+                        self.client.table('email_validations')\
+                            .upsert(row, on_conflict='email_address',
+                                    returning='minimal')\
+                            .execute()
+                        saved += 1
+                    except Exception as row_error:
+                        logger.error(f"Error saving validation for "
+                                     f"{row['email_address']}: {row_error}")
+        return saved
+
     def save_validation(self, validation_data: Dict) -> bool:
-        """Save or update email validation result.
-        
+        """Save or update a single email validation result.
+
         Args:
             validation_data: Dictionary with validation results
-            
+
         Returns:
             True if successful
         """
-        try:
-            email = validation_data['email_address'].lower()
-            
-            # Check if validation exists
-            existing = self.client.table('email_validations')\
-                .select('id')\
-                .eq('email_address', email)\
-                .execute()
-            
-            # Prepare data for insert/update
-            data = {
-                'email_address': email,
-                'candidate_id': validation_data.get('candidate_id'),
-                'is_valid': validation_data.get('is_valid'),
-                'validation_method': validation_data.get('validation_method'),
-                'confidence_score': validation_data.get('confidence_score'),
-                'syntax_valid': validation_data.get('syntax_valid'),
-                'dns_valid': validation_data.get('dns_valid'),
-                'mx_records_found': validation_data.get('mx_records_found'),
-                'is_disposable': validation_data.get('is_disposable', False),
-                'is_role_account': validation_data.get('is_role_account', False),
-                'hunter_status': validation_data.get('hunter_status'),
-                'hunter_score': validation_data.get('hunter_score'),
-                'hunter_result': json.dumps(validation_data.get('hunter_result')) if validation_data.get('hunter_result') else None,
-                'hunter_regexp': validation_data.get('hunter_regexp'),
-                'hunter_gibberish': validation_data.get('hunter_gibberish'),
-                'validation_error': validation_data.get('validation_error'),
-                'last_validated_at': datetime.now().isoformat(),
-                'next_validation_due': (datetime.now() + timedelta(days=60)).isoformat(),
-                'updated_at': datetime.now().isoformat()
-            }
-            
-            if existing.data:
-                # Update existing validation
-                data['validation_count'] = existing.data[0].get('validation_count', 0) + 1
-                
-                result = self.client.table('email_validations')\
-                    .update(data)\
-                    .eq('id', existing.data[0]['id'])\
-                    .execute()
-                
-                logger.info(f"Updated validation for {email}")
-            else:
-                # Insert new validation
-                data['first_validated_at'] = datetime.now().isoformat()
-                data['validation_count'] = 1
-                data['created_at'] = datetime.now().isoformat()
-                
-                result = self.client.table('email_validations')\
-                    .insert(data)\
-                    .execute()
-                
-                logger.info(f"Created new validation for {email}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error saving validation: {e}")
-            return False
+        return self.save_validations_bulk([validation_data]) == 1
     
     def create_validation_run(self, run_type: str, triggered_by: str) -> Optional[str]:
         """Create a new validation run record.
@@ -201,6 +343,43 @@ class EmailDatabase:
             logger.error(f"Error creating validation run: {e}")
             return None
     
+    def record_validation_run(self, run_type: str, triggered_by: str,
+                              stats: Dict) -> Optional[str]:
+        """Record an already-finished validation run in one round trip.
+
+        For short synchronous runs this replaces the
+        create_validation_run / update_validation_run pair (see
+        record_validation_run in sql/email_validation_rpc.sql). Falls
+        back to that pair until the RPC is deployed.
+
+        Args:
+            run_type: Type of run (all, new, revalidation, manual)
+            triggered_by: Who triggered (github_action, manual, post_ingest)
+            stats: Statistics dictionary
+
+        Returns:
+            Run ID if successful
+        """
+        try:
+            result = self.client.rpc('record_validation_run', {
+                'p_run_type': run_type,
+                'p_triggered_by': triggered_by,
+                'p_stats': {key: value for key, value in stats.items()
+                            if key != 'errors'}
+            }).execute()
+
+            run_id = result.data
+            logger.info(f"Recorded validation run {run_id} (type: {run_type})")
+            return run_id
+
+        except Exception as e:
+            logger.warning(f"RPC record_validation_run failed ({e}); "
+                           f"falling back to create + update")
+            run_id = self.create_validation_run(run_type, triggered_by)
+            if run_id:
+                self.update_validation_run(run_id, stats)
+            return run_id
+
     def update_validation_run(self, run_id: str, stats: Dict) -> bool:
         """Update validation run with statistics.
         
@@ -238,7 +417,41 @@ class EmailDatabase:
     
     def get_validation_statistics(self) -> Dict:
         """Get overall email validation statistics.
-        
+
+        The counts come from one email_validation_stats RPC (conditional
+        aggregation, see sql/email_validation_rpc.sql) instead of five
+        separate count queries.
+
+        Returns:
+            Dictionary with statistics
+        """
+        try:
+            result = self.client.rpc('email_validation_stats').execute()
+            row = result.data[0]
+
+            total = row['total_candidates_with_email']
+            validated = row['valid_emails'] + row['invalid_emails']
+            return {
+                'total_candidates_with_email': total,
+                'total_validated': validated,
+                'valid_emails': row['valid_emails'],
+                'invalid_emails': row['invalid_emails'],
+                'disposable_emails': row['disposable_emails'],
+                'role_accounts': row['role_accounts'],
+                'validation_coverage': round(
+                    (validated / total * 100) if total > 0 else 0,
+                    1
+                )
+            }
+
+        except Exception as e:
+            logger.warning(f"RPC email_validation_stats failed ({e}); "
+                           f"falling back to per-count queries")
+            return self._get_validation_statistics_fallback()
+
+    def _get_validation_statistics_fallback(self) -> Dict:
+        """Per-count statistics queries used when the RPC is not deployed.
+
         Returns:
             Dictionary with statistics
         """
@@ -1,53 +1,316 @@
 """Free email validation checks (no API required)."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
 import dns.resolver
 import requests
-from typing import Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set
 from email_validator import validate_email, EmailNotValidError
+
+# aiodns is optional; without it batch validation falls back to the
+# serial sync path
+try:
+    import aiodns
+    HAVE_AIODNS = True
+except ImportError:
+    HAVE_AIODNS = False
+
+# orjson is optional; it parses the ~2MB disposable-domains payload
+# several times faster than the stdlib
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# rapidfuzz is optional; when present the typo edit-distance check runs
+# in its C++ implementation instead of the pure-Python fallback
+try:
+    from rapidfuzz.distance import DamerauLevenshtein as _DamerauLevenshtein
+    HAVE_RAPIDFUZZ = True
+except ImportError:
+    HAVE_RAPIDFUZZ = False
+
+
+def _json_loads(data):
+    """Parse JSON from bytes/str with orjson when available."""
+    return orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 from config import (
-    COMMON_TYPOS, 
-    ROLE_PREFIXES, 
+    COMMON_TYPOS,
+    ROLE_PREFIXES,
     DISPOSABLE_DOMAINS_URL,
     get_logger
 )
 
 logger = get_logger(__name__)
 
+# Upper bound on in-flight async DNS queries so a large batch doesn't
+# flood the resolver
+_DNS_CONCURRENCY = 64
+
+# Thread count for the sync batch path; DNS lookups release the GIL so
+# the pool overlaps the IO-bound stage
+_VALIDATE_WORKERS = 32
+
+# On-disk cache for the disposable-domains list so the ~100k-entry JSON
+# isn't re-downloaded on every process start
+_DISPOSABLE_CACHE_FILE = Path.home() / '.cache' / 'email_validator' / 'disposable.json'
+
+# Widely used legitimate mail domains for the edit-distance typo
+# fallback. Anything within one edit of these (and not itself a known
+# domain) is almost certainly a typo
+_LEGIT_DOMAINS = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
+    'icloud.com', 'me.com', 'mac.com', 'msn.com', 'live.com',
+    'comcast.net', 'verizon.net', 'att.net', 'sbcglobal.net',
+    'bellsouth.net', 'cox.net', 'charter.net', 'earthlink.net',
+    'optonline.net', 'frontier.com', 'windstream.net', 'juno.com',
+    'protonmail.com', 'proton.me', 'mail.com', 'gmx.com', 'ymail.com',
+    'rocketmail.com', 'zoho.com', 'fastmail.com', 'hushmail.com',
+    'yandex.com', 'mail.ru', 'qq.com', 'naver.com',
+})
+
+# Length buckets so the typo fallback only compares against domains
+# that could possibly be within one edit
+_LEGIT_BY_LEN: Dict[int, Tuple[str, ...]] = {}
+for _d in _LEGIT_DOMAINS:
+    _LEGIT_BY_LEN[len(_d)] = _LEGIT_BY_LEN.get(len(_d), ()) + (_d,)
+del _d
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Check if two strings are within one Damerau-Levenshtein edit.
+
+    Covers substitution, adjacent transposition, and single
+    insertion/deletion; O(len) with early exit.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        True if the edit distance is 0 or 1
+    """
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+
+    if HAVE_RAPIDFUZZ:
+        # score_cutoff lets the C++ implementation bail out early too
+        return _DamerauLevenshtein.distance(a, b, score_cutoff=1) <= 1
+
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) <= 1:
+            return True
+        if len(diffs) == 2 and diffs[1] == diffs[0] + 1:
+            i = diffs[0]
+            return a[i] == b[i + 1] and a[i + 1] == b[i]
+        return False
+
+    # One insertion/deletion: walk the shorter string, allowing a
+    # single skip in the longer one
+    if la > lb:
+        a, b, la = b, a, lb
+    i = j = 0
+    skipped = False
+    while i < la:
+        if a[i] == b[j]:
+            i += 1
+            j += 1
+        elif skipped:
+            return False
+        else:
+            skipped = True
+            j += 1
+    return True
+
+
+# Minimal set of known disposable domains used when both the download
+# and the cache are unavailable
+_FALLBACK_DISPOSABLE_DOMAINS = frozenset({
+    '10minutemail.com', 'guerrillamail.com', 'mailinator.com',
+    'tempmail.com', 'throwaway.email', 'yopmail.com',
+    'fakeinbox.com', 'trashmail.com', 'maildrop.cc',
+    'dispostable.com', 'tempr.email', 'throwawaymail.com'
+})
+
+
+# Shared resolver so every lookup reuses one configured instance, with
+# dnspython's own record cache catching repeat queries below the
+# function-level memoization
+_RESOLVER = dns.resolver.Resolver()
+_RESOLVER.lifetime = 5
+_RESOLVER.cache = dns.resolver.LRUCache(10000)
+
+
+@functools.lru_cache(maxsize=8192)
+def _mx_of(domain: str) -> Tuple[bool, Optional[str]]:
+    """Check whether a domain can receive mail (MX, A fallback).
+
+    Memoized per-domain: a batch of emails at the same domain costs one
+    resolver round trip instead of N. Failures are cached too, which is
+    the desired behavior within a run.
+
+    Args:
+        domain: Domain part of an email address
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        # Check for MX records (mail exchange)
+        mx_records = _RESOLVER.resolve(domain, 'MX')
+        if mx_records:
+            logger.debug(f"Found {len(mx_records)} MX records for {domain}")
+            return True, None
+        else:
+            return False, "No MX records found"
+
+    except dns.resolver.NXDOMAIN:
+        return False, "Domain does not exist"
+    except dns.resolver.NoAnswer:
+        # Try A record as fallback (some domains use A records for mail)
+        try:
+            a_records = _RESOLVER.resolve(domain, 'A')
+            if a_records:
+                logger.debug(f"No MX but found A records for {domain}")
+                return True, "No MX records but A records exist"
+            else:
+                return False, "No DNS records found"
+        except Exception:
+            return False, "No DNS records found"
+    except Exception as e:
+        logger.error(f"DNS validation error for {domain}: {e}")
+        return False, f"DNS lookup failed: {str(e)}"
+
+
+@functools.lru_cache(maxsize=8192)
+def _mx_fingerprint(domain: str) -> Optional[str]:
+    """Digest a domain's mail setup into a short stable fingerprint.
+
+    Hashes the sorted (priority, exchange) MX tuples (A records as
+    fallback); an unchanged fingerprint between revalidation cycles
+    means the domain's mail routing has not moved, so a previous
+    deliverability verdict very likely still holds.
+
+    Args:
+        domain: Domain part of an email address
+
+    Returns:
+        Hex fingerprint, or None when DNS gives no usable answer
+    """
+    try:
+        answers = _RESOLVER.resolve(domain, 'MX')
+        records = sorted((r.preference, str(r.exchange).lower())
+                         for r in answers)
+    except dns.resolver.NoAnswer:
+        try:
+            answers = _RESOLVER.resolve(domain, 'A')
+            records = sorted((0, r.address) for r in answers)
+        except Exception:
+            return None
+    except Exception:
+        return None
+
+    digest = hashlib.blake2b(repr(records).encode(), digest_size=8)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_disposable_domains() -> frozenset:
+    """Load the disposable email domains list.
+
+    The list is cached on disk with its ETag; subsequent loads send
+    If-None-Match and reuse the cached copy on 304, so the full JSON
+    only crosses the wire when the upstream list actually changed.
+    lru_cache shares the set across FreeValidators instances in the
+    same process.
+
+    Returns:
+        Frozenset of disposable domain names
+    """
+    cached_domains = None
+    etag = None
+    try:
+        payload = _json_loads(_DISPOSABLE_CACHE_FILE.read_bytes())
+        cached_domains = frozenset(payload['domains'])
+        etag = payload.get('etag')
+    except Exception:
+        pass  # No usable cache yet
+
+    headers = {'If-None-Match': etag} if etag else {}
+
+    try:
+        logger.info("Fetching disposable domains list...")
+        response = requests.get(DISPOSABLE_DOMAINS_URL, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cached_domains is not None:
+            logger.info(f"Disposable domains unchanged, using cached list "
+                        f"({len(cached_domains)} domains)")
+            return cached_domains
+
+        response.raise_for_status()
+        domains = frozenset(_json_loads(response.content))
+        logger.info(f"Successfully loaded {len(domains)} disposable domains")
+
+        try:
+            _DISPOSABLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _DISPOSABLE_CACHE_FILE.write_bytes(_json_dumps({
+                'etag': response.headers.get('ETag'),
+                'fetched_at': datetime.now().isoformat(),
+                'domains': sorted(domains)
+            }))
+        except Exception as cache_error:
+            logger.warning(f"Could not cache disposable domains: {cache_error}")
+
+        return domains
+
+    except Exception as e:
+        logger.error(f"Failed to load disposable domains: {e}")
+        if cached_domains is not None:
+            logger.info(f"Using cached disposable domains "
+                        f"({len(cached_domains)} domains)")
+            return cached_domains
+        return _FALLBACK_DISPOSABLE_DOMAINS
+
 
 class FreeValidators:
     """Free email validation checks using DNS and pattern matching."""
-    
+
+    # No instance dict: the validator is allocated per batch and holds
+    # only these fixed attributes
+    __slots__ = ('disposable_domains', 'common_typos', '_role_re', '_pool')
+
     def __init__(self):
         """Initialize free validators."""
-        self.disposable_domains = self._load_disposable_domains()
-        self.role_prefixes = ROLE_PREFIXES
+        self.disposable_domains = _load_disposable_domains()
         self.common_typos = COMMON_TYPOS
+        self._pool = None  # Thread pool created on first validate_many
+        # One anchored alternation replaces a startswith loop over every
+        # prefix; longest-first ordering keeps the match greedy. No
+        # trailing boundary so matching stays identical to startswith
+        self._role_re = re.compile(
+            r'^(?:' + '|'.join(
+                map(re.escape, sorted(ROLE_PREFIXES, key=len, reverse=True))
+            ) + r')'
+        )
         logger.info(f"Loaded {len(self.disposable_domains)} disposable domains")
     
-    def _load_disposable_domains(self) -> Set[str]:
-        """Load list of disposable email domains.
-        
-        Returns:
-            Set of disposable domain names
-        """
-        try:
-            logger.info("Fetching disposable domains list...")
-            response = requests.get(DISPOSABLE_DOMAINS_URL, timeout=30)
-            response.raise_for_status()
-            domains = set(response.json())
-            logger.info(f"Successfully loaded {len(domains)} disposable domains")
-            return domains
-        except Exception as e:
-            logger.error(f"Failed to load disposable domains: {e}")
-            # Return a minimal set of known disposable domains as fallback
-            return {
-                '10minutemail.com', 'guerrillamail.com', 'mailinator.com',
-                'tempmail.com', 'throwaway.email', 'yopmail.com',
-                'fakeinbox.com', 'trashmail.com', 'maildrop.cc',
-                'dispostable.com', 'tempr.email', 'throwawaymail.com'
-            }
-    
     def validate_syntax(self, email: str) -> Tuple[bool, Optional[str]]:
         """Validate email syntax using RFC standards.
         
@@ -57,6 +320,13 @@ class FreeValidators:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # Cheap structural prefilter: obviously-broken strings bail out
+        # before the full RFC parse in the email-validator library
+        if not 3 <= len(email) <= 254 or email.count('@') != 1:
+            return False, "Not a valid email address"
+        if '.' not in email.rpartition('@')[2]:
+            return False, "Email domain has no dot"
+
         try:
             # email-validator library checks RFC compliance
             validation = validate_email(email, check_deliverability=False)
@@ -73,65 +343,60 @@ class FreeValidators:
     
     def check_typos(self, email: str) -> Tuple[bool, Optional[str]]:
         """Check for common email typos.
-        
+
         Args:
             email: Email address to check
-            
+
         Returns:
             Tuple of (has_typo, suggested_correction)
         """
         if '@' not in email:
             return True, None
-        
-        domain = email.split('@')[1].lower()
-        
+
+        local, _, domain = email.rpartition('@')
+        return self._check_typos(local, domain.lower())
+
+    def _check_typos(self, local: str, domain: str) -> Tuple[bool, Optional[str]]:
+        """Typo check on pre-split parts (domain already lowercased)."""
         if domain in self.common_typos:
             correct_domain = self.common_typos[domain]
-            suggested_email = email.split('@')[0] + '@' + correct_domain
-            logger.info(f"Typo detected: {email} -> suggested: {suggested_email}")
+            suggested_email = local + '@' + correct_domain
+            logger.info(f"Typo detected: {local}@{domain} -> suggested: {suggested_email}")
             return True, suggested_email
-        
+
+        # Fallback: anything one Damerau-Levenshtein edit away from a
+        # major mail domain is treated as a typo, so the hand-kept
+        # COMMON_TYPOS map no longer has to enumerate every variant.
+        # Known-good domains are exempt (mail.com is one edit from
+        # gmail.com)
+        if domain not in _LEGIT_DOMAINS:
+            dlen = len(domain)
+            for bucket_len in (dlen - 1, dlen, dlen + 1):
+                for legit in _LEGIT_BY_LEN.get(bucket_len, ()):
+                    if _within_one_edit(domain, legit):
+                        suggested_email = local + '@' + legit
+                        logger.info(f"Typo detected: {local}@{domain} -> "
+                                    f"suggested: {suggested_email}")
+                        return True, suggested_email
+
         return False, None
     
     def validate_dns(self, email: str) -> Tuple[bool, Optional[str]]:
         """Check if email domain has valid DNS and MX records.
-        
+
+        The per-domain resolution is memoized (_mx_of), so repeat
+        domains within a run are dictionary lookups.
+
         Args:
             email: Email address to validate
-            
+
         Returns:
             Tuple of (is_valid, error_message)
         """
         if '@' not in email:
             return False, "Invalid email format"
-        
-        domain = email.split('@')[1]
-        
-        try:
-            # Check for MX records (mail exchange)
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            if mx_records:
-                logger.debug(f"Found {len(mx_records)} MX records for {domain}")
-                return True, None
-            else:
-                return False, "No MX records found"
-                
-        except dns.resolver.NXDOMAIN:
-            return False, "Domain does not exist"
-        except dns.resolver.NoAnswer:
-            # Try A record as fallback (some domains use A records for mail)
-            try:
-                a_records = dns.resolver.resolve(domain, 'A')
-                if a_records:
-                    logger.debug(f"No MX but found A records for {domain}")
-                    return True, "No MX records but A records exist"
-                else:
-                    return False, "No DNS records found"
-            except:
-                return False, "No DNS records found"
-        except Exception as e:
-            logger.error(f"DNS validation error for {domain}: {e}")
-            return False, f"DNS lookup failed: {str(e)}"
+
+        return _mx_of(email.rpartition('@')[2].lower())
     
     def is_disposable(self, email: str) -> bool:
         """Check if email uses a disposable/temporary domain.
@@ -144,23 +409,22 @@ class FreeValidators:
         """
         if '@' not in email:
             return False
-        
-        domain = email.split('@')[1].lower()
-        
-        # Check main domain
-        if domain in self.disposable_domains:
-            logger.info(f"Disposable domain detected: {domain}")
-            return True
-        
-        # Check subdomains (e.g., user@mail.disposable.com)
-        parts = domain.split('.')
-        for i in range(len(parts)):
-            subdomain = '.'.join(parts[i:])
-            if subdomain in self.disposable_domains:
-                logger.info(f"Disposable subdomain detected: {subdomain}")
+
+        return self._is_disposable(email.rpartition('@')[2].lower())
+
+    def _is_disposable(self, domain: str) -> bool:
+        """Disposable check on a pre-split, lowercased domain."""
+        # Walk the suffixes right-to-left by trimming one label at a
+        # time (e.g., user@mail.disposable.com also checks
+        # disposable.com). split(sep, 1) keeps each probe a plain set
+        # lookup without rebuilding suffix strings via '.'.join
+        while True:
+            if domain in self.disposable_domains:
+                logger.info(f"Disposable domain detected: {domain}")
                 return True
-        
-        return False
+            if '.' not in domain:
+                return False
+            domain = domain.split('.', 1)[1]
     
     def is_role_account(self, email: str) -> bool:
         """Check if email is a role/generic account.
@@ -173,27 +437,33 @@ class FreeValidators:
         """
         if '@' not in email:
             return False
-        
-        local_part = email.split('@')[0].lower()
-        
+
+        return self._is_role_account(email.rpartition('@')[0])
+
+    def _is_role_account(self, local: str) -> bool:
+        """Role-account check on a pre-split local part."""
+        local = local.lower()
+
         # Remove common separators for comparison
-        normalized = local_part.replace('-', '').replace('_', '').replace('.', '')
-        
-        for prefix in self.role_prefixes:
-            if local_part.startswith(prefix) or normalized.startswith(prefix):
-                logger.info(f"Role account detected: {email} (prefix: {prefix})")
-                return True
-        
+        normalized = local.replace('-', '').replace('_', '').replace('.', '')
+
+        match = self._role_re.match(local) or self._role_re.match(normalized)
+        if match:
+            logger.info(f"Role account detected: {local} (prefix: {match.group()})")
+            return True
+
         return False
     
-    def validate_all(self, email: str) -> dict:
-        """Run all free validation checks on an email.
-        
+    def _validate_pre_dns(self, email: str) -> Tuple[dict, Optional[Tuple[str, str]]]:
+        """Run the cheap synchronous checks (syntax, typos).
+
         Args:
             email: Email address to validate
-            
+
         Returns:
-            Dict with all validation results
+            Tuple of (partial results dict, (local, lowercased domain)
+            parts for the remaining checks, or None if validation is
+            already finished)
         """
         results = {
             'email': email,
@@ -205,48 +475,206 @@ class FreeValidators:
             'is_role_account': False,
             'errors': []
         }
-        
+
         # Syntax validation
         syntax_valid, syntax_error = self.validate_syntax(email)
         results['syntax_valid'] = syntax_valid
         if not syntax_valid:
             results['errors'].append(f"Syntax: {syntax_error}")
-            return results  # No point checking further if syntax is invalid
-        
+            return results, None  # No point checking further if syntax is invalid
+
+        # Split once; every downstream check works on these parts
+        # (rpartition avoids the list allocation of split)
+        local, _, domain = email.rpartition('@')
+        domain = domain.lower()
+
         # Typo check
-        has_typo, suggested = self.check_typos(email)
+        has_typo, suggested = self._check_typos(local, domain)
         results['has_typo'] = has_typo
         results['suggested_email'] = suggested
         if has_typo:
             results['errors'].append(f"Likely typo, suggest: {suggested}")
-        
-        # DNS validation
-        dns_valid, dns_error = self.validate_dns(email)
+
+        # Disposable check is a set probe, so it runs before DNS
+        results['is_disposable'] = self._is_disposable(domain)
+        if results['is_disposable']:
+            results['errors'].append("Disposable email domain")
+
+        if has_typo or results['is_disposable']:
+            # The domain is already known-bad; don't burn a resolver
+            # round trip (typo'd domains usually don't resolve and cost
+            # the full timeout)
+            results['dns_valid'] = False
+            results['mx_records_found'] = False
+            results['errors'].append("DNS: skipped (known-bad domain)")
+            results['is_role_account'] = self._is_role_account(local)
+            if results['is_role_account']:
+                results['errors'].append("Role/generic account")
+            results['is_valid_free_checks'] = False
+            return results, None
+
+        return results, (local, domain)
+
+    def _finish_validation(self, results: dict, local: str, domain: str,
+                           dns_result: Tuple[bool, Optional[str]]) -> dict:
+        """Fold a resolved DNS check into the remaining checks.
+
+        Args:
+            results: Partial results from _validate_pre_dns
+            local: Local part of the email address
+            domain: Lowercased domain part
+            dns_result: (is_valid, error_message) from the DNS check
+
+        Returns:
+            Completed results dict
+        """
+        dns_valid, dns_error = dns_result
         results['dns_valid'] = dns_valid
         results['mx_records_found'] = dns_valid  # For compatibility
         if not dns_valid:
             results['errors'].append(f"DNS: {dns_error}")
-        
-        # Disposable check
-        results['is_disposable'] = self.is_disposable(email)
-        if results['is_disposable']:
-            results['errors'].append("Disposable email domain")
-        
+
         # Role account check
-        results['is_role_account'] = self.is_role_account(email)
+        results['is_role_account'] = self._is_role_account(local)
         if results['is_role_account']:
             results['errors'].append("Role/generic account")
-        
+
         # Overall validity
         results['is_valid_free_checks'] = (
-            syntax_valid and 
-            dns_valid and 
-            not has_typo and 
+            results['syntax_valid'] and
+            dns_valid and
+            not results['has_typo'] and
             not results['is_disposable']
         )
-        
+
         return results
 
+    def validate_all(self, email: str) -> dict:
+        """Run all free validation checks on an email.
+
+        Args:
+            email: Email address to validate
+
+        Returns:
+            Dict with all validation results
+        """
+        results, parts = self._validate_pre_dns(email)
+        if parts is None:
+            return results
+        local, domain = parts
+        return self._finish_validation(results, local, domain, _mx_of(domain))
+
+    async def _resolve_mx_async(self, domain: str,
+                                resolver: 'aiodns.DNSResolver',
+                                semaphore: asyncio.Semaphore) -> Tuple[bool, Optional[str]]:
+        """Async MX/A resolution for one domain.
+
+        Args:
+            domain: Domain part of an email address
+            resolver: Shared aiodns resolver
+            semaphore: Concurrency bound for in-flight queries
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        async with semaphore:
+            try:
+                mx_records = await resolver.query(domain, 'MX')
+                if mx_records:
+                    return True, None
+                return False, "No MX records found"
+            except aiodns.error.DNSError:
+                # Try A record as fallback (some domains use A records for mail)
+                try:
+                    a_records = await resolver.query(domain, 'A')
+                    if a_records:
+                        return True, "No MX records but A records exist"
+                    return False, "No DNS records found"
+                except aiodns.error.DNSError:
+                    return False, "Domain does not exist or has no DNS records"
+            except Exception as e:
+                logger.error(f"DNS validation error for {domain}: {e}")
+                return False, f"DNS lookup failed: {str(e)}"
+
+    async def validate_all_async(self, email: str, mx_lookup) -> dict:
+        """Async variant of validate_all.
+
+        Cheap checks run inline; only the DNS resolution is awaited.
+
+        Args:
+            email: Email address to validate
+            mx_lookup: Callable mapping a domain to an awaitable
+                (is_valid, error_message)
+
+        Returns:
+            Dict with all validation results
+        """
+        results, parts = self._validate_pre_dns(email)
+        if parts is None:
+            return results
+        local, domain = parts
+        dns_result = await mx_lookup(domain)
+        return self._finish_validation(results, local, domain, dns_result)
+
+    async def _validate_batch_async(self, emails: List[str]) -> List[dict]:
+        """Validate a batch concurrently with one query per unique domain."""
+        resolver = aiodns.DNSResolver(timeout=5)
+        semaphore = asyncio.Semaphore(_DNS_CONCURRENCY)
+        mx_tasks: Dict[str, asyncio.Task] = {}
+
+        def mx_lookup(domain: str) -> asyncio.Task:
+            # One in-flight query per unique domain; every email at that
+            # domain awaits the same task
+            if domain not in mx_tasks:
+                mx_tasks[domain] = asyncio.ensure_future(
+                    self._resolve_mx_async(domain, resolver, semaphore)
+                )
+            return mx_tasks[domain]
+
+        return list(await asyncio.gather(
+            *[self.validate_all_async(email, mx_lookup) for email in emails]
+        ))
+
+    def validate_batch(self, emails: List[str]) -> List[dict]:
+        """Run all free validation checks on a batch of emails.
+
+        With aiodns installed, DNS lookups for the whole batch overlap
+        under a bounded semaphore instead of resolving serially; without
+        it, this degrades to the sync per-email path.
+
+        Args:
+            emails: Email addresses to validate
+
+        Returns:
+            List of validation result dicts, in input order
+        """
+        if not HAVE_AIODNS or not emails:
+            return self.validate_many(emails)
+        return asyncio.run(self._validate_batch_async(emails))
+
+    def validate_many(self, emails: List[str], workers: int = _VALIDATE_WORKERS) -> List[dict]:
+        """Validate a batch of emails on a shared thread pool.
+
+        The DNS stage is IO-bound and releases the GIL, so worker
+        threads overlap resolver waits; the cheap sync checks
+        interleave between them. The pool is created on first use and
+        reused across batches (workers only takes effect on that first
+        call).
+
+        Args:
+            emails: Email addresses to validate
+            workers: Thread count for the shared pool
+
+        Returns:
+            List of validation result dicts, in input order
+        """
+        if len(emails) <= 1:
+            return [self.validate_all(email) for email in emails]
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=workers)
+        return list(self._pool.map(self.validate_all, emails))
+
 
 def test_free_validators():
     """Test free validators with sample emails."""
@@ -1,42 +1,213 @@
 """Hunter.io API client for email validation."""
 
+import asyncio
+import json
 import os
+import random
+import sqlite3
+import threading
 import time
 import requests
-from typing import Dict, Optional
-from ratelimit import limits, sleep_and_retry
-from config import HUNTER_API_KEY, HUNTER_API_BASE, HUNTER_RATE_LIMIT_PER_SECOND, get_logger
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from email_validator import validate_email as _syntax_check, EmailNotValidError
+from free_validators import _load_disposable_domains
+from config import hunter_api_key, HUNTER_API_BASE, HUNTER_RATE_LIMIT_PER_SECOND, get_logger
+
+# httpx ships with supabase; guarded anyway so the client still works
+# (serially) in stripped-down environments
+try:
+    import httpx
+    HAVE_HTTPX = True
+except ImportError:
+    HAVE_HTTPX = False
+
+# Optional C-implemented JSON parser; stdlib works fine without it
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
 
 logger = get_logger(__name__)
 
 
+def _response_json(response) -> Dict:
+    """Decode an HTTP response body, via orjson when available."""
+    if HAVE_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Retry tuning for transient Hunter.io failures (429/5xx/connection
+# errors). Jitter keeps parallel workers from retrying in lockstep
+_MAX_RETRIES = 5
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+_JITTER_MAX = 1.0
+
+# On-disk result cache: a verification younger than the 60-day
+# revalidation policy is served locally instead of burning a credit
+_CACHE_FILE = Path.home() / '.cache' / 'email_validator' / 'hunter_cache.db'
+_CACHE_TTL_SECONDS = 60 * 86400
+
+
+def _local_precheck(email: str) -> Optional[Dict]:
+    """Catch obviously-bad addresses before spending a Hunter credit.
+
+    Broken syntax and known disposable domains can be settled locally in
+    microseconds; returning a Hunter-shaped result means callers need no
+    special handling. Returns None when the address deserves an API call.
+    """
+    try:
+        _syntax_check(email, check_deliverability=False)
+    except EmailNotValidError as e:
+        return {
+            'data': {
+                'status': 'invalid',
+                'result': 'undeliverable',
+                'score': 0,
+                'regexp': False,
+                'reason': str(e),
+            }
+        }
+
+    domain = email.rsplit('@', 1)[1].lower()
+    if domain in _load_disposable_domains():
+        return {
+            'data': {
+                'status': 'disposable',
+                'result': 'risky',
+                'score': 0,
+                'disposable': True,
+            }
+        }
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Tokens accrue continuously at `rate` per second up to `capacity`.
+    Unlike a fixed window, accumulated quota allows short bursts and
+    there are no window-edge stalls, so no extra pacing sleep is
+    needed between calls.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """Initialize a full bucket.
+
+        Args:
+            capacity: Maximum tokens the bucket holds
+            rate: Refill rate in tokens per second
+        """
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> None:
+        """Take n tokens, sleeping until the bucket can supply them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            # Small jitter so threads waking together don't contend
+            time.sleep(wait + random.uniform(0, 0.05))
+
+
 class HunterClient:
     """Client for Hunter.io email verification API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None,
+                 pool_maxsize: int = 32):
         """Initialize Hunter client.
-        
+
         Args:
             api_key: Hunter.io API key (defaults to env variable)
+            pool_maxsize: Connection pool size; widen when driving the
+                client from more than 32 threads
         """
-        self.api_key = api_key or HUNTER_API_KEY
+        self.api_key = api_key or hunter_api_key()
         if not self.api_key:
             raise ValueError("Hunter.io API key not found. Set HUNTER_API_KEY in .env file")
-        
+
         self.base_url = HUNTER_API_BASE
         self.session = requests.Session()
+        # Default adapters keep only 10 connections; under concurrent
+        # verification anything beyond that pays a fresh TLS handshake.
+        # Retries stay with the backoff loop in verify_email
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=16, pool_maxsize=pool_maxsize))
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip',
+        })
         self.credits_used = 0
+        self.cache_hits = 0
         self.last_quota_check = None
         self.remaining_credits = None
-    
-    @sleep_and_retry
-    @limits(calls=HUNTER_RATE_LIMIT_PER_SECOND, period=1)
-    def verify_email(self, email: str) -> Dict:
+        self._account_cached_at = 0.0
+        # Shared across threads and the async batch path
+        self._bucket = TokenBucket(HUNTER_RATE_LIMIT_PER_SECOND,
+                                   HUNTER_RATE_LIMIT_PER_SECOND)
+        self._cache_lock = threading.Lock()
+        try:
+            _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(str(_CACHE_FILE),
+                                          check_same_thread=False)
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS verifications '
+                '(email TEXT PRIMARY KEY, ts REAL, result TEXT)')
+            self._cache.commit()
+        except Exception as e:
+            logger.warning(f"Hunter result cache unavailable: {e}")
+            self._cache = None
+
+    def _cache_get(self, email: str) -> Optional[Dict]:
+        """Return a cached verification younger than the TTL, if any."""
+        if self._cache is None:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    'SELECT ts, result FROM verifications WHERE email = ?',
+                    (email,)).fetchone()
+            if row and (time.time() - row[0]) < _CACHE_TTL_SECONDS:
+                return json.loads(row[1])
+        except Exception as e:
+            logger.warning(f"Hunter cache read failed: {e}")
+        return None
+
+    def _cache_set(self, email: str, result: Dict) -> None:
+        """Store a successful verification result."""
+        if self._cache is None:
+            return
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    'INSERT OR REPLACE INTO verifications VALUES (?, ?, ?)',
+                    (email, time.time(), json.dumps(result)))
+                self._cache.commit()
+        except Exception as e:
+            logger.warning(f"Hunter cache write failed: {e}")
+
+    def verify_email(self, email: str, force_refresh: bool = False) -> Dict:
         """Verify an email address using Hunter.io.
-        
+
         Args:
             email: Email address to verify
-            
+            force_refresh: Bypass the local result cache (for
+                revalidation runs that must hit the API)
+
         Returns:
             Dict with verification results
             
@@ -64,48 +235,104 @@ class HunterClient:
             }
         }
         """
-        try:
-            logger.info(f"Verifying email with Hunter.io: {email}")
-            
-            response = self.session.get(
-                f"{self.base_url}/email-verifier",
-                params={
-                    'email': email,
-                    'api_key': self.api_key
-                },
-                timeout=30
-            )
-            
-            # Check for rate limiting
+        precheck = _local_precheck(email)
+        if precheck is not None:
+            logger.info(f"Local pre-check settled {email}; skipping Hunter.io")
+            return precheck
+
+        cache_key = email.strip().lower()
+        if not force_refresh:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(f"Using cached Hunter.io result for {email}")
+                return cached
+
+        logger.info(f"Verifying email with Hunter.io: {email}")
+        last_error = None
+
+        for attempt in range(1, _MAX_RETRIES + 1):
+            self._bucket.acquire()
+            try:
+                response = self.session.get(
+                    f"{self.base_url}/email-verifier",
+                    params={
+                        'email': email,
+                        'api_key': self.api_key
+                    },
+                    timeout=30
+                )
+            except requests.exceptions.RequestException as e:
+                # Connection/timeout errors are usually transient
+                last_error = e
+                wait = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (attempt - 1)) \
+                    + random.uniform(0, _JITTER_MAX)
+                logger.warning(f"Connection error verifying {email} "
+                               f"(attempt {attempt}/{_MAX_RETRIES}): {e}; "
+                               f"retrying in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+
+            # Check for rate limiting; honor Retry-After but cap it and
+            # add jitter so workers sharing the quota don't retry in sync
             if response.status_code == 429:
                 retry_after = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                return self.verify_email(email)  # Retry
-            
-            response.raise_for_status()
-            result = response.json()
-            
+                wait = min(_BACKOFF_CAP, retry_after) + random.uniform(0, _JITTER_MAX)
+                last_error = requests.exceptions.HTTPError("429 rate limited")
+                logger.warning(f"Rate limited (attempt {attempt}/{_MAX_RETRIES}). "
+                               f"Waiting {wait:.1f} seconds...")
+                time.sleep(wait)
+                continue
+
+            if response.status_code >= 500:
+                wait = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (attempt - 1)) \
+                    + random.uniform(0, _JITTER_MAX)
+                last_error = requests.exceptions.HTTPError(
+                    f"{response.status_code} server error")
+                logger.warning(f"Hunter.io server error {response.status_code} "
+                               f"(attempt {attempt}/{_MAX_RETRIES}); "
+                               f"retrying in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                # Remaining 4xx errors are not retryable
+                logger.error(f"Error verifying email {email}: {e}")
+                return {
+                    'error': str(e),
+                    'data': {
+                        'status': 'unknown',
+                        'score': 0,
+                        'result': 'unknown'
+                    }
+                }
+
+            result = _response_json(response)
+
             # Track credit usage
             self.credits_used += 1
-            
+
             # Extract quota information if present
             if 'meta' in result and 'quota' in result['meta']:
                 self.remaining_credits = result['meta']['quota']['remaining']
+                self._account_cached_at = time.monotonic()
                 logger.info(f"Hunter.io credits remaining: {self.remaining_credits}")
-            
+
+            self._cache_set(cache_key, result)
             return result
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error verifying email {email}: {e}")
-            return {
-                'error': str(e),
-                'data': {
-                    'status': 'unknown',
-                    'score': 0,
-                    'result': 'unknown'
-                }
+
+        logger.error(f"Error verifying email {email}: "
+                     f"retries exhausted ({last_error})")
+        return {
+            'error': str(last_error),
+            'data': {
+                'status': 'unknown',
+                'score': 0,
+                'result': 'unknown'
             }
+        }
     
     def get_account_info(self) -> Dict:
         """Get Hunter.io account information including credit balance.
@@ -121,23 +348,36 @@ class HunterClient:
             )
             response.raise_for_status()
             
-            result = response.json()
+            result = _response_json(response)
             if 'data' in result:
                 self.remaining_credits = result['data']['requests']['searches']['available']
+                self._account_cached_at = time.monotonic()
                 logger.info(f"Hunter.io account - Credits available: {self.remaining_credits}")
-            
+
             return result
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting account info: {e}")
             return {'error': str(e)}
     
-    def check_credits(self) -> int:
+    def check_credits(self, force: bool = False) -> int:
         """Check remaining Hunter.io credits.
-        
+
+        Every verify response already carries the quota in its meta
+        block, so a figure seen within the last minute is returned
+        without another round trip.
+
+        Args:
+            force: Hit the account endpoint even if a recent figure
+                is cached
+
         Returns:
             Number of remaining credits, or -1 if unable to check
         """
+        if (not force and self.remaining_credits is not None
+                and (time.monotonic() - self._account_cached_at) < 60):
+            return self.remaining_credits
+
         account_info = self.get_account_info()
         
         if 'data' in account_info:
@@ -148,34 +388,306 @@ class HunterClient:
         
         return -1
     
-    def batch_verify(self, emails: list, delay: float = 0.1) -> Dict[str, Dict]:
+    async def averify_email(self, client: 'httpx.AsyncClient', email: str,
+                            force_refresh: bool = False) -> Dict:
+        """Verify one email on a shared async HTTP client.
+
+        Args:
+            client: Shared httpx.AsyncClient
+            email: Email address to verify
+            force_refresh: Bypass the local result cache
+
+        Returns:
+            Dict with verification results (same shape as verify_email)
+        """
+        cache_key = email.strip().lower()
+        if not force_refresh:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(f"Using cached Hunter.io result for {email}")
+                return cached
+
+        try:
+            for attempt in range(1, _MAX_RETRIES + 1):
+                response = await client.get(
+                    f"{self.base_url}/email-verifier",
+                    params={
+                        'email': email,
+                        'api_key': self.api_key
+                    },
+                    timeout=30
+                )
+
+                # Rate limited or server error: capped, jittered wait,
+                # same policy as the sync path
+                if response.status_code == 429 or response.status_code >= 500:
+                    if response.status_code == 429:
+                        wait = min(_BACKOFF_CAP,
+                                   int(response.headers.get('Retry-After', 60)))
+                    else:
+                        wait = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (attempt - 1))
+                    wait += random.uniform(0, _JITTER_MAX)
+                    logger.warning(f"Hunter.io {response.status_code} for {email} "
+                                   f"(attempt {attempt}/{_MAX_RETRIES}); "
+                                   f"retrying in {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                    continue
+
+                response.raise_for_status()
+                result = _response_json(response)
+
+                # Track credit usage (single-threaded event loop, so no
+                # lock needed)
+                self.credits_used += 1
+
+                if 'meta' in result and 'quota' in result['meta']:
+                    self.remaining_credits = result['meta']['quota']['remaining']
+
+                self._cache_set(cache_key, result)
+                return result
+
+            raise RuntimeError("retries exhausted")
+
+        except Exception as e:
+            logger.error(f"Error verifying email {email}: {e}")
+            return {
+                'error': str(e),
+                'data': {
+                    'status': 'unknown',
+                    'score': 0,
+                    'result': 'unknown'
+                }
+            }
+
+    async def abatch_verify(self, emails: List[str],
+                            concurrency: int = HUNTER_RATE_LIMIT_PER_SECOND,
+                            force_refresh: bool = False) -> Dict[str, Dict]:
+        """Verify a batch of emails with bounded concurrency.
+
+        Keeps up to `concurrency` verifications in flight on one
+        keep-alive connection pool; sized to the per-second cap, each
+        request's round trip naturally spaces the stream near the
+        allowed rate, and 429 responses still back off.
+
+        Args:
+            emails: List of email addresses
+            concurrency: Maximum simultaneous requests
+
+        Returns:
+            Dict mapping email to verification result
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(client, email):
+            # Serve cache hits before taking a rate-limit token so they
+            # don't slow the rest of the batch
+            if not force_refresh:
+                cached = self._cache_get(email.strip().lower())
+                if cached is not None:
+                    self.cache_hits += 1
+                    logger.info(f"Using cached Hunter.io result for {email}")
+                    return cached
+            async with semaphore:
+                # acquire() sleeps; run it on a worker thread so it
+                # doesn't stall the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._bucket.acquire)
+                return await self.averify_email(client, email,
+                                                force_refresh=True)
+
+        limits_cfg = httpx.Limits(max_connections=concurrency,
+                                  max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits_cfg) as client:
+            results = await asyncio.gather(
+                *[bounded(client, email) for email in emails]
+            )
+
+        return dict(zip(emails, results))
+
+    def batch_verify(self, emails: list,
+                     force_refresh: bool = False) -> Dict[str, Dict]:
         """Verify multiple emails with rate limiting.
-        
+
+        Runs the whole batch concurrently via abatch_verify when httpx
+        is available; otherwise falls back to the serial loop. Pacing
+        comes entirely from the shared token bucket, so no extra
+        per-call sleep is added.
+
         Args:
             emails: List of email addresses
-            delay: Delay between requests (in addition to rate limiting)
-            
+            force_refresh: Bypass the local result cache
+
         Returns:
             Dict mapping email to verification result
         """
-        results = {}
         total = len(emails)
-        
         logger.info(f"Starting batch verification of {total} emails")
-        
-        for i, email in enumerate(emails, 1):
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{total} emails verified")
-            
-            results[email] = self.verify_email(email)
-            
-            # Additional delay to be nice to the API
-            if delay > 0:
-                time.sleep(delay)
-        
+
+        if HAVE_HTTPX and total > 1:
+            results = asyncio.run(self.abatch_verify(
+                list(emails), force_refresh=force_refresh))
+        else:
+            results = {}
+            for i, email in enumerate(emails, 1):
+                if i % 10 == 0:
+                    logger.info(f"Progress: {i}/{total} emails verified")
+
+                results[email] = self.verify_email(
+                    email, force_refresh=force_refresh)
+
         logger.info(f"Batch verification complete. Credits used: {self.credits_used}")
         return results
 
+    def batch_verify_parallel(self, emails: List[str],
+                              max_workers: int = HUNTER_RATE_LIMIT_PER_SECOND) -> Dict[str, Dict]:
+        """Verify multiple emails on a bounded thread pool.
+
+        Thread-based alternative to abatch_verify for callers that
+        cannot adopt asyncio. Workers share the pooled session, and the
+        token bucket paces them: over-eager threads block in acquire()
+        instead of hammering the API.
+
+        Args:
+            emails: List of email addresses
+            max_workers: Concurrent verification threads; keep at or
+                below the session's pool_maxsize
+
+        Returns:
+            Dict mapping email to verification result
+        """
+        total = len(emails)
+        logger.info(f"Starting parallel verification of {total} emails "
+                    f"({max_workers} workers)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.verify_email, email): email
+                       for email in emails}
+            results = {futures[future]: future.result()
+                       for future in as_completed(futures)}
+
+        logger.info(f"Parallel verification complete. Credits used: {self.credits_used}")
+        return results
+
+    def _bulk_verify_chunk(self, chunk: List[str]) -> Dict[str, Dict]:
+        """Submit one chunk to the bulk verifier and collect results.
+
+        Args:
+            chunk: Email addresses for one bulk request
+
+        Returns:
+            Dict mapping email to verification result
+
+        Raises:
+            requests.exceptions.RequestException: If the bulk endpoint
+                is unavailable on this account
+        """
+        self._bucket.acquire()
+        response = self.session.post(
+            f"{self.base_url}/email-verifier/bulk",
+            json={'emails': chunk, 'api_key': self.api_key},
+            timeout=60
+        )
+        response.raise_for_status()
+        payload = _response_json(response).get('data', {})
+
+        # Some plans answer synchronously
+        if 'results' in payload:
+            return _chunk_results_by_email(payload['results'])
+
+        # Otherwise a job id comes back and we poll until it finishes
+        job_id = payload.get('id')
+        if job_id is None:
+            raise ValueError("Unexpected bulk verifier response shape")
+
+        deadline = time.time() + 300
+        while time.time() < deadline:
+            time.sleep(5)
+            self._bucket.acquire()
+            poll = self.session.get(
+                f"{self.base_url}/email-verifier/bulk/{job_id}",
+                params={'api_key': self.api_key},
+                timeout=30
+            )
+            poll.raise_for_status()
+            data = _response_json(poll).get('data', {})
+            if data.get('status') in ('finished', 'completed'):
+                return _chunk_results_by_email(data.get('results', []))
+
+        raise TimeoutError(f"Bulk verification job {job_id} did not finish")
+
+    def bulk_verify(self, emails: List[str], chunk_size: int = 100,
+                    force_refresh: bool = False) -> Dict[str, Dict]:
+        """Verify emails through the bulk endpoint, 100 per request.
+
+        One POST (and one rate-limit token) covers a whole chunk
+        instead of one round trip per address. If the bulk endpoint is
+        not enabled for the account, everything not yet verified falls
+        back to batch_verify.
+
+        Args:
+            emails: List of email addresses
+            chunk_size: Addresses per bulk request
+            force_refresh: Bypass the local result cache
+
+        Returns:
+            Dict mapping email to verification result
+        """
+        results: Dict[str, Dict] = {}
+
+        # Serve cache hits locally; only misses go to the API
+        pending = []
+        for email in emails:
+            cached = None if force_refresh \
+                else self._cache_get(email.strip().lower())
+            if cached is not None:
+                self.cache_hits += 1
+                results[email] = cached
+            else:
+                pending.append(email)
+
+        logger.info(f"Bulk verification: {len(results)} cached, "
+                    f"{len(pending)} to verify")
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            try:
+                chunk_results = self._bulk_verify_chunk(chunk)
+            except Exception as e:
+                logger.warning(f"Bulk verifier unavailable ({e}); "
+                               f"falling back to per-email verification")
+                results.update(self.batch_verify(pending[start:],
+                                                 force_refresh=True))
+                return results
+
+            self.credits_used += len(chunk)
+            for email, result in chunk_results.items():
+                self._cache_set(email.strip().lower(), result)
+            results.update(chunk_results)
+
+        return results
+
+
+def _chunk_results_by_email(rows: list) -> Dict[str, Dict]:
+    """Shape bulk rows like single verify_email responses."""
+    return {row['email']: {'data': row} for row in rows if 'email' in row}
+
+
+_CLIENT: Optional[HunterClient] = None
+
+
+def get_hunter_client() -> HunterClient:
+    """Return the process-wide HunterClient, creating it on first use.
+
+    Sharing one client keeps a single warm connection pool (and one
+    credits_used counter) across every caller in the process instead of
+    paying TLS handshakes per EmailValidator instance.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = HunterClient()
+    return _CLIENT
+
 
 def test_hunter_connection():
     """Test Hunter.io API connection and return account info."""
@@ -1,33 +1,75 @@
 #!/usr/bin/env python3
 """Generate email validation report."""
 
+import argparse
+import gzip
 import sys
 import os
+import io
 import json
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import EmailDatabase
 from config import get_logger
 
+# Optional C-implemented JSON serializer for the report sidecar
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 logger = get_logger(__name__)
 
+# Issue substring -> badge CSS class, checked in order; 'syntax' is the
+# default when nothing matches
+BADGE_RULES = (
+    ('disposable', 'disposable'),
+    ('dns', 'dns'),
+    ('domain', 'dns'),
+    ('role', 'role'),
+)
+
+
+def badge_for(issue_lower: str) -> str:
+    """Map a lowercased validation error to its badge CSS class."""
+    for substring, badge_class in BADGE_RULES:
+        if substring in issue_lower:
+            return badge_class
+    return 'syntax'
+
+
+@lru_cache(maxsize=4096)
+def _fmt_date(timestamp: str) -> str:
+    """Format an ISO timestamp as YYYY-MM-DD, memoized per input.
+
+    Revalidation batches share timestamps down to the second, so the
+    cache skips most of the fromisoformat/strftime work.
+    """
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+
+
+def write_html_report(stats: dict, invalid_emails: list, fp) -> None:
+    """Write the HTML validation report to an open file handle.
+
+    Streams each section with fp.write instead of growing one big
+    string, so memory stays O(row) regardless of report size.
 
-def generate_html_report(stats: dict, invalid_emails: list) -> str:
-    """Generate HTML report of email validation status.
-    
     Args:
         stats: Validation statistics
         invalid_emails: List of invalid email records
-        
-    Returns:
-        HTML report as string
+        fp: Writable text file handle
     """
-    html = f"""
+    now = datetime.now()
+
+    fp.write(f"""
     <!DOCTYPE html>
     <html>
     <head>
-        <title>Email Validation Report - {datetime.now().strftime('%Y-%m-%d')}</title>
+        <title>Email Validation Report - {now.strftime('%Y-%m-%d')}</title>
         <style>
             body {{
                 font-family: Arial, sans-serif;
@@ -128,8 +170,8 @@ def generate_html_report(stats: dict, invalid_emails: list) -> str:
     <body>
         <div class="container">
             <h1>📧 Email Validation Report</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            
+            <p>Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}</p>
+
             <h2>📊 Overall Statistics</h2>
             <div class="stats-grid">
                 <div class="stat-card">
@@ -157,7 +199,7 @@ def generate_html_report(stats: dict, invalid_emails: list) -> str:
                     <div class="stat-value">{stats.get('role_accounts', 0)}</div>
                 </div>
             </div>
-            
+
             <h2>❌ Invalid Emails (Top {len(invalid_emails)})</h2>
             <table>
                 <thead>
@@ -171,44 +213,38 @@ def generate_html_report(stats: dict, invalid_emails: list) -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
-    
+    """)
+
     for record in invalid_emails:
         candidate = record.get('candidates', {})
         issue = record.get('validation_error', 'Unknown')
-        
-        # Create badge for issue type
-        badge_class = 'syntax'
-        if 'disposable' in issue.lower():
-            badge_class = 'disposable'
-        elif 'dns' in issue.lower() or 'domain' in issue.lower():
-            badge_class = 'dns'
-        elif 'role' in issue.lower():
-            badge_class = 'role'
-        
+
+        badge_class = badge_for(issue.lower())
+
         last_checked = record.get('last_validated_at', '')
         if last_checked:
-            last_checked = datetime.fromisoformat(last_checked.replace('Z', '+00:00')).strftime('%Y-%m-%d')
-        
-        html += f"""
+            last_checked = _fmt_date(last_checked)
+
+        # Candidate-supplied strings must not land in the markup raw
+        fp.write(f"""
                     <tr>
-                        <td>{candidate.get('full_name', 'Unknown')}</td>
-                        <td>{record.get('email_address', '')}</td>
-                        <td>{candidate.get('source_state', 'N/A')}</td>
-                        <td>{candidate.get('office_name', 'N/A')}</td>
-                        <td><span class="badge {badge_class}">{issue}</span></td>
+                        <td>{escape(str(candidate.get('full_name', 'Unknown')))}</td>
+                        <td>{escape(str(record.get('email_address', '')))}</td>
+                        <td>{escape(str(candidate.get('source_state', 'N/A')))}</td>
+                        <td>{escape(str(candidate.get('office_name', 'N/A')))}</td>
+                        <td><span class="badge {badge_class}">{escape(str(issue))}</span></td>
                         <td>{last_checked}</td>
                     </tr>
-        """
-    
-    html += """
+        """)
+
+    fp.write("""
                 </tbody>
             </table>
-            
+
             <h2>📈 Validation Health</h2>
             <p>
-    """
-    
+    """)
+
     # Calculate health metrics
     total = stats.get('total_candidates_with_email', 0)
     valid = stats.get('valid_emails', 0)
@@ -222,93 +258,138 @@ def generate_html_report(stats: dict, invalid_emails: list) -> str:
             health = "🟠 Fair"
         else:
             health = "🔴 Needs Attention"
-        
-        html += f"""
+
+        fp.write(f"""
             <strong>Email Quality Score: {health}</strong><br>
             Valid email rate: {valid_rate:.1f}%<br>
-            """
-    
-    html += """
+            """)
+
+    fp.write("""
             </p>
-            
+
             <h2>💡 Recommendations</h2>
             <ul>
-    """
-    
+    """)
+
     # Add recommendations based on stats
     if stats.get('validation_coverage', 0) < 100:
-        html += f"<li>Complete validation for remaining {100 - stats.get('validation_coverage', 0)}% of emails</li>"
-    
+        fp.write(f"<li>Complete validation for remaining {100 - stats.get('validation_coverage', 0)}% of emails</li>")
+
     if stats.get('disposable_emails', 0) > 10:
-        html += f"<li>Review and replace {stats.get('disposable_emails', 0)} disposable email addresses</li>"
-    
+        fp.write(f"<li>Review and replace {stats.get('disposable_emails', 0)} disposable email addresses</li>")
+
     if stats.get('invalid_emails', 0) > total * 0.2:
-        html += "<li>High invalid email rate - consider manual review of data sources</li>"
-    
-    html += """
+        fp.write("<li>High invalid email rate - consider manual review of data sources</li>")
+
+    fp.write("""
             </ul>
         </div>
     </body>
     </html>
+    """)
+
+
+def generate_html_report(stats: dict, invalid_emails: list) -> str:
+    """Generate HTML report of email validation status.
+
+    Args:
+        stats: Validation statistics
+        invalid_emails: List of invalid email records
+
+    Returns:
+        HTML report as string
     """
-    
-    return html
+    buffer = io.StringIO()
+    write_html_report(stats, invalid_emails, buffer)
+    return buffer.getvalue()
 
 
 def main():
     """Generate and save email validation report."""
+    parser = argparse.ArgumentParser(description="Generate the email validation HTML report")
+    parser.add_argument('--output', default=None,
+                        help="HTML output path (default: email_validation_report.html)")
+    parser.add_argument('--compress', action=argparse.BooleanOptionalAction, default=True,
+                        help="gzip the report files (--no-compress for direct browsing)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("EMAIL VALIDATION REPORT GENERATOR")
     print("=" * 60)
-    
+
     try:
         # Initialize database
         print("\nConnecting to database...")
         db = EmailDatabase()
-        
+
         # Get statistics
         print("Gathering validation statistics...")
         stats = db.get_validation_statistics()
-        
+
         # Get invalid emails
         print("Fetching invalid email details...")
         invalid_emails = db.get_invalid_emails_report(limit=50)
-        
+
         # Generate report
         print("Generating report...")
-        
+
         # Console output
         print("\n" + "=" * 60)
         print("VALIDATION STATISTICS")
         print("=" * 60)
         for key, value in stats.items():
             print(f"{key}: {value}")
-        
+
         print(f"\nTop {len(invalid_emails)} invalid emails identified")
-        
-        # Generate HTML report
-        output_file = input("\nSave HTML report to (press Enter for report.html): ").strip()
+
+        # Generate HTML report; only prompt when interactive and no --output
+        output_file = args.output
+        if not output_file and sys.stdin.isatty():
+            output_file = input("\nSave HTML report to (press Enter for report.html): ").strip()
         if not output_file:
             output_file = "email_validation_report.html"
-        
-        html_report = generate_html_report(stats, invalid_emails)
-        
-        with open(output_file, 'w') as f:
-            f.write(html_report)
-        
-        print(f"\n✅ Report saved to {output_file}")
-        
+
+        # HTML compresses 10-20x, so gzip by default; --no-compress
+        # keeps plain files for opening straight in a browser
+        if args.compress:
+            html_path = output_file + '.gz'
+            with gzip.open(html_path, 'wt', compresslevel=6) as f:
+                write_html_report(stats, invalid_emails, f)
+        else:
+            html_path = output_file
+            with open(html_path, 'w') as f:
+                write_html_report(stats, invalid_emails, f)
+
+        print(f"\n✅ Report saved to {html_path}")
+
         # Also save JSON data
         json_file = output_file.replace('.html', '.json')
-        with open(json_file, 'w') as f:
-            json.dump({
-                'generated_at': datetime.now().isoformat(),
-                'statistics': stats,
-                'invalid_emails_sample': invalid_emails
-            }, f, indent=2, default=str)
-        
-        print(f"📊 JSON data saved to {json_file}")
-        
+        payload = {
+            'generated_at': datetime.now().isoformat(),
+            'statistics': stats,
+            'invalid_emails_sample': invalid_emails
+        }
+        if args.compress:
+            json_path = json_file + '.gz'
+            if HAVE_ORJSON:
+                with gzip.open(json_path, 'wb', compresslevel=6) as f:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2,
+                                         default=str))
+            else:
+                with gzip.open(json_path, 'wt', compresslevel=6) as f:
+                    json.dump(payload, f, indent=2, default=str)
+        else:
+            json_path = json_file
+            if HAVE_ORJSON:
+                with open(json_path, 'wb') as f:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2,
+                                         default=str))
+            else:
+                with open(json_path, 'w') as f:
+                    json.dump(payload, f, indent=2, default=str)
+
+        print(f"📊 JSON data saved to {json_path}")
+
     except Exception as e:
         print(f"\n❌ Error generating report: {e}")
         logger.error(f"Report generation failed: {e}", exc_info=True)
@@ -316,4 +397,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
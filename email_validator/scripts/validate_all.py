@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Validate all candidate emails in the database."""
 
+import argparse
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,21 +14,28 @@ logger = get_logger(__name__)
 
 def main():
     """Run validation on all emails."""
+    parser = argparse.ArgumentParser(description="Validate all candidate emails")
+    parser.add_argument('--use-hunter', action=argparse.BooleanOptionalAction, default=True,
+                        help="verify emails through the Hunter.io API (uses credits)")
+    parser.add_argument('--yes', action='store_true',
+                        help="skip the interactive confirmation prompt")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("EMAIL VALIDATION - ALL EMAILS")
     print("=" * 60)
-    
+
     try:
-        # Check if we should use Hunter.io
-        use_hunter = input("\nUse Hunter.io API for validation? (y/n): ").lower() == 'y'
-        
-        if use_hunter:
+        use_hunter = args.use_hunter
+
+        # Only prompt when a human is attached; cron/CI runs straight through
+        if use_hunter and sys.stdin.isatty() and not args.yes:
             print("\n⚠️  WARNING: This will use Hunter.io credits!")
             confirm = input("Continue? (y/n): ").lower()
             if confirm != 'y':
                 print("Cancelled.")
                 return
-        
+
         # Initialize validator
         print(f"\nInitializing validator (Hunter.io: {'enabled' if use_hunter else 'disabled'})...")
         validator = EmailValidator(use_hunter=use_hunter)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Validate only new/unvalidated emails."""
 
+import argparse
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,19 +14,25 @@ logger = get_logger(__name__)
 
 def main():
     """Run validation on new/unvalidated emails only."""
+    parser = argparse.ArgumentParser(description="Validate new/unvalidated candidate emails")
+    parser.add_argument('--use-hunter', action=argparse.BooleanOptionalAction, default=True,
+                        help="verify emails through the Hunter.io API (uses credits)")
+    parser.add_argument('--yes', action='store_true',
+                        help="skip the interactive confirmation prompt")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("EMAIL VALIDATION - NEW EMAILS ONLY")
     print("=" * 60)
-    
+
     try:
-        # Default to using Hunter.io for automated runs
-        use_hunter = True
-        
-        # Check if running interactively
-        if sys.stdin.isatty():
+        use_hunter = args.use_hunter
+
+        # Only prompt when a human is attached; cron/CI runs straight through
+        if sys.stdin.isatty() and not args.yes:
             use_hunter_input = input("\nUse Hunter.io API for validation? (y/n) [y]: ").lower()
             use_hunter = use_hunter_input != 'n'
-        
+
         # Initialize validator
         print(f"\nInitializing validator (Hunter.io: {'enabled' if use_hunter else 'disabled'})...")
         validator = EmailValidator(use_hunter=use_hunter)
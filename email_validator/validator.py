@@ -1,14 +1,68 @@
 """Main email validation orchestrator."""
 
+import io
+import sqlite3
+import threading
 import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Dict, Optional, List, Tuple
-from hunter_client import HunterClient
-from free_validators import FreeValidators
+from hunter_client import get_hunter_client
+from free_validators import FreeValidators, _mx_fingerprint, _LEGIT_DOMAINS
 from database import EmailDatabase
 from config import VALIDATION_SETTINGS, get_logger
 
 logger = get_logger(__name__)
 
+_FINGERPRINT_FILE = Path.home() / '.cache' / 'email_validator' / 'mx_fingerprints.db'
+
+
+class _FingerprintStore:
+    """Per-domain MX fingerprints from the previous revalidation cycle.
+
+    Lets revalidation skip Hunter for domains whose mail routing has
+    not changed since the last verdict. Degrades to a no-op when the
+    cache file cannot be opened.
+    """
+
+    def __init__(self):
+        try:
+            _FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(_FINGERPRINT_FILE))
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS fingerprints '
+                '(domain TEXT PRIMARY KEY, fingerprint TEXT, ts REAL)')
+            self._db.commit()
+        except Exception as e:
+            logger.warning(f"MX fingerprint cache unavailable: {e}")
+            self._db = None
+
+    def get(self, domain: str) -> Optional[str]:
+        """Return the stored fingerprint for a domain, if any."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                'SELECT fingerprint FROM fingerprints WHERE domain = ?',
+                (domain,)).fetchone()
+            return row[0] if row else None
+        except Exception:
+            return None
+
+    def set(self, domain: str, fingerprint: str) -> None:
+        """Record the current fingerprint for a domain."""
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                'INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?)',
+                (domain, fingerprint, time.time()))
+            self._db.commit()
+        except Exception as e:
+            logger.warning(f"MX fingerprint cache write failed: {e}")
+
 
 class EmailValidator:
     """Orchestrate email validation using free checks and Hunter.io."""
@@ -20,7 +74,7 @@ class EmailValidator:
             use_hunter: Whether to use Hunter.io API for validation
         """
         self.free_validator = FreeValidators()
-        self.hunter_client = HunterClient() if use_hunter else None
+        self.hunter_client = get_hunter_client() if use_hunter else None
         self.db = EmailDatabase()
         self.use_hunter = use_hunter
         
@@ -33,9 +87,19 @@ class EmailValidator:
             'invalid_count': 0,
             'error_count': 0,
             'hunter_credits_used': 0,
-            'errors': []
+            # Bounded so a pathological run can't grow memory without
+            # limit; error_count keeps the true total
+            'errors': deque(maxlen=100)
         }
-        
+        # Batches validate on a thread pool; counter updates are not
+        # atomic across bytecodes, so they take this lock
+        self._stats_lock = threading.Lock()
+        # During batch runs results buffer here and flush through the
+        # bulk upsert instead of one round trip per email
+        self._pending: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        self._buffer_saves = False
+
         logger.info(f"EmailValidator initialized (Hunter.io: {'enabled' if use_hunter else 'disabled'})")
     
     def validate_email(self, 
@@ -54,13 +118,13 @@ class EmailValidator:
         Returns:
             Dictionary with validation results
         """
-        logger.info(f"Validating email: {email} (Candidate: {candidate_name or 'Unknown'})")
-        self.stats['total_emails_checked'] += 1
-        
-        if is_revalidation:
-            self.stats['emails_revalidated'] += 1
-        else:
-            self.stats['new_emails_validated'] += 1
+        logger.debug("Validating email: %s (Candidate: %s)", email, candidate_name or 'Unknown')
+        with self._stats_lock:
+            self.stats['total_emails_checked'] += 1
+            if is_revalidation:
+                self.stats['emails_revalidated'] += 1
+            else:
+                self.stats['new_emails_validated'] += 1
         
         try:
             # Step 1: Run free validation checks
@@ -81,29 +145,37 @@ class EmailValidator:
             if not free_results['syntax_valid']:
                 validation_data['is_valid'] = False
                 validation_data['validation_error'] = 'Invalid email syntax'
-                logger.info(f"Email {email} failed syntax validation")
+                logger.debug("Email %s failed syntax validation", email)
                 
             elif free_results['has_typo']:
                 validation_data['is_valid'] = False
                 validation_data['validation_error'] = f"Likely typo (suggest: {free_results['suggested_email']})"
-                logger.info(f"Email {email} has likely typo")
+                logger.debug("Email %s has likely typo", email)
                 
             elif not free_results['dns_valid']:
                 validation_data['is_valid'] = False
                 validation_data['validation_error'] = 'Domain does not exist or has no mail server'
-                logger.info(f"Email {email} failed DNS validation")
+                logger.debug("Email %s failed DNS validation", email)
                 
             elif free_results['is_disposable']:
                 validation_data['is_valid'] = False
                 validation_data['validation_error'] = 'Disposable/temporary email address'
-                logger.info(f"Email {email} is disposable")
+                logger.debug("Email %s is disposable", email)
                 
             else:
                 # Free checks passed, now use Hunter.io if available
-                if self.use_hunter and self.hunter_client:
-                    logger.info(f"Using Hunter.io to verify {email}")
+                if (self.use_hunter and self.hunter_client
+                        and self._confident_without_hunter(email, free_results)):
+                    # Known-good domain with working MX; the paid check
+                    # would almost certainly agree, so keep the credit
+                    validation_data['is_valid'] = True
+                    validation_data['confidence_score'] = 0.85
+                    logger.debug("Email %s on known-good domain; skipping Hunter.io", email)
+                elif self.use_hunter and self.hunter_client:
+                    logger.debug("Using Hunter.io to verify %s", email)
                     hunter_result = self.hunter_client.verify_email(email)
-                    self.stats['hunter_credits_used'] += 1
+                    with self._stats_lock:
+                        self.stats['hunter_credits_used'] += 1
                     
                     if 'error' not in hunter_result:
                         data = hunter_result.get('data', {})
@@ -124,28 +196,28 @@ class EmailValidator:
                         
                         if status == 'valid' and score >= 70:
                             validation_data['is_valid'] = True
-                            logger.info(f"Email {email} validated by Hunter.io (score: {score})")
+                            logger.debug("Email %s validated by Hunter.io (score: %s)", email, score)
                         elif status in ['invalid', 'disposable']:
                             validation_data['is_valid'] = False
                             validation_data['validation_error'] = f"Hunter.io: {status}"
-                            logger.info(f"Email {email} marked invalid by Hunter.io: {status}")
+                            logger.debug("Email %s marked invalid by Hunter.io: %s", email, status)
                         elif status == 'accept_all':
                             # Accept-all domains always accept mail, hard to validate
                             validation_data['is_valid'] = True  # Cautiously mark as valid
                             validation_data['validation_error'] = 'Accept-all domain (uncertain deliverability)'
-                            logger.warning(f"Email {email} is on accept-all domain")
+                            logger.warning("Email %s is on accept-all domain", email)
                         elif status == 'webmail':
                             # Webmail addresses (gmail, yahoo) are generally valid if they passed other checks
                             validation_data['is_valid'] = score >= 50
-                            logger.info(f"Email {email} is webmail (score: {score})")
+                            logger.debug("Email %s is webmail (score: %s)", email, score)
                         else:
                             # Unknown or risky
                             validation_data['is_valid'] = False
                             validation_data['validation_error'] = f"Uncertain: {status}"
-                            logger.warning(f"Email {email} has uncertain status: {status}")
+                            logger.warning("Email %s has uncertain status: %s", email, status)
                     else:
                         # Hunter.io API error
-                        logger.error(f"Hunter.io error for {email}: {hunter_result['error']}")
+                        logger.error("Hunter.io error for %s: %s", email, hunter_result['error'])
                         # Fall back to free checks result
                         validation_data['is_valid'] = True  # Passed free checks
                         validation_data['confidence_score'] = 0.6
@@ -153,23 +225,25 @@ class EmailValidator:
                     # No Hunter.io, use free checks only
                     validation_data['is_valid'] = True  # Passed all free checks
                     validation_data['confidence_score'] = 0.7
-                    logger.info(f"Email {email} passed free validation checks")
+                    logger.debug("Email %s passed free validation checks", email)
             
             # Update statistics
-            if validation_data['is_valid']:
-                self.stats['valid_count'] += 1
-            else:
-                self.stats['invalid_count'] += 1
+            with self._stats_lock:
+                if validation_data['is_valid']:
+                    self.stats['valid_count'] += 1
+                else:
+                    self.stats['invalid_count'] += 1
             
             # Save to database
-            self.db.save_validation(validation_data)
-            
+            self._save(validation_data)
+
             return validation_data
             
         except Exception as e:
-            logger.error(f"Error validating {email}: {e}")
-            self.stats['error_count'] += 1
-            self.stats['errors'].append(f"{email}: {str(e)}")
+            logger.error("Error validating %s: %s", email, e)
+            with self._stats_lock:
+                self.stats['error_count'] += 1
+                self.stats['errors'].append(f"{email}: {str(e)}")
             
             # Save error state
             error_data = {
@@ -179,9 +253,40 @@ class EmailValidator:
                 'validation_error': str(e),
                 'validation_method': 'error'
             }
-            self.db.save_validation(error_data)
-            
+            self._save(error_data)
+
             return error_data
+
+    def _confident_without_hunter(self, email: str, free_results: Dict) -> bool:
+        """Decide whether free signals alone settle an address.
+
+        Major webmail/provider domains with working MX and no
+        disposable or role flags are overwhelmingly deliverable;
+        skipping the paid verification there saves a credit and a
+        network round trip per address.
+        """
+        if not VALIDATION_SETTINGS.get('skip_hunter_when_confident', False):
+            return False
+        domain = email.rpartition('@')[2].lower()
+        return (domain in _LEGIT_DOMAINS
+                and free_results['dns_valid']
+                and not free_results['is_disposable']
+                and not free_results['is_role_account'])
+
+    def _save(self, validation_data: Dict) -> None:
+        """Persist one result, or buffer it during a batch run."""
+        if self._buffer_saves:
+            with self._pending_lock:
+                self._pending.append(validation_data)
+            return
+        self.db.save_validation(validation_data)
+
+    def _flush_pending(self) -> None:
+        """Write any buffered results in one bulk upsert."""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        if rows:
+            self.db.save_validations_bulk(rows)
     
     def validate_batch(self, 
                       emails: List[Tuple[str, str, str]], 
@@ -195,18 +300,60 @@ class EmailValidator:
         Returns:
             Statistics dictionary
         """
+        # One validation per unique normalized address: the
+        # email_validations table is keyed by email, so a duplicate
+        # would redo the DNS and Hunter work only to overwrite the
+        # same row
+        seen = set()
+        unique = []
+        for candidate_id, email, name in emails:
+            key = email.strip().lower()
+            if key not in seen:
+                seen.add(key)
+                unique.append((candidate_id, key, name))
+        if len(unique) < len(emails):
+            logger.info(f"Skipping {len(emails) - len(unique)} duplicate "
+                        "addresses in batch")
+        emails = unique
+
         total = len(emails)
         logger.info(f"Starting batch validation of {total} emails")
-        
-        for i, (candidate_id, email, name) in enumerate(emails, 1):
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{total} emails processed")
-            
-            self.validate_email(email, candidate_id, name, is_revalidation)
-            
-            # Small delay to be nice to services
-            time.sleep(0.1)
-        
+
+        if total <= 1:
+            for candidate_id, email, name in emails:
+                self.validate_email(email, candidate_id, name, is_revalidation)
+            logger.info(f"Batch validation complete: {self.stats}")
+            return self.stats
+
+        # Validation is network-bound, so overlap the round trips on a
+        # bounded pool; Hunter pacing comes from the client's token
+        # bucket, which replaces the old fixed per-email sleep. Sorting
+        # by domain lets workers hit the per-domain DNS cache instead
+        # of racing to fill it
+        ordered = sorted(
+            emails, key=lambda item: item[1].rpartition('@')[2].lower())
+        max_workers = min(total, VALIDATION_SETTINGS.get('max_workers', 16))
+
+        done = 0
+        self._buffer_saves = True
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self.validate_email, email, candidate_id,
+                                name, is_revalidation)
+                    for candidate_id, email, name in ordered
+                ]
+                for future in as_completed(futures):
+                    future.result()
+                    done += 1
+                    if done % 10 == 0:
+                        logger.info(f"Progress: {done}/{total} emails processed")
+                    if len(self._pending) >= 500:
+                        self._flush_pending()
+        finally:
+            self._buffer_saves = False
+            self._flush_pending()
+
         logger.info(f"Batch validation complete: {self.stats}")
         return self.stats
     
@@ -221,19 +368,28 @@ class EmailValidator:
         # Create validation run
         run_id = self.db.create_validation_run('all', 'manual')
         
-        # Get all candidate emails
-        emails = self.db.get_all_candidate_emails()
-        
-        if not emails:
-            logger.warning("No candidate emails found")
-            return self.stats
-        
-        # Validate in batches
+        # Stream candidates in pages so memory stays bounded by
+        # batch_size rather than the table size
         batch_size = VALIDATION_SETTINGS['batch_size']
-        for i in range(0, len(emails), batch_size):
-            batch = emails[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} emails)")
+        batch = []
+        batch_num = 0
+
+        for item in self.db.iter_candidate_emails():
+            batch.append(item)
+            if len(batch) >= batch_size:
+                batch_num += 1
+                logger.info(f"Processing batch {batch_num} ({len(batch)} emails)")
+                self.validate_batch(batch)
+                batch = []
+
+        if batch:
+            batch_num += 1
+            logger.info(f"Processing batch {batch_num} ({len(batch)} emails)")
             self.validate_batch(batch)
+
+        if batch_num == 0:
+            logger.warning("No candidate emails found")
+            return self.stats
         
         # Update run with statistics
         if run_id:
@@ -289,20 +445,67 @@ class EmailValidator:
             return self.stats
         
         logger.info(f"Found {len(due_validations)} emails due for revalidation")
-        
-        # Convert to expected format
-        emails = [
-            (val['candidate_id'], val['email_address'], None)
-            for val in due_validations
-        ]
-        
-        # Revalidate all
-        self.validate_batch(emails, is_revalidation=True)
-        
+
+        # Compute one MX fingerprint per domain; when it matches the
+        # previous cycle's fingerprint the old verdict is re-affirmed
+        # locally instead of spending a Hunter credit
+        store = _FingerprintStore()
+        fingerprints = {}
+        needs_full = []
+        reaffirmed = []
+
+        for val in due_validations:
+            domain = val['email_address'].rpartition('@')[2].lower()
+            if domain not in fingerprints:
+                fingerprints[domain] = _mx_fingerprint(domain)
+            current = fingerprints[domain]
+
+            if (current is not None
+                    and val.get('is_valid') is not None
+                    and store.get(domain) == current):
+                reaffirmed.append(val)
+            else:
+                needs_full.append(val)
+
+        if reaffirmed:
+            logger.info(f"MX unchanged for {len(reaffirmed)} emails; "
+                        "re-affirming previous verdicts without API calls")
+            rows = []
+            for val in reaffirmed:
+                self.stats['total_emails_checked'] += 1
+                self.stats['emails_revalidated'] += 1
+                if val['is_valid']:
+                    self.stats['valid_count'] += 1
+                else:
+                    self.stats['invalid_count'] += 1
+                rows.append({
+                    'email_address': val['email_address'],
+                    'candidate_id': val['candidate_id'],
+                    'is_valid': val['is_valid'],
+                    'validation_error': val.get('validation_error'),
+                    'confidence_score': val.get('confidence_score'),
+                    'validation_method': 'mx_fingerprint'
+                })
+            self.db.save_validations_bulk(rows)
+
+        # Full revalidation only for new, changed, or previously
+        # errored addresses
+        if needs_full:
+            emails = [
+                (val['candidate_id'], val['email_address'], None)
+                for val in needs_full
+            ]
+            self.validate_batch(emails, is_revalidation=True)
+
+        # Remember current fingerprints for the next cycle
+        for domain, fingerprint in fingerprints.items():
+            if fingerprint is not None:
+                store.set(domain, fingerprint)
+
         # Update run with statistics
         if run_id:
             self.db.update_validation_run(run_id, self.stats)
-        
+
         return self.stats
     
     def get_validation_report(self) -> str:
@@ -312,8 +515,9 @@ class EmailValidator:
             Report as string
         """
         stats = self.db.get_validation_statistics()
-        
-        report = f"""
+
+        buf = io.StringIO()
+        buf.write(f"""
 Email Validation Report
 =======================
 
@@ -336,14 +540,15 @@ Current Session:
 - Invalid: {self.stats['invalid_count']}
 - Errors: {self.stats['error_count']}
 - Hunter.io credits used: {self.stats['hunter_credits_used']}
-"""
-        
+""")
+
         if self.stats['errors']:
-            report += "\nErrors encountered:\n"
-            for error in self.stats['errors'][:10]:  # Show first 10 errors
-                report += f"  - {error}\n"
-        
-        return report
+            buf.write("\nErrors encountered:\n")
+            # Show first 10 errors (islice: errors is a deque)
+            buf.writelines(f"  - {error}\n"
+                           for error in islice(self.stats['errors'], 10))
+
+        return buf.getvalue()
 
 
 def test_single_email():
@@ -0,0 +1,119 @@
+-- Server-side helpers for the email validator
+-- Moves set-difference work into Postgres instead of shipping whole
+-- tables to the Python client
+
+-- Store the lowercased email once at write time; every comparison and
+-- join then reads the column instead of re-lowercasing per query
+ALTER TABLE candidates
+    ADD COLUMN IF NOT EXISTS contact_email_lower TEXT
+    GENERATED ALWAYS AS (lower(contact_email)) STORED;
+
+-- Candidates with an email that has never been validated.
+-- One anti-join round trip replaces fetching every candidate email plus
+-- every validation row and diffing the sets client-side.
+CREATE OR REPLACE FUNCTION get_unvalidated_candidate_emails()
+RETURNS TABLE (
+    candidate_id UUID,
+    contact_email VARCHAR,
+    full_name VARCHAR
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT c.id, c.contact_email_lower::VARCHAR, c.full_name
+    FROM candidates c
+    LEFT JOIN email_validations v
+        ON v.email_address = c.contact_email_lower
+    WHERE v.id IS NULL
+      AND c.contact_email_lower IS NOT NULL;
+$$;
+
+-- Supporting index so the anti-join probes instead of scanning
+-- (idx_email_val_email already covers email_validations.email_address).
+-- The old functional index on lower(contact_email) is superseded
+DROP INDEX IF EXISTS idx_candidates_contact_email_lower;
+CREATE INDEX IF NOT EXISTS idx_candidates_email_lower
+    ON candidates (contact_email_lower);
+
+-- Maintain validation_count server-side so the client can upsert blind
+-- instead of SELECTing the current count before every save
+CREATE OR REPLACE FUNCTION bump_validation_count()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        NEW.validation_count := COALESCE(OLD.validation_count, 0) + 1;
+    ELSE
+        NEW.validation_count := COALESCE(NEW.validation_count, 1);
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_email_validations_count ON email_validations;
+CREATE TRIGGER trg_email_validations_count
+    BEFORE INSERT OR UPDATE ON email_validations
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_validation_count();
+
+-- Replace the full next_validation_due index with a partial one; rows
+-- without a due date can never match the revalidation query, so they
+-- don't belong in the index
+DROP INDEX IF EXISTS idx_email_val_due;
+CREATE INDEX IF NOT EXISTS idx_email_val_due
+    ON email_validations (next_validation_due)
+    WHERE next_validation_due IS NOT NULL;
+
+-- Record a finished validation run in one round trip for short
+-- synchronous runs, instead of insert-at-start plus update-at-end
+CREATE OR REPLACE FUNCTION record_validation_run(
+    p_run_type VARCHAR,
+    p_triggered_by VARCHAR,
+    p_stats JSONB
+)
+RETURNS UUID
+LANGUAGE sql
+VOLATILE
+AS $$
+    INSERT INTO email_validation_runs (
+        run_type, triggered_by, started_at, completed_at,
+        total_emails_checked, new_emails_validated, emails_revalidated,
+        valid_count, invalid_count, error_count,
+        hunter_credits_used, error_log
+    )
+    VALUES (
+        p_run_type, p_triggered_by, NOW(), NOW(),
+        COALESCE((p_stats->>'total_emails_checked')::INTEGER, 0),
+        COALESCE((p_stats->>'new_emails_validated')::INTEGER, 0),
+        COALESCE((p_stats->>'emails_revalidated')::INTEGER, 0),
+        COALESCE((p_stats->>'valid_count')::INTEGER, 0),
+        COALESCE((p_stats->>'invalid_count')::INTEGER, 0),
+        COALESCE((p_stats->>'error_count')::INTEGER, 0),
+        COALESCE((p_stats->>'hunter_credits_used')::INTEGER, 0),
+        p_stats->>'error_log'
+    )
+    RETURNING id;
+$$;
+
+-- Overall validation statistics in one round trip.
+-- Conditional aggregation replaces five separate count='exact' queries.
+CREATE OR REPLACE FUNCTION email_validation_stats()
+RETURNS TABLE (
+    total_candidates_with_email BIGINT,
+    valid_emails BIGINT,
+    invalid_emails BIGINT,
+    disposable_emails BIGINT,
+    role_accounts BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        (SELECT COUNT(*) FROM candidates WHERE contact_email IS NOT NULL),
+        COUNT(*) FILTER (WHERE is_valid IS TRUE),
+        COUNT(*) FILTER (WHERE is_valid IS FALSE),
+        COUNT(*) FILTER (WHERE is_disposable IS TRUE),
+        COUNT(*) FILTER (WHERE is_role_account IS TRUE)
+    FROM email_validations;
+$$;